@@ -238,19 +238,42 @@ document.addEventListener('DOMContentLoaded', () => {
     /**
      * SMART CALENDAR SYNC LOGIC
      */
+    // The whole week is fetched in one request (one batched Google call server-side)
+    // and reused for the other days' syncs for WEEK_EVENTS_TTL_MS.
+    const WEEK_EVENTS_TTL_MS = 60 * 1000;
+    let weekEventsCache = { start: null, fetchedAt: 0, promise: null };
+
+    const fetchWeekEvents = (startStr) => {
+        const fresh = Date.now() - weekEventsCache.fetchedAt < WEEK_EVENTS_TTL_MS;
+        if (weekEventsCache.start !== startStr || !fresh || !weekEventsCache.promise) {
+            const promise = Auth.fetchWithAuth(`/get_calendar_week?start=${startStr}`).then(response => {
+                if (!response.ok) throw new Error(`Status: ${response.status}`);
+                return response.json();
+            });
+            // Don't keep a failed fetch around
+            promise.catch(() => { if (weekEventsCache.promise === promise) weekEventsCache.promise = null; });
+            weekEventsCache = { start: startStr, fetchedAt: Date.now(), promise };
+        }
+        return weekEventsCache.promise;
+    };
+
     const fetchCalendarEvents = async (day) => {
         try {
             const dateStr = activeDateMap[day];
 
             console.log(`Fetching calendar events for ${day} (${dateStr})...`);
 
-            // Using the endpoint from server.py with Auth module handling token
-            const response = await Auth.fetchWithAuth(`/get_calendar_events?date=${dateStr}`);
-
-            if (!response.ok) throw new Error(`Status: ${response.status}`);
-
-            const data = await response.json();
-            const events = data.events || [];
+            let events;
+            try {
+                const week = await fetchWeekEvents(activeDateMap['monday']);
+                events = (week.days && week.days[dateStr]) || [];
+            } catch (weekError) {
+                // Fall back to the single-day endpoint
+                const response = await Auth.fetchWithAuth(`/get_calendar_events?date=${dateStr}`);
+                if (!response.ok) throw new Error(`Status: ${response.status}`);
+                const data = await response.json();
+                events = data.events || [];
+            }
 
             // Map events to chunks based on hour
             const eventsByChunk = {};
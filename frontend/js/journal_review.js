@@ -43,7 +43,7 @@ document.addEventListener('DOMContentLoaded', () => {
         });
 
         // Also fetch the events natively if we want to build a re-classification target list
-        Auth.fetchWithAuth(`/api/calendar/get_calendar_events?date=${dateStr}`).then(res => res.json()).then(data => {
+        Auth.fetchWithAuth(`/get_calendar_events?date=${dateStr}`).then(res => res.json()).then(data => {
             window.currentEvents = data.events || [];
         });
     }
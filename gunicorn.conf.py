@@ -0,0 +1,24 @@
+"""
+Gunicorn settings for the Porter API (used by the Dockerfile and `make run`).
+
+Every knob can be overridden from the environment. Worker count defaults to 1
+because each worker holds its own Mongo/Neo4j pools and in-process caches and
+Cloud Run instances are small; scale with GUNICORN_WORKERS (e.g. 2*cores+1)
+on bigger hosts. Concurrency within a worker comes from gthread threads, since
+the handlers mostly wait on the LLM, Google Calendar and the databases.
+"""
+import os
+
+bind = f"{os.environ.get('HOST', '0.0.0.0')}:{os.environ.get('PORT', '6010')}"
+workers = int(os.environ.get("GUNICORN_WORKERS", "1"))
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", "16"))
+
+# Reflections can take minutes; keep idle client connections open between requests
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", "300"))
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", "30"))
+graceful_timeout = 30
+
+# Off by default: create_app starts background threads and DB drivers, which
+# don't survive fork. Only enable if those are made fork-safe.
+preload_app = os.environ.get("GUNICORN_PRELOAD", "0") == "1"
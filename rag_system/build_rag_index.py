@@ -13,11 +13,13 @@ Usage:
 
 import argparse
 import json
+from itertools import islice
 from pathlib import Path
-import numpy as np
 from tqdm import tqdm
 
-from rag_system.rag_core.embeddings import SciBERTEmbedder
+from typing import Callable, Iterable, Iterator, Optional
+
+from rag_system.rag_core.embeddings import SciBERTEmbedder, get_embedder
 from rag_system.rag_core.vector_store import VectorStore
 
 
@@ -41,18 +43,58 @@ def load_chunks(chunk_file: Path) -> list:
     return chunks
 
 
-def build_index(chunks: list,
+def iter_chunks(chunk_file: Path) -> Iterator[dict]:
+    """
+    Iterate over the chunks in a chunk file.
+
+    JSONL files (one chunk per line) are streamed record by record; JSON array
+    files have to be parsed whole and are then yielded one chunk at a time.
+
+    Args:
+        chunk_file: Path to a .jsonl or .json chunk file
+
+    Yields:
+        Chunk dictionaries
+    """
+    if not chunk_file.exists():
+        raise FileNotFoundError(f"Chunk file not found: {chunk_file}")
+
+    if chunk_file.suffix == '.jsonl':
+        with open(chunk_file, 'r') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        yield from load_chunks(chunk_file)
+
+
+def resolve_chunk_file(chunk_file: Path) -> Path:
+    """Prefer the streamable .jsonl variant of a chunk file when one exists."""
+    jsonl_file = chunk_file.with_suffix('.jsonl')
+    return jsonl_file if jsonl_file.exists() else chunk_file
+
+
+def build_index(chunks: Iterable[dict],
                 collection_name: str = "rl_papers",
                 batch_size: int = 32,
-                persist_directory: str = "data/chroma_db"):
+                persist_directory: str = "data/chroma_db",
+                embedder: Optional[SciBERTEmbedder] = None,
+                on_batch: Optional[Callable[[int, int], None]] = None):
     """
     Build RAG index from chunks.
+
+    Chunks are pulled from the iterable one batch at a time, embedded and
+    stored. Memory stays at one batch only when the iterable itself streams:
+    iter_chunks streams JSONL input, but JSON array files (what the chunker
+    writes today) are loaded whole first.
     
     Args:
-        chunks: List of chunk dictionaries
+        chunks: Iterable of chunk dictionaries (a list or a generator such as iter_chunks)
         collection_name: Name for ChromaDB collection
         batch_size: Batch size for embedding generation
         persist_directory: Directory to persist ChromaDB
+        embedder: SciBERTEmbedder instance (uses the shared embedder if None)
+        on_batch: Optional callback called with (batches_done, chunks_indexed) after each batch
     """
     print(f"\n{'='*60}")
     print("Building RAG Index")
@@ -60,7 +102,7 @@ def build_index(chunks: list,
 
     # Initialize components
     print("\n1. Initializing embedder...")
-    embedder = SciBERTEmbedder()
+    embedder = embedder or get_embedder()
 
     print("\n2. Initializing vector store...")
     vector_store = VectorStore(
@@ -83,28 +125,26 @@ def build_index(chunks: list,
             print("   Auto-clearing existing collection (non-interactive mode)")
             vector_store.clear_collection()
 
-    # Generate embeddings in batches
-    print("\n3. Generating embeddings...")
-    texts = [chunk['text'] for chunk in chunks]
-
-    embeddings_list = []
-    for i in tqdm(range(0, len(texts), batch_size), desc="Embedding batches"):
-        batch_texts = texts[i:i + batch_size]
-        batch_embeddings = embedder.embed_batch(batch_texts, batch_size=batch_size)
-        embeddings_list.append(batch_embeddings)
-
-    # Concatenate all embeddings
-    all_embeddings = np.vstack(embeddings_list)
-    print(f"   Generated {all_embeddings.shape[0]} embeddings (dim: {all_embeddings.shape[1]})")
-
-    # Add chunks to vector store
-    print("\n4. Storing in vector database...")
-    vector_store.add_chunks(chunks, all_embeddings)
+    # Embed and store batch by batch
+    print("\n3. Generating embeddings and storing in vector database...")
+    chunk_iter = iter(chunks)
+    indexed = 0
+    batches = 0
+    with tqdm(desc="Embedding batches", unit="batch") as progress:
+        while batch := list(islice(chunk_iter, batch_size)):
+            batch_embeddings = embedder.embed_batch([chunk['text'] for chunk in batch], batch_size=batch_size)
+            vector_store.add_chunks(batch, batch_embeddings, id_offset=indexed)
+            indexed += len(batch)
+            batches += 1
+            progress.update(1)
+            if on_batch is not None:
+                on_batch(batches, indexed)
 
     # Verify
     final_size = vector_store.get_collection_size()
     print("\n✓ Index built successfully!")
     print(f"  Collection: {collection_name}")
+    print(f"  Chunks indexed: {indexed}")
     print(f"  Total chunks: {final_size}")
     print(f"  Persist directory: {persist_directory}")
 
@@ -141,29 +181,26 @@ def main():
         'science_semantic': 'data/chunks_science_semantic.json'
     }
 
-    chunk_file = Path(chunk_file_map[args.chunking_strategy])
+    chunk_file = resolve_chunk_file(Path(chunk_file_map[args.chunking_strategy]))
 
     if not chunk_file.exists():
         print(f"Error: Chunk file not found: {chunk_file}")
         print("\nAvailable chunk files:")
         data_dir = Path("data")
-        for f in data_dir.glob("chunks_*.json"):
+        for f in data_dir.glob("chunks_*.json*"):
             print(f"  - {f}")
         return
 
-    # Load chunks
-    chunks = load_chunks(chunk_file)
-
-    # Build index
+    # Build index, streaming chunks from disk
     vector_store = build_index(
-        chunks,
+        iter_chunks(chunk_file),
         collection_name=args.collection_name,
         batch_size=args.batch_size
     )
 
     # Test query
     print("\n5. Testing index with sample query...")
-    embedder = SciBERTEmbedder()
+    embedder = get_embedder()
     test_query = "What is Q-learning?"
     query_embedding = embedder.embed(test_query)
 
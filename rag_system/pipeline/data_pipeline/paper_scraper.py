@@ -8,14 +8,114 @@ This module handles:
 - Storing metadata (title, authors, arxiv ID, date)
 """
 
+import asyncio
+import atexit
 import json
-import requests
+import os
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import aiohttp
 import arxiv
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Tuple
 from pathlib import Path
-import time
 import random
 
+# orjson (C codec) is much faster for large metadata files; fall back to stdlib json without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# PDF downloads hit arxiv.org directly (not the rate-limited API), so a few can run in parallel
+PDF_DOWNLOAD_CONCURRENCY = 5
+# arxiv serves every (versioned) paper at this URL, so there's no need to dig it out of the API links
+ARXIV_PDF_URL = "https://arxiv.org/pdf/{arxiv_id}.pdf"
+PDF_CHUNK_SIZE = 1 << 20  # 1 MiB reads keep per-chunk Python overhead low for multi-MB PDFs
+
+# Retry policy for PDF downloads: transient statuses are retried with exponential backoff,
+# or after the server's Retry-After delay when it sends one
+PDF_MAX_RETRIES = 5
+PDF_RETRY_BACKOFF = 1.0
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+# Arxiv API lookups: a token bucket paces request starts per arxiv guidance (1 per 3 s) but responses may overlap
+ARXIV_MAX_CONCURRENT_REQUESTS = 3
+ARXIV_MIN_REQUEST_INTERVAL = 3.0
+# Maximum number of IDs sent in one `id_list` query
+ARXIV_ID_LIST_MAX = 100
+
+# Metadata JSON is checkpointed after this many new papers instead of after every one
+METADATA_CHECKPOINT_EVERY = 5
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header into a delay in seconds.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP-date
+
+    Returns:
+        Seconds to wait, or None if the header is missing or malformed
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class AsyncRateLimiter:
+    """Token bucket allowing `max_rate` acquisitions per `time_period` seconds; use with `async with`."""
+
+    def __init__(self, max_rate: float, time_period: float):
+        """
+        Initialize the limiter with a full bucket.
+
+        Args:
+            max_rate: Bucket capacity, i.e. acquisitions allowed per period
+            time_period: Length of the period in seconds
+        """
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = float(max_rate)
+        self._updated: Optional[float] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Each asyncio.run() gets a fresh loop, and asyncio.Lock can't cross loops
+            self._loop, self._lock = loop, asyncio.Lock()
+
+        async with self._lock:
+            while True:
+                now = loop.time()
+                if self._updated is not None:
+                    elapsed = now - self._updated
+                    self._tokens = min(self.max_rate, self._tokens + elapsed * self.max_rate / self.time_period)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self.time_period / self.max_rate)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
 
 class PaperScraper:
     """Scraper for downloading RL papers from various sources."""
@@ -31,32 +131,118 @@ class PaperScraper:
         self.papers_dir = Path(papers_dir)
         self.papers_dir.mkdir(parents=True, exist_ok=True)
         self.metadata_file = Path(metadata_file)
-        self.metadata = self._load_metadata()
+        # Sidecar with one base arxiv ID per line, so dedup doesn't need the full metadata JSON
+        self.ids_file = self.metadata_file.with_suffix('.ids')
+        self._metadata: Optional[List[Dict]] = None
+        self._known_ids = self._load_known_ids()
+        # Papers added since the last save; flushed on exit so an interrupted run keeps its progress
+        self._pending_writes = 0
+        atexit.register(self._save_metadata)
+        # Metadata records by versioned arxiv ID, built on first use
+        self._by_id: Optional[Dict[str, Dict]] = None
+        # ETag / Last-Modified captured by this run's downloads, merged into the metadata records
+        self._pdf_validators: Dict[str, Dict[str, str]] = {}
+        # Versioned IDs whose conditional GET came back 304 in this run
+        self._not_modified: Set[str] = set()
         # client instance for the arxiv API with rate limiting
         # Arxiv recommends max 1 request per 3 seconds
         self.arxiv_client = arxiv.Client(
             page_size=100,
             delay_seconds=3.0,  # 3 second delay between requests
-            num_retries=5  # Retry up to 5 times
+            num_retries=0  # _fetch_papers_with_retry does the retrying
         )
+        # Paces async id_list lookups; backoff only happens when arxiv actually answers 429/503
+        self.arxiv_limiter = AsyncRateLimiter(max_rate=1, time_period=ARXIV_MIN_REQUEST_INTERVAL)
+
+    @property
+    def metadata(self) -> List[Dict]:
+        """Paper metadata, loaded from disk on first access."""
+        if self._metadata is None:
+            self._metadata = self._load_metadata()
+        return self._metadata
 
     def _load_metadata(self) -> List[Dict]:
         """Load existing metadata if available."""
         if self.metadata_file.exists():
+            if orjson is not None:
+                return orjson.loads(self.metadata_file.read_bytes())
             with open(self.metadata_file, 'r') as f:
                 return json.load(f)
         return []
 
+    def _load_known_ids(self) -> Set[str]:
+        """
+        Load the base IDs (without version) of already downloaded papers.
+
+        Reads the small ID sidecar when it is up to date; otherwise rebuilds it
+        from the full metadata JSON once.
+        """
+        if self.ids_file.exists() and (
+                not self.metadata_file.exists()
+                or self.ids_file.stat().st_mtime >= self.metadata_file.stat().st_mtime):
+            return set(self.ids_file.read_text().split())
+
+        known_ids = {p['arxiv_id'].split('v', 1)[0] for p in self.metadata}
+        if self.metadata_file.exists():
+            self.ids_file.write_text('\n'.join(sorted(known_ids)))
+        return known_ids
+
+    def _add_metadata(self, paper_metadata: Dict):
+        """Record a newly downloaded paper."""
+        self.metadata.append(paper_metadata)
+        self._known_ids.add(paper_metadata['arxiv_id'].split('v', 1)[0])
+        if self._by_id is not None:
+            self._by_id[paper_metadata['arxiv_id']] = paper_metadata
+        self._pending_writes += 1
+        if self._pending_writes >= METADATA_CHECKPOINT_EVERY:
+            self._save_metadata()
+
+    def _record_download(self, paper: arxiv.Result, arxiv_id: str, pdf_path: Path) -> Optional[Dict]:
+        """
+        Store the metadata for a downloaded PDF.
+
+        A paper we already hold is updated in place instead of being added again;
+        one that came back 304 Not Modified is left untouched.
+
+        Returns:
+            The new or updated metadata record, or None if the PDF was unchanged
+        """
+        if arxiv_id in self._not_modified:
+            self._not_modified.discard(arxiv_id)
+            return None
+        paper_metadata = self._build_metadata(paper, arxiv_id, pdf_path)
+        stored = self._get_stored_metadata(arxiv_id)
+        if stored is None:
+            self._add_metadata(paper_metadata)
+            return paper_metadata
+        stored.update(paper_metadata)
+        self._pending_writes += 1
+        return stored
+
+    def _get_stored_metadata(self, arxiv_id: str) -> Optional[Dict]:
+        """Return the stored metadata record for a versioned arxiv ID, if any."""
+        if self._by_id is None:
+            self._by_id = {p['arxiv_id']: p for p in self.metadata}
+        return self._by_id.get(arxiv_id)
+
     def _save_metadata(self):
-        """Save metadata to JSON file."""
-        with open(self.metadata_file, 'w') as f:
-            json.dump(self.metadata, f, indent=2, default=str)
+        """Save metadata to JSON file if there are unsaved papers."""
+        if not self._pending_writes:
+            return
+        self._pending_writes = 0
+        if orjson is not None:
+            self.metadata_file.write_bytes(orjson.dumps(self.metadata, option=orjson.OPT_INDENT_2, default=str))
+        else:
+            with open(self.metadata_file, 'w') as f:
+                json.dump(self.metadata, f, indent=2, default=str)
+        self.ids_file.write_text('\n'.join(sorted(self._known_ids)))
 
     def scrape_arxiv(self,
                      query: str = "reinforcement learning",
                      max_results: int = 30,
                      sort_by: arxiv.SortCriterion = arxiv.SortCriterion.SubmittedDate,
-                     sort_order: arxiv.SortOrder = arxiv.SortOrder.Descending) -> List[Dict]:
+                     sort_order: arxiv.SortOrder = arxiv.SortOrder.Descending,
+                     refresh: bool = False) -> List[Dict]:
         """
         Scrape papers from arxiv.org using the arxiv API.
 
@@ -65,9 +251,11 @@ class PaperScraper:
             max_results: Maximum number of papers to download
             sort_by: How to sort results
             sort_order: Sort order (ascending/descending)
+            refresh: Re-request papers that are already downloaded; unchanged PDFs
+                cost a 304 thanks to the stored ETag / Last-Modified
 
         Returns:
-            List of paper metadata dictionaries
+            List of new or updated paper metadata dictionaries
         """
         print(f"Searching arxiv.org for: {query}")
         print(f"Max results: {max_results}")
@@ -89,74 +277,68 @@ class PaperScraper:
             print(f"Error querying arxiv API: {e}")
             return []
 
+        # Base IDs (without version) already downloaded, for O(1) lookups
+        existing_base_ids = set(self._known_ids)
+
+        # Collect new papers first so their PDFs can be downloaded concurrently
+        pending = []
         for paper in results:
             try:
                 # Check if already downloaded
-                               # paper.entry_id is the full URL, paper.get_short_id() is just '1312.5602v1'
+                # paper.entry_id is the full URL, paper.get_short_id() is just '1312.5602v1'
                 arxiv_id = paper.get_short_id()
-                if any(p['arxiv_id'].startswith(arxiv_id) for p in self.metadata):
+                base_id = arxiv_id.split('v', 1)[0]
+                if base_id in existing_base_ids and not refresh:
                     print(f"Skipping {arxiv_id} - already downloaded")
                     continue
-
-                # Download PDF
-                pdf_path = self._download_pdf(paper, arxiv_id)
-                if pdf_path:
-                    # Store metadata
-                    paper_metadata = {
-                        'arxiv_id': arxiv_id,
-                        'title': paper.title,
-                        'authors': [str(author) for author in paper.authors],
-                        'published': paper.published.isoformat() if paper.published else None,
-                        'summary': paper.summary,
-                        'pdf_path': str(pdf_path),
-                        'source': 'arxiv',
-                        'url': paper.entry_id
-                    }
-                    self.metadata.append(paper_metadata)
-                    downloaded.append(paper_metadata)
-                    print(f"Downloaded: {paper.title[:60]}...")
-
-                    # Be polite to arxiv servers
-                    time.sleep(1)
+                existing_base_ids.add(base_id)
+                pending.append((paper, arxiv_id))
 
             except Exception as e:
                 print(f"Error processing paper {paper.entry_id}: {e}")
                 continue
 
+        # Download PDFs
+        pdf_paths = asyncio.run(self._gather_downloads(pending))
+        for (paper, arxiv_id), pdf_path in zip(pending, pdf_paths):
+            if pdf_path:
+                # Store metadata
+                paper_metadata = self._record_download(paper, arxiv_id, pdf_path)
+                if paper_metadata is not None:
+                    downloaded.append(paper_metadata)
+                    print(f"Downloaded: {paper.title[:60]}...")
+
         # Save metadata
         self._save_metadata()
         print(f"\nDownloaded {len(downloaded)} new papers from arxiv")
         return downloaded
 
-    def _fetch_paper_with_retry(self, arxiv_id: str, max_retries: int = 5) -> Optional[arxiv.Result]:
+    async def _fetch_papers_with_retry(self, id_list: List[str], max_retries: int = 5) -> List[arxiv.Result]:
         """
-        Fetch a single paper from arxiv with retry logic and exponential backoff.
+        Fetch a batch of papers from arxiv in one `id_list` query, with retry logic.
+
+        Retries with jittered exponential backoff. arxiv.HTTPError only carries the
+        status code, not the response headers, so Retry-After is not available here.
+        Sleeps are asyncio sleeps, so other lookups and downloads keep running meanwhile.
 
         Args:
-            arxiv_id: Arxiv ID (without version)
+            id_list: Arxiv IDs (without version), at most ARXIV_ID_LIST_MAX
             max_retries: Maximum number of retry attempts
 
         Returns:
-            arxiv.Result object or None if all retries fail
+            List of arxiv.Result objects (empty if all retries fail)
         """
+        batch_label = f"{len(id_list)} papers ({id_list[0]}...)" if len(id_list) > 1 else f"paper {id_list[0]}"
+
         for attempt in range(max_retries):
             try:
-                search = arxiv.Search(id_list=[arxiv_id])
-                results = list(self.arxiv_client.results(search))
-
-                if results:
-                    return results[0]
-                else:
-                    print(f"  Paper {arxiv_id} not found in arxiv")
-                    return None
+                search = arxiv.Search(id_list=id_list, max_results=len(id_list))
+                async with self.arxiv_limiter:
+                    return await asyncio.to_thread(lambda: list(self.arxiv_client.results(search)))
 
             except arxiv.HTTPError as e:
-                # HTTPError may have status_code as attribute or in args
-                status_code = getattr(e, 'status_code', None)
-                if status_code is None and hasattr(e, 'args') and len(e.args) >= 3:
-                    status_code = e.args[2]  # status_code is typically the 3rd argument
-
-                # Extract status code from error message if needed
+                # arxiv.HTTPError exposes the status as `status`; older versions only have it in the message
+                status_code = getattr(e, 'status', None)
                 if status_code is None:
                     error_str = str(e)
                     if '429' in error_str:
@@ -164,37 +346,147 @@ class PaperScraper:
                     elif '503' in error_str:
                         status_code = 503
 
+                wait_time = (2 ** attempt) + random.uniform(0, 1)
+
                 if status_code == 429:  # Too Many Requests
-                    wait_time = (2 ** attempt) + random.uniform(0, 1)  # Exponential backoff
                     print(f"  Rate limited (429). Waiting {wait_time:.1f} seconds before retry {attempt + 1}/{max_retries}...")
-                    time.sleep(wait_time)
+                    await asyncio.sleep(wait_time)
                 elif status_code == 503:  # Service Unavailable
-                    wait_time = (2 ** attempt) + random.uniform(0, 1)
                     print(f"  Service unavailable (503). Waiting {wait_time:.1f} seconds before retry {attempt + 1}/{max_retries}...")
-                    time.sleep(wait_time)
+                    await asyncio.sleep(wait_time)
                 else:
-                    print(f"  HTTP error {status_code or 'unknown'} for paper {arxiv_id}: {e}")
+                    print(f"  HTTP error {status_code or 'unknown'} for {batch_label}: {e}")
                     if attempt < max_retries - 1:
-                        wait_time = (2 ** attempt) + random.uniform(0, 1)
-                        time.sleep(wait_time)
+                        await asyncio.sleep(wait_time)
                     else:
-                        return None
+                        return []
 
             except Exception as e:
-                print(f"  Error fetching paper {arxiv_id}: {e}")
+                print(f"  Error fetching {batch_label}: {e}")
                 if attempt < max_retries - 1:
                     wait_time = (2 ** attempt) + random.uniform(0, 1)
-                    time.sleep(wait_time)
+                    await asyncio.sleep(wait_time)
                 else:
-                    return None
+                    return []
 
-        return None
+        return []
 
-    def _download_pdf(self, paper: arxiv.Result, arxiv_id: str) -> Optional[Path]:
+    async def _feed_papers(self, ids: List[str], queue: asyncio.Queue):
+        """
+        Fetch papers from arxiv in `id_list` batches and queue each one as its batch arrives.
+
+        Request starts are paced by the arxiv token bucket, with at most
+        ARXIV_MAX_CONCURRENT_REQUESTS batches in flight at once.
+
+        Args:
+            ids: Arxiv IDs (without version)
+            queue: Queue that receives arxiv.Result objects
+        """
+        batches = [ids[i:i + ARXIV_ID_LIST_MAX] for i in range(0, len(ids), ARXIV_ID_LIST_MAX)]
+        sem = asyncio.Semaphore(ARXIV_MAX_CONCURRENT_REQUESTS)
+
+        async def fetch_batch(i: int, batch: List[str]):
+            async with sem:
+                print(f"\n[{i}/{len(batches)}] Fetching metadata for {len(batch)} papers...")
+                papers = await self._fetch_papers_with_retry(batch)
+            for paper in papers:
+                await queue.put(paper)
+
+        results = await asyncio.gather(*(fetch_batch(i, batch) for i, batch in enumerate(batches, 1)),
+                                       return_exceptions=True)
+        for batch, result in zip(batches, results):
+            if isinstance(result, BaseException):
+                print(f"  ✗ Error fetching batch starting at {batch[0]}: {result}")
+
+    async def _fetch_and_download_async(self, ids: List[str]) -> List[Tuple[arxiv.Result, str, Optional[Path]]]:
+        """
+        Fetch paper metadata and download the PDFs as one producer/consumer pipeline.
+
+        The producer queues papers as their metadata batches arrive, while
+        PDF_DOWNLOAD_CONCURRENCY workers download from the queue, so downloads
+        start before every lookup has finished.
+
+        Args:
+            ids: Arxiv IDs (without version)
+
+        Returns:
+            List of (arxiv.Result, arxiv_id, pdf_path) for every paper found;
+            pdf_path is None where the download failed
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=20)
+        results = []
+
+        async def worker(session: aiohttp.ClientSession):
+            while True:
+                paper = await queue.get()
+                try:
+                    arxiv_id = paper.get_short_id()  # e.g., 1312.5602v1
+                    pdf_path = await self._download_pdf_async(session, paper, arxiv_id)
+                    results.append((paper, arxiv_id, pdf_path))
+                finally:
+                    queue.task_done()
+
+        # One connector for the whole run keeps HTTP keep-alive connections to arxiv.org
+        connector = aiohttp.TCPConnector(limit=10, limit_per_host=PDF_DOWNLOAD_CONCURRENCY)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            workers = [asyncio.create_task(worker(session)) for _ in range(PDF_DOWNLOAD_CONCURRENCY)]
+            try:
+                await self._feed_papers(ids, queue)
+                await queue.join()
+            finally:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+
+        return results
+
+    def _build_metadata(self, paper: arxiv.Result, arxiv_id: str, pdf_path: Path) -> Dict:
+        """Build the stored metadata record for a downloaded paper."""
+        return {
+            'arxiv_id': arxiv_id,
+            'title': paper.title,
+            'authors': [str(author) for author in paper.authors],
+            'published': paper.published.isoformat() if paper.published else None,
+            'summary': paper.summary,
+            'pdf_path': str(pdf_path),
+            'source': 'arxiv',
+            'url': paper.entry_id,
+            **self._pdf_validators.pop(arxiv_id, {})
+        }
+
+    async def _gather_downloads(self, papers: List[Tuple[arxiv.Result, str]]) -> List[Optional[Path]]:
+        """
+        Download PDFs for several papers concurrently.
+
+        Args:
+            papers: List of (arxiv.Result, arxiv_id) pairs
+
+        Returns:
+            List of downloaded PDF paths (None where a download failed), in input order
+        """
+        if not papers:
+            return []
+
+        sem = asyncio.Semaphore(PDF_DOWNLOAD_CONCURRENCY)
+        # One connector for the whole batch keeps HTTP keep-alive connections to arxiv.org
+        connector = aiohttp.TCPConnector(limit=10, limit_per_host=PDF_DOWNLOAD_CONCURRENCY)
+
+        async with aiohttp.ClientSession(connector=connector) as session:
+            async def bounded_download(paper: arxiv.Result, arxiv_id: str) -> Optional[Path]:
+                async with sem:
+                    return await self._download_pdf_async(session, paper, arxiv_id)
+
+            return await asyncio.gather(*(bounded_download(paper, arxiv_id) for paper, arxiv_id in papers))
+
+    async def _download_pdf_async(self,
+                                  session: aiohttp.ClientSession,
+                                  paper: arxiv.Result,
+                                  arxiv_id: str) -> Optional[Path]:
         """
         Download PDF for a given arxiv paper.
 
         Args:
+            session: Shared aiohttp session
             paper: arxiv.Result object
             arxiv_id: Arxiv ID for the paper
 
@@ -202,89 +494,83 @@ class PaperScraper:
             Path to downloaded PDF, or None if download failed
         """
         try:
-            # Try to get PDF URL from paper object
-            pdf_url = None
-
-            # Method 1: Use _get_pdf_url() method if available (most reliable)
-            if hasattr(paper, '_get_pdf_url'):
-                try:
-                    pdf_url = paper._get_pdf_url()
-                except Exception:
-                    pass
-
-            # Method 2: Extract from links attribute (contains PDF link)
-            if not pdf_url and hasattr(paper, 'links') and paper.links:
-                for link in paper.links:
-                    # Links can be Link objects or strings
-                    link_str = str(link) if not isinstance(link, str) else link
-                    if '/pdf/' in link_str and 'arxiv.org' in link_str:
-                        pdf_url = link_str
-                        break
-                    # Also check if it's a Link object with href
-                    if hasattr(link, 'href'):
-                        if '/pdf/' in link.href:
-                            pdf_url = link.href
-                            break
-
-            # Method 3: Check pdf_url attribute (usually None but check anyway)
-            if not pdf_url and hasattr(paper, 'pdf_url'):
-                pdf_url = paper.pdf_url
-
-            # Method 4: Construct from entry_id if still no URL
-            if not pdf_url and hasattr(paper, 'entry_id') and paper.entry_id:
-                entry_id = paper.entry_id
-                # Entry ID format: http://arxiv.org/abs/1707.06347v2
-                # PDF URL format: https://arxiv.org/pdf/1707.06347v2.pdf
-                if '/abs/' in entry_id:
-                    # Replace http with https and /abs/ with /pdf/, add .pdf
-                    pdf_url = entry_id.replace('http://', 'https://').replace('/abs/', '/pdf/') + '.pdf'
-                elif 'arxiv.org' in entry_id:
-                    # Extract the ID part and construct PDF URL
-                    parts = entry_id.split('/')
-                    if len(parts) >= 2:
-                        paper_id = parts[-1]  # Get the ID part
-                        pdf_url = f"https://arxiv.org/pdf/{paper_id}.pdf"
-
-            # Method 5: Construct from short_id as last resort
-            if not pdf_url:
-                short_id = paper.get_short_id() if hasattr(paper, 'get_short_id') else arxiv_id
-                pdf_url = f"https://arxiv.org/pdf/{short_id}.pdf"
-
-            if not pdf_url:
-                print(f"  Could not determine PDF URL for {arxiv_id}")
-                return None
-
+            pdf_url = ARXIV_PDF_URL.format(arxiv_id=arxiv_id)
             print(f"  Downloading from: {pdf_url}")
-            response = requests.get(pdf_url, stream=True, timeout=30)
-            response.raise_for_status()
+            timeout = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=30)
 
             # Use the simple arxiv_id (e.g., 1312.5602v1) for the filename
             pdf_filename = f"{arxiv_id.replace('/', '_')}.pdf"
             pdf_path = self.papers_dir / pdf_filename
 
-            with open(pdf_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-
-            return pdf_path
-        except requests.exceptions.RequestException as e:
+            # Conditional GET when we already hold this PDF, so an unchanged file costs a 304
+            headers = {}
+            stored = self._get_stored_metadata(arxiv_id)
+            if stored and pdf_path.exists():
+                if stored.get('etag'):
+                    headers['If-None-Match'] = stored['etag']
+                if stored.get('last_modified'):
+                    headers['If-Modified-Since'] = stored['last_modified']
+
+            for attempt in range(PDF_MAX_RETRIES + 1):
+                async with session.get(pdf_url, timeout=timeout, headers=headers) as response:
+                    if response.status == 304:
+                        print(f"  Not modified: {arxiv_id}")
+                        self._not_modified.add(arxiv_id)
+                        return pdf_path
+
+                    if response.status in RETRY_STATUSES and attempt < PDF_MAX_RETRIES:
+                        wait_time = parse_retry_after(response.headers.get('Retry-After'))
+                        if wait_time is None:
+                            wait_time = PDF_RETRY_BACKOFF * (2 ** attempt)
+                        print(f"  HTTP {response.status} for {arxiv_id}. Waiting {wait_time:.1f} seconds before retry {attempt + 1}/{PDF_MAX_RETRIES}...")
+                        await asyncio.sleep(wait_time)
+                        continue
+
+                    response.raise_for_status()
+
+                    # Stream into a .part sibling and rename it over the PDF only once the
+                    # body is complete, so a failed refresh never truncates the copy we hold.
+                    # Disk I/O runs in worker threads so writes overlap with network reads
+                    part_path = pdf_path.with_suffix('.pdf.part')
+                    f = await asyncio.to_thread(open, part_path, 'wb')
+                    try:
+                        try:
+                            async for chunk in response.content.iter_chunked(PDF_CHUNK_SIZE):
+                                await asyncio.to_thread(f.write, chunk)
+                        finally:
+                            await asyncio.to_thread(f.close)
+                        await asyncio.to_thread(os.replace, part_path, pdf_path)
+                    except BaseException:
+                        part_path.unlink(missing_ok=True)
+                        raise
+
+                    # Validators describe the file on disk, so they're only kept once it's in place
+                    validators = {'etag': response.headers.get('ETag'),
+                                  'last_modified': response.headers.get('Last-Modified')}
+                    self._pdf_validators[arxiv_id] = {k: v for k, v in validators.items() if v}
+                    return pdf_path
+        except aiohttp.ClientError as e:
             print(f"  Error downloading PDF for {arxiv_id}: {e}")
             return None
         except Exception as e:
             print(f"  Unexpected error downloading PDF for {arxiv_id}: {e}")
             return None
 
-    def get_foundational_rl_papers(self) -> List[Dict]:
+    def get_foundational_rl_papers(self, refresh: bool = False) -> List[Dict]:
         """
         Get a curated list of foundational RL papers.
         This method uses specific arxiv IDs for well-known RL papers.
 
+        Args:
+            refresh: Re-request papers that are already downloaded; unchanged PDFs
+                cost a 304 thanks to the stored ETag / Last-Modified
+
         Returns:
-            List of paper metadata dictionaries
+            List of new or updated paper metadata dictionaries
         """
         # Curated list of foundational RL papers (arxiv IDs)
-        # Using version less IDs for simplicity
-        foundational_papers = [
+        # Using version less IDs for simplicity; dict.fromkeys drops repeats while keeping order
+        foundational_papers = list(dict.fromkeys([
             "1707.06347",  # PPO: Proximal Policy Optimization Algorithms
             "1602.01783",  # A3C: Asynchronous Methods for Deep Reinforcement Learning
             "1801.01290",  # Soft Actor-Critic
@@ -294,9 +580,8 @@ class PaperScraper:
             "1906.10667",  # AlphaStar: Grandmaster level in StarCraft II
             "1911.08265",  # Mastering Atari, Go, Chess and Shogi
             "2009.01325",  # MuZero: Mastering Go, chess, shogi and Atari
-
-        ]
-        foundational_papers_extanded = [
+        ]))
+        foundational_papers_extanded = list(dict.fromkeys([
             #"1312.5602",  # DQN: Playing Atari with Deep Reinforcement Learning
             #"1509.06461",  # DQN Nature paper
             "1707.06347",  # PPO: Proximal Policy Optimization Algorithms
@@ -322,17 +607,15 @@ class PaperScraper:
             "1906.10667",  # AlphaStar: Grandmaster level in StarCraft II
             "1911.08265",  # Mastering Atari, Go, Chess and Shogi
             "2009.01325",  # MuZero: Mastering Go, chess, shogi and Atari
-        ]
+        ]))
 
         downloaded = []
-        # Check existing metadata to avoid re-downloading
-        existing_ids = set()
-        for p in self.metadata:
-            existing_ids.add(p['arxiv_id'].split('v')[0]) # Get base ID
+        # Check existing downloads to avoid re-downloading
+        existing_ids = self._known_ids  # Base IDs
 
         ids_to_fetch = []
         for base_id in foundational_papers:
-            if base_id not in existing_ids:
+            if refresh or base_id not in existing_ids:
                 ids_to_fetch.append(base_id)
             else:
                 print(f"Skipping {base_id} - already downloaded")
@@ -342,61 +625,33 @@ class PaperScraper:
             return []
 
         print(f"Fetching {len(ids_to_fetch)} foundational papers...")
-        print("Note: Fetching papers one at a time to respect arxiv rate limits...")
-
-        # Fetch papers one at a time to avoid rate limiting
-        for i, base_id in enumerate(ids_to_fetch, 1):
-            try:
-                print(f"\n[{i}/{len(ids_to_fetch)}] Fetching paper {base_id}...")
 
-                # Fetch single paper with retry logic
-                paper = self._fetch_paper_with_retry(base_id)
-
-                if not paper:
-                    print(f"  Failed to fetch paper {base_id} after retries")
-                    continue
-
-                arxiv_id = paper.get_short_id()  # e.g., 1312.5602v1
-
-                # Download PDF
-                pdf_path = self._download_pdf(paper, arxiv_id)
-                if pdf_path:
-                    paper_metadata = {
-                        'arxiv_id': arxiv_id,
-                        'title': paper.title,
-                        'authors': [str(author) for author in paper.authors],
-                        'published': paper.published.isoformat() if paper.published else None,
-                        'summary': paper.summary,
-                        'pdf_path': str(pdf_path),
-                        'source': 'arxiv',
-                        'url': paper.entry_id
-                    }
-                    self.metadata.append(paper_metadata)
+        # Metadata batches (paced for arxiv rate limits) feed concurrent PDF downloads
+        results = asyncio.run(self._fetch_and_download_async(ids_to_fetch))
+
+        found = set()
+        unchanged = 0
+        for paper, arxiv_id, pdf_path in results:
+            found.add(arxiv_id.split('v', 1)[0])
+            if pdf_path:
+                paper_metadata = self._record_download(paper, arxiv_id, pdf_path)
+                if paper_metadata is None:
+                    unchanged += 1
+                else:
                     downloaded.append(paper_metadata)
-                    # Save metadata incrementally to preserve progress
-                    self._save_metadata()
                     print(f"  ✓ Downloaded: {paper.title[:60]}...")
-                else:
-                    print(f"  ✗ Failed to download PDF for {arxiv_id}")
-
-                # Be polite to arxiv servers - wait between papers
-                if i < len(ids_to_fetch):  # Don't wait after last paper
-                    wait_time = 3.0 + random.uniform(0, 2)  # 3-5 seconds
-                    print(f"  Waiting {wait_time:.1f} seconds before next request...")
-                    time.sleep(wait_time)
-
-            except Exception as e:
-                print(f"  ✗ Error processing paper {base_id}: {e}")
-                # Wait even on error to avoid hammering the server
-                if i < len(ids_to_fetch):
-                    time.sleep(3.0)
-                continue
+            else:
+                print(f"  ✗ Failed to download PDF for {arxiv_id}")
+        for base_id in ids_to_fetch:
+            if base_id not in found:
+                print(f"  Failed to fetch paper {base_id}")
 
-        # Final save (already saved incrementally, but ensure it's saved)
         self._save_metadata()
         print(f"\n✓ Successfully downloaded {len(downloaded)} foundational RL papers")
-        if len(downloaded) < len(ids_to_fetch):
-            print(f"  Note: {len(ids_to_fetch) - len(downloaded)} papers could not be downloaded")
+        if unchanged:
+            print(f"  {unchanged} papers were unchanged since the last download")
+        if len(downloaded) + unchanged < len(ids_to_fetch):
+            print(f"  Note: {len(ids_to_fetch) - len(downloaded) - unchanged} papers could not be downloaded")
         return downloaded
 
 
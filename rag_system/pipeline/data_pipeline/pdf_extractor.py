@@ -9,10 +9,39 @@ This module handles:
 """
 
 import fitz  # PyMuPDF
+import mmap
+import numpy as np
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import re
 
+# Default cap on extraction processes; PyMuPDF parsing stops scaling well beyond a handful of workers
+MAX_EXTRACT_WORKERS = 8
+
+# Regexes are compiled once at import instead of on every PDF
+_ABSTRACT_PATTERNS = [
+    re.compile(r'(?i)abstract\s*\n\s*(.+?)(?=\n\s*(?:1\.|introduction|keywords|index terms))', re.DOTALL),
+    re.compile(r'(?i)abstract\s*\n\s*(.+?)(?=\n\s*\n)', re.DOTALL),
+]
+# Section headers, numbered or unnumbered, e.g. "1. Introduction", "2. Related Work", "Introduction"
+_SECTION_PATTERN = re.compile(r'(?m)^(?:\d+\.?\s*)?([A-Z][A-Za-z\s]+?)(?:\n|$)')
+_WS_PATTERN = re.compile(r'\s+')
+# Only the first part of a paper is scanned for section headers
+SECTION_SCAN_LIMIT = 200_000
+# The title is looked for in the first lines of this much text
+TITLE_SCAN_CHARS = 2048
+# Sections with less content than this are treated as false-positive headers
+MIN_SECTION_LENGTH = 100
+
+# Plain-text extraction without image blocks; ligatures are expanded and whitespace
+# normalized, which the regex extractors and chunker handle fine
+_TEXT_FLAGS = (fitz.TEXTFLAGS_TEXT
+               & ~fitz.TEXT_PRESERVE_IMAGES
+               & ~fitz.TEXT_PRESERVE_LIGATURES
+               & ~fitz.TEXT_PRESERVE_WHITESPACE)
+
 
 class PDFExtractor:
     """Extractor for PDF text and metadata."""
@@ -26,6 +55,39 @@ class PDFExtractor:
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Extracted text is written in the background so the next PDF can start parsing
+        self._write_pool: Optional[ThreadPoolExecutor] = None
+        # (PDF path, write future) for text files not yet confirmed on disk
+        self._pending_writes: List[Tuple[str, Future]] = []
+
+    def flush_writes(self) -> Dict[str, str]:
+        """
+        Wait for pending text file writes to finish.
+
+        Returns:
+            Error message for each PDF (keyed by its path) whose .txt could not be written
+        """
+        failures = {}
+        for pdf_path, future in self._pending_writes:
+            try:
+                future.result()
+            except Exception as e:
+                failures[pdf_path] = f"Failed to write extracted text: {e}"
+        self._pending_writes = []
+        return failures
+
+    def close(self) -> Dict[str, str]:
+        """
+        Wait for pending text file writes to finish and stop the write pool.
+
+        Returns:
+            Error message for each PDF (keyed by its path) whose .txt could not be written
+        """
+        failures = self.flush_writes()
+        if self._write_pool is not None:
+            self._write_pool.shutdown(wait=True)
+            self._write_pool = None
+        return failures
 
     def extract_text(self, pdf_path: str) -> Dict[str, any]:
         """
@@ -46,25 +108,26 @@ class PDFExtractor:
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
 
-        doc = fitz.open(pdf_path)
-
-        # Extract metadata
-        metadata = doc.metadata
+        doc, mapped = self._open_pdf(pdf_path)
+        try:
+            # Extract metadata
+            metadata = doc.metadata
 
-        # Get number of pages before closing
-        num_pages = len(doc)
+            # Get number of pages before closing
+            num_pages = len(doc)
 
-        # Extract full text
-        full_text = ""
-        pages_text = []
+            # Extract full text; join once instead of growing a string page by page
+            pages_text = []
 
-        for page_num in range(num_pages):
-            page = doc[page_num]
-            page_text = page.get_text()
-            pages_text.append(page_text)
-            full_text += page_text + "\n\n"
+            for page_num in range(num_pages):
+                page = doc[page_num]
+                pages_text.append(page.get_text("text", flags=_TEXT_FLAGS, sort=False))
+        finally:
+            doc.close()
+            if mapped is not None:
+                self._release_map(mapped)
 
-        doc.close()
+        full_text = "".join(page_text + "\n\n" for page_text in pages_text)
 
         # Try to extract title (usually in first few lines or metadata)
         title = self._extract_title(full_text, metadata)
@@ -87,11 +150,54 @@ class PDFExtractor:
 
         # Save extracted text to file
         output_file = self.output_dir / f"{pdf_path.stem}.txt"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(full_text)
+        if self._write_pool is None:
+            self._write_pool = ThreadPoolExecutor(max_workers=2)
+        future = self._write_pool.submit(_write_bytes, output_file, full_text.encode('utf-8'))
+        self._pending_writes.append((str(pdf_path), future))
 
         return result
 
+    def _open_pdf(self, pdf_path: Path):
+        """
+        Open a PDF from a read-only memory map of the file.
+
+        MuPDF then reads straight from the page cache instead of through its
+        own buffered file I/O. PyMuPDF rejects a raw mmap as a stream, so the
+        map is handed over as a memoryview. Falls back to opening by path if
+        the file can't be mapped (e.g. it is empty) or the view is rejected.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            Tuple of (fitz.Document, memoryview or None); pass the view to
+            _release_map after closing the document
+        """
+        try:
+            with open(pdf_path, 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return fitz.open(pdf_path), None
+
+        view = memoryview(mapped)
+        try:
+            return fitz.open(stream=view, filetype="pdf"), view
+        except TypeError as e:
+            print(f"Memory-mapped open rejected for {pdf_path.name} ({e}); reading from path")
+            self._release_map(view)
+            return fitz.open(pdf_path), None
+
+    @staticmethod
+    def _release_map(view: memoryview):
+        """Release a view from _open_pdf and close the memory map under it."""
+        mapped = view.obj
+        try:
+            view.release()
+            mapped.close()
+        except BufferError:
+            # MuPDF still holds the buffer; the map is unmapped when it is collected
+            pass
+
     def _extract_title(self, text: str, metadata: Dict) -> Optional[str]:
         """
         Extract title from text or metadata.
@@ -104,11 +210,12 @@ class PDFExtractor:
             Title string or None
         """
         # First, try metadata
-        if metadata.get('title') and metadata['title'].strip():
-            return metadata['title'].strip()
+        title = metadata.get('title')
+        if title and (title := title.strip()):
+            return title
 
-        # Try to find title in first few lines
-        lines = text.split('\n')[:20]  # Check first 20 lines
+        # Try to find title in first few lines; only the head of the text is split
+        lines = text[:TITLE_SCAN_CHARS].split('\n')[:20]  # Check first 20 lines
         for line in lines:
             line = line.strip()
             # Title is usually short, capitalized, and not empty
@@ -130,17 +237,12 @@ class PDFExtractor:
             Abstract string or None
         """
         # Look for abstract section
-        abstract_patterns = [
-            r'(?i)abstract\s*\n\s*(.+?)(?=\n\s*(?:1\.|introduction|keywords|index terms))',
-            r'(?i)abstract\s*\n\s*(.+?)(?=\n\s*\n)',
-        ]
-
-        for pattern in abstract_patterns:
-            match = re.search(pattern, text, re.DOTALL)
+        for pattern in _ABSTRACT_PATTERNS:
+            match = pattern.search(text)
             if match:
                 abstract = match.group(1).strip()
                 # Clean up abstract
-                abstract = re.sub(r'\s+', ' ', abstract)
+                abstract = _WS_PATTERN.sub(' ', abstract)
                 if len(abstract) > 50:  # Reasonable abstract length
                     return abstract
 
@@ -158,59 +260,135 @@ class PDFExtractor:
         """
         sections = []
 
-        # Pattern to match section headers (numbered or unnumbered)
-        # Examples: "1. Introduction", "2. Related Work", "Introduction", etc.
-        section_pattern = r'(?m)^(?:\d+\.?\s*)?([A-Z][A-Za-z\s]+?)(?:\n|$)'
-
-        matches = list(re.finditer(section_pattern, text))
+        # Headers of interest sit near the start; bound the scan instead of matching the whole paper
+        search_text = text[:SECTION_SCAN_LIMIT]
+        matches = list(_SECTION_PATTERN.finditer(search_text))
+        if not matches:
+            return sections
 
-        for i, match in enumerate(matches):
-            header = match.group(1).strip()
-            start_pos = match.end()
+        # Each section runs from the end of its header to the start of the next one
+        starts = np.fromiter((match.end() for match in matches), dtype=np.int64, count=len(matches))
+        ends = np.empty_like(starts)
+        ends[:-1] = [match.start() for match in matches[1:]]
+        ends[-1] = len(search_text)
 
-            # Find end position (start of next section or end of text)
-            if i + 1 < len(matches):
-                end_pos = matches[i + 1].start()
-            else:
-                end_pos = len(text)
+        # Stripping can only shorten a span, so spans already too short are dropped
+        # in one vectorized pass before any string is sliced
+        candidates = np.flatnonzero(ends - starts > MIN_SECTION_LENGTH)
 
-            content = text[start_pos:end_pos].strip()
+        for i, start, end in zip(candidates.tolist(), starts[candidates].tolist(), ends[candidates].tolist()):
+            content = search_text[start:end].strip()
 
             # Skip very short sections (likely false positives)
-            if len(content) > 100:
+            if len(content) > MIN_SECTION_LENGTH:
                 sections.append({
-                    'header': header,
+                    'header': matches[i].group(1).strip(),
                     'content': content
                 })
 
         return sections
 
-    def extract_batch(self, pdf_paths: List[str]) -> List[Dict]:
+    def extract_batch(self, pdf_paths: List[str], num_workers: Optional[int] = None) -> List[Dict]:
         """
-        Extract text from multiple PDFs.
+        Extract text from multiple PDFs in parallel worker processes.
         
         Args:
             pdf_paths: List of paths to PDF files
+            num_workers: Number of worker processes (default: CPU count, capped at MAX_EXTRACT_WORKERS)
             
         Returns:
-            List of extraction result dictionaries
+            List of extraction result dictionaries, in input order
         """
-        results = []
-        for pdf_path in pdf_paths:
+        if not pdf_paths:
+            return []
+
+        if num_workers is None:
+            num_workers = min(os.cpu_count() or 1, MAX_EXTRACT_WORKERS)
+        num_workers = max(1, min(num_workers, len(pdf_paths)))
+
+        if num_workers == 1:
             try:
-                result = self.extract_text(pdf_path)
-                result['pdf_path'] = pdf_path
-                results.append(result)
-                print(f"Extracted: {Path(pdf_path).name}")
-            except Exception as e:
-                print(f"Error extracting {pdf_path}: {e}")
-                results.append({
-                    'pdf_path': pdf_path,
-                    'error': str(e)
-                })
+                results = [self._extract_or_error(pdf_path) for pdf_path in pdf_paths]
+            finally:
+                write_failures = self.close()
+            _merge_write_failures(results, write_failures)
+        else:
+            # Each worker confirms its PDF's text file is written before returning the result
+            with ProcessPoolExecutor(max_workers=num_workers, initializer=_init_worker,
+                                     initargs=(str(self.output_dir),)) as executor:
+                results = list(executor.map(_extract_one, pdf_paths, chunksize=1))
+
+        for result in results:
+            if 'error' in result:
+                print(f"Error extracting {result['pdf_path']}: {result['error']}")
+            else:
+                print(f"Extracted: {Path(result['pdf_path']).name}")
 
         return results
 
+    def _extract_or_error(self, pdf_path: str) -> Dict:
+        """
+        Extract a single PDF for a batch, reporting failures in the result.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            Extraction result with 'pdf_path' added, or {'pdf_path', 'error'} on failure
+        """
+        try:
+            result = self.extract_text(pdf_path)
+            result['pdf_path'] = pdf_path
+            return result
+        except Exception as e:
+            return {
+                'pdf_path': pdf_path,
+                'error': str(e)
+            }
+
+
+# Per-process extractor for extract_batch workers, set up by _init_worker
+_worker_extractor: Optional[PDFExtractor] = None
+
+
+def _write_bytes(path: Path, data: bytes):
+    """
+    Write extracted text to disk atomically (runs on the write pool).
+
+    The data goes to a temporary sibling first and is renamed into place, so
+    an interrupted run never leaves a truncated .txt for the chunker to pick up.
+    """
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _merge_write_failures(results: List[Dict], failures: Dict[str, str]):
+    """Report text files that failed to write in the 'error' field of their results."""
+    if not failures:
+        return
+    for result in results:
+        error = failures.get(str(Path(result['pdf_path'])))
+        if error and 'error' not in result:
+            result['error'] = error
+
+
+def _init_worker(output_dir: str):
+    """Create the extractor reused by every PDF handled in this worker process."""
+    global _worker_extractor
+    _worker_extractor = PDFExtractor(output_dir)
+
+
+def _extract_one(pdf_path: str) -> Dict:
+    """Extract a single PDF in a worker process; module-level so it can be pickled."""
+    result = _worker_extractor._extract_or_error(pdf_path)
+    _merge_write_failures([result], _worker_extractor.flush_writes())
+    return result
+
 
 def main():
     """Main function for testing extraction."""
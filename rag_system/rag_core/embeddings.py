@@ -7,6 +7,8 @@ This module handles:
 - Batch processing for efficiency
 """
 
+from functools import lru_cache
+
 import torch
 from transformers import AutoTokenizer, AutoModel
 from typing import List, Dict, Optional
@@ -83,8 +85,8 @@ class SciBERTEmbedder:
             # Move to device
             encoded = {k: v.to(self.device) for k, v in encoded.items()}
 
-            # Generate embeddings
-            with torch.no_grad():
+            # Generate embeddings (inference_mode skips autograd bookkeeping entirely)
+            with torch.inference_mode():
                 outputs = self.model(**encoded)
                 # Use mean pooling of last hidden state
                 embeddings = outputs.last_hidden_state.mean(dim=1)
@@ -127,6 +129,26 @@ class SciBERTEmbedder:
         return self.model.config.hidden_size
 
 
+@lru_cache(maxsize=4)
+def get_embedder(model_name: str = "allenai/scibert_scivocab_uncased", device: Optional[str] = None) -> SciBERTEmbedder:
+    """
+    Get the process-wide SciBERTEmbedder for a model/device pair.
+
+    Loading SciBERT costs ~440MB of weights, so the query engine and index
+    builder share a single instance instead of each constructing their own.
+    Under multi-worker uvicorn every worker still holds its own copy; prefer
+    `--workers 1` with threads when memory is tight.
+
+    Args:
+        model_name: HuggingFace model name for SciBERT
+        device: Device to run model on ('cuda', 'cpu', or None for auto)
+
+    Returns:
+        Shared SciBERTEmbedder instance
+    """
+    return SciBERTEmbedder(model_name, device)
+
+
 def main():
     """Main function for testing embeddings."""
     import json
@@ -142,7 +164,7 @@ def main():
 
     print(f"Generating embeddings for {len(chunks)} chunks...")
 
-    embedder = SciBERTEmbedder()
+    embedder = get_embedder()
 
     # Generate embeddings
     chunks_with_embeddings = embedder.embed_chunks(chunks[:10])  # Test on first 10
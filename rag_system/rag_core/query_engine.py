@@ -9,14 +9,62 @@ This module handles:
 """
 
 import os
+from functools import lru_cache
 from typing import Dict, List, Optional
+import httpx
 from langchain_groq import ChatGroq
 from dotenv import load_dotenv
-from rag_system.rag_core.embeddings import SciBERTEmbedder
+from rag_system.rag_core.embeddings import SciBERTEmbedder, get_embedder
 from rag_system.rag_core.vector_store import VectorStore
 
 load_dotenv()
 
+# Resolved once at import; the FastAPI service validates it at startup
+GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+
+# HTTP/2 needs the optional `h2` package; fall back to HTTP/1.1 keep-alive without it
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# One connection pool for every Groq call in the process, so TLS handshakes to
+# api.groq.com are paid once rather than per engine
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+_HTTP_CLIENT = httpx.Client(http2=_HTTP2_AVAILABLE, timeout=30.0, limits=_HTTP_LIMITS)
+_HTTP_ASYNC_CLIENT = httpx.AsyncClient(http2=_HTTP2_AVAILABLE, timeout=30.0, limits=_HTTP_LIMITS)
+
+
+@lru_cache(maxsize=4)
+def get_llm(llm_model: str) -> ChatGroq:
+    """
+    Get the shared ChatGroq client for a model.
+
+    Engines built for the same model (e.g. after an index rebuild) reuse one
+    client, and every client shares the module-level keep-alive HTTP pools.
+
+    Args:
+        llm_model: Groq model name to use for generation
+
+    Returns:
+        Shared ChatGroq instance
+    """
+    return ChatGroq(
+        api_key=GROQ_API_KEY,
+        model=llm_model,
+        temperature=0.1,  # Lower temperature for more factual answers
+        http_client=_HTTP_CLIENT,
+        http_async_client=_HTTP_ASYNC_CLIENT
+    )
+
+
+async def close_http_clients():
+    """Close the shared Groq HTTP pools (call once on service shutdown)."""
+    get_llm.cache_clear()
+    _HTTP_CLIENT.close()
+    await _HTTP_ASYNC_CLIENT.aclose()
+
 
 class RAGQueryEngine:
     """Query engine for RAG-based question answering."""
@@ -30,42 +78,53 @@ class RAGQueryEngine:
         
         Args:
             vector_store: VectorStore instance (creates new if None)
-            embedder: SciBERTEmbedder instance (creates new if None)
+            embedder: SciBERTEmbedder instance (uses the shared embedder if None)
             llm_model: Groq model name to use for generation
         """
         self.vector_store = vector_store or VectorStore()
-        self.embedder = embedder or SciBERTEmbedder()
-        self.llm = ChatGroq(
-            api_key=os.getenv("GROQ_API_KEY"),
-            model=llm_model,
-            temperature=0.1  # Lower temperature for more factual answers
-        )
-
-    def answer_question(self, query: str, top_k: int = 5) -> Dict:
+        self.embedder = embedder or get_embedder()
+        self.llm = get_llm(llm_model)
+
+    def retrieve(self, query: str, top_k: int = 5) -> List[Dict]:
+        """
+        Retrieve the chunks most relevant to a query.
+
+        Args:
+            query: Question to retrieve context for
+            top_k: Number of relevant chunks to retrieve
+
+        Returns:
+            List of retrieved chunk dictionaries
+        """
+        query_embedding = self.embedder.embed(query)
+        return self.vector_store.search(query_embedding, top_k=top_k)
+
+    def answer_question(self, query: str, top_k: int = 5, retrieved_chunks: Optional[List[Dict]] = None) -> Dict:
         """
         Answer a question using RAG.
         
         Args:
             query: Question to answer
             top_k: Number of relevant chunks to retrieve
+            retrieved_chunks: Chunks already retrieved for this query (retrieves them if None)
             
         Returns:
             Dictionary with:
                 - answer: Generated answer
                 - sources: List of source citations
                 - retrieved_chunks: Retrieved context chunks
+                - n_chunks: Number of retrieved chunks
         """
-        # Generate query embedding
-        query_embedding = self.embedder.embed(query)
-
         # Retrieve relevant chunks
-        retrieved_chunks = self.vector_store.search(query_embedding, top_k=top_k)
+        if retrieved_chunks is None:
+            retrieved_chunks = self.retrieve(query, top_k=top_k)
 
         if not retrieved_chunks:
             return {
                 'answer': "I couldn't find any relevant information in the paper database to answer this question.",
                 'sources': [],
-                'retrieved_chunks': []
+                'retrieved_chunks': [],
+                'n_chunks': 0
             }
 
         # Build context from retrieved chunks
@@ -84,7 +143,8 @@ class RAGQueryEngine:
         return {
             'answer': answer,
             'sources': sources,
-            'retrieved_chunks': retrieved_chunks
+            'retrieved_chunks': retrieved_chunks,
+            'n_chunks': len(retrieved_chunks)
         }
 
     def _build_context(self, chunks: List[Dict]) -> str:
@@ -44,20 +44,21 @@ class VectorStore:
             metadata={"hnsw:space": "cosine"}  # Use cosine similarity
         )
 
-    def add_chunks(self, chunks: List[Dict], embeddings: Optional[np.ndarray] = None):
+    def add_chunks(self, chunks: List[Dict], embeddings: Optional[np.ndarray] = None, id_offset: int = 0):
         """
         Add chunks to the vector store.
         
         Args:
             chunks: List of chunk dictionaries with 'text' and optionally 'embedding'
             embeddings: Optional pre-computed embeddings (if None, chunks must have 'embedding' key)
+            id_offset: Index of the first chunk, so batches added in turn get distinct IDs
         """
         if not chunks:
             return
 
         # Extract data
         texts = [chunk['text'] for chunk in chunks]
-        ids = [f"chunk_{i}" for i in range(len(chunks))]
+        ids = [f"chunk_{i}" for i in range(id_offset, id_offset + len(chunks))]
 
         # Get embeddings
         if embeddings is not None:
@@ -176,7 +177,7 @@ class VectorStore:
 def main():
     """Main function for testing vector store."""
     import json
-    from rag_system.rag_core.embeddings import SciBERTEmbedder
+    from rag_system.rag_core.embeddings import get_embedder
 
     # Load chunks with embeddings
     chunks_file = Path("data/chunks_with_embeddings.json")
@@ -194,7 +195,7 @@ def main():
             chunks = json.load(f)
 
         # Generate embeddings
-        embedder = SciBERTEmbedder()
+        embedder = get_embedder()
         chunks = embedder.embed_chunks(chunks[:50])  # Test on first 50
 
         # Save
@@ -219,7 +220,7 @@ def main():
 
     # Test search
     print("\nTesting search...")
-    embedder = SciBERTEmbedder()
+    embedder = get_embedder()
     query = "What is Q-learning?"
     query_embedding = embedder.embed(query)
 
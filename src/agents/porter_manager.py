@@ -13,7 +13,7 @@ from src.database.mongo_storage import SovereignMongoStorage
 from src.utils.token_circuit_breaker import TokenLimitExceededError
 from src.database.mongo_client.agent_health import AgentHeartbeatManager
 from src.agents.context_loader import get_context
-from src.agents.finops_agent import with_finops_trace
+from src.agents.finops_agent import FinOpsTracer, with_finops_trace
 from src.utils.retry_utils import with_llm_retry
 
 # Load env centrally — load_env_vars() handles dotenv internally
@@ -67,6 +67,48 @@ def _create_adk_runner(
     )
     return InMemoryRunner(agent=agent, app_name="porter")
 
+# ADK Token Circuit Breaker cap per agent run
+ADK_TOKEN_LIMIT = 25000
+
+def _final_agent_text(runner: InMemoryRunner, session_id: str, user_msg, label: str) -> str:
+    """
+    Drains an ADK run, enforcing the token circuit breaker, and returns the
+    agent's last text part.
+
+    Args:
+        runner (InMemoryRunner): The runner created by _create_adk_runner.
+        session_id (str): The ADK session to run in.
+        user_msg: The genai Content message to send.
+        label (str): Agent label used in circuit-breaker logs.
+
+    Returns:
+        str: The final text authored by the runner's agent ("" if none).
+    """
+    final_text = ""
+    total_tokens = 0
+    agent_name = runner.agent.name
+
+    for response in runner.run(user_id="porter_user", session_id=session_id, new_message=user_msg):
+        usage = getattr(response, 'usage_metadata', None)
+        if usage:
+            total_tokens += getattr(usage, 'total_token_count', 0) or 0
+            if total_tokens > ADK_TOKEN_LIMIT:
+                logger.error(f"[CIRCUIT BROKEN] {label} exceeded {ADK_TOKEN_LIMIT} tokens! Total used: {total_tokens}. Force halting.")
+                raise TokenLimitExceededError(f"Agent trapped in hallucination loop. Exceeded API safety cap of {ADK_TOKEN_LIMIT} tokens.")
+
+        if getattr(response, 'author', '') != agent_name:
+            continue
+        try:
+            parts = response.content.parts or ()
+        except AttributeError:
+            continue
+        for part in parts:
+            text = getattr(part, 'text', None)
+            if text:
+                final_text = text
+
+    return final_text
+
 # Node Functions
 def setup_node(state: ReflectionState) -> ReflectionState:
     """
@@ -117,24 +159,7 @@ def categorizer_node(state: ReflectionState) -> ReflectionState:
         session = await runner.session_service.create_session(app_name="porter", user_id="porter_user")
         user_msg = types.Content(role="user", parts=[types.Part(text=query)])
 
-        final_text = ""
-        total_tokens = 0
-        from src.utils.token_circuit_breaker import TokenLimitExceededError
-
-        for response in runner.run(user_id="porter_user", session_id=session.id, new_message=user_msg):
-            # ADK Token Circuit Breaker Logic
-            if hasattr(response, 'usage_metadata') and response.usage_metadata:
-                total_tokens += getattr(response.usage_metadata, 'total_token_count', 0)
-                if total_tokens > 25000:
-                    logger.error(f"[CIRCUIT BROKEN] Categorizer exceeded 25000 tokens! Total used: {total_tokens}. Force halting.")
-                    raise TokenLimitExceededError("Agent trapped in hallucination loop. Exceeded API safety cap of 25000 tokens.")
-
-            if hasattr(response, 'content') and response.content and response.content.parts:
-                for part in response.content.parts:
-                    if hasattr(part, 'text') and part.text:
-                        if getattr(response, 'author', '') == runner.agent.name:
-                            final_text = part.text
-        return final_text
+        return _final_agent_text(runner, session.id, user_msg, "Categorizer")
 
     result_text = asyncio.run(run_adk())
 
@@ -192,24 +217,7 @@ def curator_node(state: ReflectionState) -> ReflectionState:
         session = await runner.session_service.create_session(app_name="porter", user_id="porter_user")
         user_msg = types.Content(role="user", parts=[types.Part(text=query)])
 
-        final_text = ""
-        total_tokens = 0
-        from src.utils.token_circuit_breaker import TokenLimitExceededError
-
-        for response in runner.run(user_id="porter_user", session_id=session.id, new_message=user_msg):
-            # ADK Token Circuit Breaker Logic
-            if hasattr(response, 'usage_metadata') and response.usage_metadata:
-                total_tokens += getattr(response.usage_metadata, 'total_token_count', 0)
-                if total_tokens > 25000:
-                    logger.error(f"[CIRCUIT BROKEN] Curator exceeded 25000 tokens! Total used: {total_tokens}. Force halting.")
-                    raise TokenLimitExceededError("Agent trapped in hallucination loop. Exceeded API safety cap of 25000 tokens.")
-
-            if hasattr(response, 'content') and response.content and response.content.parts:
-                for part in response.content.parts:
-                    if hasattr(part, 'text') and part.text:
-                        if getattr(response, 'author', '') == runner.agent.name:
-                            final_text = part.text
-        return final_text
+        return _final_agent_text(runner, session.id, user_msg, "Curator")
 
     result_text = asyncio.run(run_adk())
 
@@ -275,6 +283,17 @@ builder.add_edge("save_results_node", END)
 
 graph = builder.compile()
 
+def _initial_state(journal_entry: str, log_data: dict | None, username: str) -> ReflectionState:
+    return {
+        "journal_entry": journal_entry,
+        "log_data": log_data,
+        "username": username,
+        "actuals_str": "",
+        "recon_result": "",
+        "curator_result": "",
+        "final_output": ""
+    }
+
 @with_finops_trace("run_porter_reflection")
 def run_porter_reflection(journal_entry: str, log_data: dict | None = None, username: str = "Hero") -> str:
     """
@@ -286,15 +305,7 @@ def run_porter_reflection(journal_entry: str, log_data: dict | None = None, user
 
     logger.info("--- Starting Sovereign Daily Recon ---")
     try:
-        initial_state: ReflectionState = {
-            "journal_entry": journal_entry,
-            "log_data": log_data,
-            "username": username,
-            "actuals_str": "",
-            "recon_result": "",
-            "curator_result": "",
-            "final_output": ""
-        }
+        initial_state = _initial_state(journal_entry, log_data, username)
         result = graph.invoke(initial_state)
         final_text = result["final_output"]
         health_manager.end_agent_run(run_id, status="success")
@@ -308,6 +319,60 @@ def run_porter_reflection(journal_entry: str, log_data: dict | None = None, user
         health_manager.end_agent_run(run_id, status="fail", error_msg=str(e))
         return f"ERROR: Unexpected Backend Error during Categorization: {e}"
 
+def stream_porter_reflection(journal_entry: str, log_data: dict | None = None, username: str = "Hero"):
+    """
+    Streaming variant of run_porter_reflection.
+
+    Yields ("node", node_name) as each LangGraph node finishes, then a single
+    ("done", final_text) with the same text (or ERROR string) that
+    run_porter_reflection would have returned.
+    """
+    tracer = FinOpsTracer(agent_name="stream_porter_reflection", username=username)
+    tracer.start_trace()
+    health_manager = AgentHeartbeatManager()
+    run_id = health_manager.start_agent_run("mach_3_graph", {"journal_entry": journal_entry})
+
+    logger.info("--- Starting Sovereign Daily Recon (streaming) ---")
+    final_text = ""
+    try:
+        for update in graph.stream(_initial_state(journal_entry, log_data, username), stream_mode="updates"):
+            for node_name, node_update in update.items():
+                if node_update and "final_output" in node_update:
+                    final_text = node_update["final_output"]
+                yield "node", node_name
+        health_manager.end_agent_run(run_id, status="success")
+        tracer.end_trace(status="success")
+    except TokenLimitExceededError as e:
+        logger.info(f"\n[CRITICAL RUNTIME ERROR] {e}")
+        health_manager.end_agent_run(run_id, status="fail", error_msg=str(e))
+        tracer.end_trace(status="failure", error_msg=str(e))
+        final_text = "ERROR: Socratic Categorizer experienced a logic loop and was forcefully halted by the Token Circuit Breaker to preserve API limits."
+    except Exception as e:
+        logger.error(f"\n[RUNTIME ERROR] {e}")
+        health_manager.end_agent_run(run_id, status="fail", error_msg=str(e))
+        tracer.end_trace(status="failure", error_msg=str(e))
+        final_text = f"ERROR: Unexpected Backend Error during Categorization: {e}"
+    yield "done", final_text
+
+def warm_up_reflection_pipeline() -> None:
+    """
+    Imports the modules the graph nodes load lazily (ADK agent, LiteLLM model,
+    genai types), so the first journal submission on a fresh worker doesn't pay
+    for them. No LLM call is made: a real run costs tokens and saves a reflection.
+    """
+    import time
+    started = time.perf_counter()
+    if not raw_api_key:
+        logger.warning("GROQ_API_KEY is not set; journal reflections will fail until it is configured.")
+    try:
+        from google.adk.agents.llm_agent import Agent  # noqa: F401
+        from google.adk.models.lite_llm import LiteLlm  # noqa: F401
+        from google.genai import types  # noqa: F401
+    except Exception as e:
+        logger.warning(f"Reflection pipeline warmup failed: {e}")
+        return
+    logger.info(f"Reflection pipeline warmed up in {time.perf_counter() - started:.2f}s")
+
 if __name__ == "__main__":
     # Test execution
     sample_journal = "Intention: Work deeply. Actual: Fell down a rabbit hole of tutorials and abstract thought."
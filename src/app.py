@@ -15,6 +15,8 @@ from flask_cors import CORS
 from src.utils.path_utils import load_env_vars
 load_env_vars()
 
+from src.utils.logging_config import LOG_LEVEL
+
 # --- Critical security checks ---
 PORTER_API_KEY = os.environ.get("PORTER_API_KEY")
 if not PORTER_API_KEY:
@@ -38,7 +40,7 @@ def _configure_logging():
     log_file = log_dir / "app.log"
 
     logger = logging.getLogger("APP_ROUTER")
-    logger.setLevel(logging.INFO)
+    logger.setLevel(LOG_LEVEL)
 
     if logger.hasHandlers():
         logger.handlers.clear()
@@ -55,12 +57,27 @@ def _configure_logging():
 
     return logger
 
+# create_app() may run many times per process (e.g. in tests); warm up only once
+_warmup_submitted = False
+
+def _warm_up_reflection_pipeline():
+    try:
+        from src.agents.porter_manager import warm_up_reflection_pipeline
+        warm_up_reflection_pipeline()
+    except Exception as e:
+        logging.getLogger("APP_ROUTER").error(f"Reflection pipeline warm-up failed: {e}", exc_info=True)
+
 def create_app():
     """Application factory — creates, configures, and returns the Flask app."""
+    global _warmup_submitted
     logger = _configure_logging()
 
     app = Flask(__name__)
 
+    # --- JSON (orjson when available) ---
+    from src.utils.json_provider import install_json_provider
+    install_json_provider(app)
+
     # ⚡ Bolt Optimization:
     # Removed @app.teardown_appcontext hook for close_driver().
     # Flask teardowns run at the end of every request. Closing the driver here
@@ -110,6 +127,18 @@ def create_app():
     # User routes: /api/user/*
     app.register_blueprint(user_bp, url_prefix='/api/user')
 
+    # Make sure the Neo4j lookup keys are indexed; runs in the background so
+    # an unreachable graph doesn't delay startup.
+    from src.database.neo4j_client import ensure_schema
+    from src.utils.io_pool import io_pool
+    io_pool.submit(ensure_schema)
+
+    # Load the reflection pipeline (imported lazily by the routes) in the
+    # background before the first journal request (PORTER_WARMUP=0 disables it)
+    if not _warmup_submitted and os.environ.get("PORTER_WARMUP", "1") != "0":
+        _warmup_submitted = True
+        io_pool.submit(_warm_up_reflection_pipeline)
+
     logger.info(f"Flask app created with {len(list(app.url_map.iter_rules()))} routes across 8 blueprints.")
     return app
 
@@ -121,10 +150,11 @@ if __name__ == '__main__':
     logger.info("=" * 82)
     logger.warning("Starting the Agentic Personal Porter via Flask's built-in development server.")
     logger.warning("This server is not suitable for production deployments.")
-    logger.info("For a production WSGI server, please execute: ./run_production.sh (which uses Gunicorn)")
+    logger.info("For a production WSGI server, please execute: make run (Gunicorn, see gunicorn.conf.py)")
     logger.info("=" * 82)
 
     debug_mode = os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
     logger.info(f"Server starting on port 5090 (Debug Mode: {debug_mode})...")
 
-    app.run(debug=debug_mode, host='0.0.0.0', port=5090)
+    # Threaded so a long reflection doesn't block calendar/static requests
+    app.run(debug=debug_mode, host='0.0.0.0', port=5090, threaded=True)
@@ -1,11 +1,15 @@
 from src.utils.logging_config import setup_logger
 logger = setup_logger(__name__)
-from googleapiclient.discovery import build
-from pymongo import MongoClient, UpdateOne
+from pymongo import UpdateOne
 from datetime import datetime, timedelta, timezone
 
 from src.integrations.google_calendar_authentication_helper import get_calendar_credentials
+from src.integrations.google_calendar import build_calendar_service
 from src.config import MongoConfig
+from src.database.mongo_client.connection import MongoConnectionManager
+
+# Largest page events.list allows (default is 250); a sync window rarely needs a second round trip
+GCAL_PAGE_SIZE = 2500
 
 # Ensure we can import from the src directory
 # --- SECURITY WARNING ---
@@ -21,7 +25,7 @@ class SovereignCalendarSync:
         self.scopes = ['https://www.googleapis.com/auth/calendar']
         # Prioritize ENV for security, fallback for local dev
         self.mongo_uri = MongoConfig.MONGO_URI
-        self.client = MongoClient(self.mongo_uri)
+        self.client = MongoConnectionManager.get_client()
         self.db = self.client[MongoConfig.DB_NAME]
         self.raw_collection = self.db[MongoConfig.RAW_COLLECTION]
 
@@ -36,7 +40,7 @@ class SovereignCalendarSync:
             creds = get_calendar_credentials_for_user(refresh_token, scopes=self.scopes)
         else:
             creds = get_calendar_credentials(scopes=self.scopes)
-        return build('calendar', 'v3', credentials=creds, cache_discovery=False)
+        return build_calendar_service(creds)
 
     def pull_sliding_window(self, user_email="Hero", refresh_token=None):
         """
@@ -88,6 +92,7 @@ class SovereignCalendarSync:
                     timeMax=end_rfc3339,
                     singleEvents=True,
                     orderBy='startTime',
+                    maxResults=GCAL_PAGE_SIZE,
                     pageToken=page_token
                 ).execute()
             except Exception as e:
@@ -23,8 +23,9 @@ class SovereignGraphInjector:
         self.driver = get_driver()
 
     def close(self):
-        if hasattr(self, 'driver') and self.driver:
-            self.driver.close()
+        # The driver is the process-wide pooled singleton (closed at exit), so
+        # only drop our reference; closing it here would break every later request.
+        self.driver = None
 
     def inject_calendar_to_graph(self, formatted_events, user_email=None, username="system"):
         if user_email is None:
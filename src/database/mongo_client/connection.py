@@ -1,3 +1,6 @@
+import atexit
+import threading
+
 from pymongo import MongoClient
 
 # Attempt to load from src root
@@ -7,17 +10,34 @@ from src.config import MongoConfig
 class MongoConnectionManager:
     """
     Singleton connection manager for MongoDB interactions.
+
+    MongoClient is thread-safe and owns a connection pool plus background
+    monitor threads, so the whole process shares one instead of opening a
+    new client (and pool) per request.
     """
     _client = None
+    _lock = threading.Lock()
 
     @classmethod
     def get_client(cls) -> MongoClient:
         if cls._client is None:
-            if not MongoConfig.MONGO_URI:
-                raise ValueError("MONGO_URI is not set in environment or config.")
-            cls._client = MongoClient(MongoConfig.MONGO_URI)
+            with cls._lock:
+                if cls._client is None:
+                    if not MongoConfig.MONGO_URI:
+                        raise ValueError("MONGO_URI is not set in environment or config.")
+                    cls._client = MongoClient(MongoConfig.MONGO_URI)
         return cls._client
 
     @classmethod
     def get_db(cls):
         return cls.get_client()[MongoConfig.DB_NAME]
+
+    @classmethod
+    def close(cls):
+        """Closes the shared client and its pool."""
+        with cls._lock:
+            if cls._client is not None:
+                cls._client.close()
+                cls._client = None
+
+atexit.register(MongoConnectionManager.close)
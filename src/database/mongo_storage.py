@@ -1,12 +1,14 @@
 from src.utils.logging_config import setup_logger
 logger = setup_logger(__name__)
 import os
-from pymongo import MongoClient, UpdateOne
+import threading
+from pymongo import UpdateOne
 from datetime import datetime, timezone, timedelta
 
 # Ensure we can import from the src directory when running from helper_scripts
 
 from src.config import MongoConfig
+from src.database.mongo_client.connection import MongoConnectionManager
 #from src.constants import ACTUAL_CATEGORY_MAPPING
 from src.integrations.calendar_parser import parse_single_event
 
@@ -19,8 +21,13 @@ class SovereignMongoStorage:
     This ensures the 'Raw Noise' of GCal is preserved while 'Formatted Signal'
     is prepared for the Neo4j Identity Graph.
     """
+    # Index creation is a round trip per index; do it once per process, not per instance
+    _indexes_ready = False
+    _indexes_lock = threading.Lock()
+
     def __init__(self) -> None:
-        self.client = MongoClient(MongoConfig.MONGO_URI)
+        # Shared process-wide client: instances are created per request
+        self.client = MongoConnectionManager.get_client()
         self.db = self.client[MongoConfig.DB_NAME]
         self.mongo_uri = MongoConfig.MONGO_URI
 
@@ -33,7 +40,11 @@ class SovereignMongoStorage:
         self.reflections_col = self.db['agent_reflections']
         self.system_status_col = self.db['system_status']
         self.users_col = self.db['users']
-        self._ensure_indexes()
+        if not SovereignMongoStorage._indexes_ready:
+            with SovereignMongoStorage._indexes_lock:
+                if not SovereignMongoStorage._indexes_ready:
+                    self._ensure_indexes()
+                    SovereignMongoStorage._indexes_ready = True
 
     def _ensure_indexes(self):
         """Create compound indexes to speed up multi-tenant queries."""
@@ -10,15 +10,19 @@ from .write_operations import (
     create_identity_graph,
     create_goal
 )
+from .batch_writer import submit_log
+from .schema import ensure_schema
 
 __all__ = [
     'get_driver',
     'close_driver',
+    'ensure_schema',
     'get_all_detours',
     'get_user_patterns',
     'get_goal_progress',
     'get_state_correlations',
     'log_to_neo4j',
+    'submit_log',
     'create_identity_graph',
     'create_goal'
 ]
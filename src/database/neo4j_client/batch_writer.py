@@ -0,0 +1,95 @@
+"""
+Group-commit writer for journal log entries.
+
+Concurrent save_log requests hand their entry to a single background
+flusher, which writes everything queued at that moment with one UNWIND
+query in one Neo4j transaction. Under load this turns N commits and N
+round-trips into one; when idle an entry is written as soon as it arrives,
+so no latency is added.
+"""
+import queue
+import threading
+from concurrent.futures import Future
+
+from src.utils.logging_config import setup_logger
+from .connection import get_driver
+from .write_operations import _create_log_entries, _log_confirmation, log_to_neo4j
+
+logger = setup_logger(__name__)
+
+MAX_BATCH = 200
+QUEUE_MAXSIZE = 10_000
+
+_log_queue: "queue.Queue[tuple]" = queue.Queue(maxsize=QUEUE_MAXSIZE)
+_flusher = None
+_flusher_lock = threading.Lock()
+
+
+def _write_batch(tx, items):
+    return _create_log_entries(tx, [(log_data, username, correlation_id)
+                                    for log_data, username, correlation_id, _ in items])
+
+
+def _flush(items):
+    """Writes a batch in one transaction; falls back to per-entry writes if it fails."""
+    try:
+        with get_driver().session() as session:
+            nodes = session.execute_write(_write_batch, items)
+    except Exception as e:
+        if len(items) > 1:
+            logger.warning(f"Batched Neo4j write of {len(items)} entries failed ({e}); retrying individually")
+            for item in items:
+                _flush([item])
+        else:
+            items[0][3].set_exception(e)
+        return
+
+    for item, node in zip(items, nodes):
+        item[3].set_result(_log_confirmation(node))
+
+
+def _flush_loop():
+    while True:
+        # Block for the first entry, then take whatever else is already waiting.
+        items = [_log_queue.get()]
+        while len(items) < MAX_BATCH:
+            try:
+                items.append(_log_queue.get_nowait())
+            except queue.Empty:
+                break
+        _flush(items)
+
+
+def _ensure_flusher():
+    global _flusher
+    if _flusher is None:
+        with _flusher_lock:
+            if _flusher is None:
+                _flusher = threading.Thread(target=_flush_loop, name="neo4j-log-flusher", daemon=True)
+                _flusher.start()
+
+
+def submit_log(log_data: dict, username: str, correlation_id: str = None) -> Future:
+    """
+    Queues a journal entry for the next batched Neo4j transaction.
+
+    Args:
+        log_data: The journal entry data dict.
+        username: The user's display name.
+        correlation_id: Optional cross-system lineage ID for data provenance.
+
+    Returns:
+        A Future resolving to the same confirmation string as log_to_neo4j,
+        or raising the write error.
+    """
+    future = Future()
+    _ensure_flusher()
+    try:
+        _log_queue.put_nowait((log_data, username, correlation_id, future))
+    except queue.Full:
+        logger.warning("Neo4j log queue is full; writing entry synchronously")
+        try:
+            future.set_result(log_to_neo4j(log_data, username, correlation_id=correlation_id))
+        except Exception as e:
+            future.set_exception(e)
+    return future
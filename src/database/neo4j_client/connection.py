@@ -1,3 +1,6 @@
+import atexit
+import threading
+
 from neo4j import GraphDatabase
 
 from src.config import NeoConfig
@@ -7,20 +10,27 @@ from src.config import NeoConfig
 # The driver maintains a pool of connections. Creating a new driver per request
 # defeats connection pooling and is a massive performance bottleneck.
 _driver_instance = None
+_driver_lock = threading.Lock()
 
 def get_driver():
     """Returns a singleton connection driver to the Neo4j database, utilizing connection pooling."""
     global _driver_instance
     if _driver_instance is None:
-        _driver_instance = GraphDatabase.driver(
-            NeoConfig.NEO4J_URI,
-            auth=(NeoConfig.NEO4J_USER, NeoConfig.NEO4J_PASS)
-        )
+        with _driver_lock:
+            if _driver_instance is None:
+                _driver_instance = GraphDatabase.driver(
+                    NeoConfig.NEO4J_URI,
+                    auth=(NeoConfig.NEO4J_USER, NeoConfig.NEO4J_PASS)
+                )
     return _driver_instance
 
 def close_driver():
     """Gracefully shuts down the Neo4j driver and closes all connections in the pool."""
     global _driver_instance
-    if _driver_instance:
-        _driver_instance.close()
-        _driver_instance = None
+    with _driver_lock:
+        if _driver_instance:
+            _driver_instance.close()
+            _driver_instance = None
+
+# The pool lives for the whole process; release it once on interpreter exit.
+atexit.register(close_driver)
@@ -0,0 +1,40 @@
+from src.utils.logging_config import setup_logger
+logger = setup_logger(__name__)
+from src.config import NeoConfig
+from .connection import get_driver
+
+# Every per-user query anchors on (:Hero {hero: $username}); without a backing
+# index each of those lookups is a label scan. Day/TimeChunk are MERGEd by key
+# on every journal write, so they get plain indexes.
+SCHEMA_STATEMENTS = [
+    "CREATE CONSTRAINT hero_name_unique IF NOT EXISTS FOR (h:Hero) REQUIRE h.hero IS UNIQUE",
+    "CREATE INDEX day_date IF NOT EXISTS FOR (d:Day) ON (d.date)",
+    "CREATE INDEX time_chunk_id IF NOT EXISTS FOR (tc:TimeChunk) ON (tc.id)",
+]
+
+def ensure_schema() -> bool:
+    """
+    Creates the constraints and indexes the hot-path queries rely on.
+    Idempotent (IF NOT EXISTS); failures are logged, never raised, so an
+    unreachable graph or pre-existing duplicates don't block app startup.
+
+    Returns:
+        True if every statement succeeded.
+    """
+    if not NeoConfig.NEO4J_URI:
+        logger.info("NEO4J_URI not set; skipping Neo4j schema setup.")
+        return False
+
+    ok = True
+    try:
+        with get_driver().session() as session:
+            for statement in SCHEMA_STATEMENTS:
+                try:
+                    session.run(statement).consume()
+                except Exception as e:
+                    ok = False
+                    logger.warning(f"Neo4j schema statement failed ({statement}): {e}")
+    except Exception as e:
+        logger.warning(f"Skipping Neo4j schema setup: {e}")
+        return False
+    return ok
@@ -17,72 +17,79 @@ def log_to_neo4j(log_data: dict, username: str, correlation_id: str = None) -> s
     driver = get_driver()
     with driver.session() as session:
         result_node = session.execute_write(_create_log_entry, log_data, username, correlation_id)
+        return _log_confirmation(result_node)
 
-        # another potential fix
-        # We must check if result_node is not None before trying to access it.
-        if result_node and 'activity' in result_node:
-            return f"Successfully logged entry for '{result_node['activity']}'"
-        else:
-            logger.info("!!! NEO4J WRITE FAILED: The Cypher query did not return the expected node.")
-            return "Failed to log entry to Neo4j."
+def _log_confirmation(result_node) -> str:
+    """Builds the confirmation message for a written (or missing) Actual node."""
+    # We must check if result_node is not None before trying to access it.
+    if result_node and 'activity' in result_node:
+        return f"Successfully logged entry for '{result_node['activity']}'"
+    logger.info("!!! NEO4J WRITE FAILED: The Cypher query did not return the expected node.")
+    return "Failed to log entry to Neo4j."
 
-def _create_log_entry(tx, log_data: dict, username: str, correlation_id: str = None):
-    """
-    Enhanced function that creates nodes and relationships with meaningful connections.
-    Includes source_id (correlation_id) for cross-system data lineage.
-    """
-    intention_text = log_data.get('intention', '')
-    actual_text = log_data.get('actual', '')
-    feeling = log_data.get('feeling', '')
+def _log_entry_row(log_data: dict, username: str, correlation_id: str = None) -> dict:
+    """Query parameters for one journal entry (one element of $rows)."""
     brain_fog = log_data.get('brainFog', 0)
-    matches_intent = log_data.get('matchesIntent', False)
-    is_valuable_detour = log_data.get('isValuableDetour', False)
-    inventory_note = log_data.get('inventoryNote', '')
+    return {
+        'username': username,
+        'day': log_data.get('day'),
+        'timeChunkId': log_data.get('timeChunk'),
+        'intention': log_data.get('intention', ''),
+        'actual': log_data.get('actual', ''),
+        'feeling': log_data.get('feeling', ''),
+        'brainFog': int(brain_fog) if brain_fog else 0,
+        'matchesIntent': log_data.get('matchesIntent', False),
+        'isValuableDetour': log_data.get('isValuableDetour', False),
+        'inventoryNote': log_data.get('inventoryNote', ''),
+        'reflection': log_data.get('reflection', ''),
+        # Determine time of day from timeChunk for state tracking
+        'timeOfDay': _extract_time_of_day(log_data.get('timeChunk', '')),
+        'correlation_id': correlation_id or '',
+    }
 
-    # Determine time of day from timeChunk for state tracking
-    time_chunk = log_data.get('timeChunk', '')
-    time_of_day = _extract_time_of_day(time_chunk)
+# Creates nodes and relationships for every entry in $rows with a single UNWIND
+# query, so a batch of entries costs one round-trip instead of one per entry.
+_LOG_ENTRIES_QUERY = """
+        UNWIND $rows AS row
 
-    query = (
-        """
         // Find or create Hero
-        MERGE (u:Hero {hero: $username})
+        MERGE (u:Hero {hero: row.username})
         
         // Create journal and link to hero
         MERGE (j:Journal {name: 'Daily Log'})
         MERGE (u)-[:HAS_JOURNAL]->(j)
         
         // Create day and link to journal
-        MERGE (d:Day {date: $day})
+        MERGE (d:Day {date: row.day})
         MERGE (j)-[:HAS_DAY]->(d)
         
         // Create time chunk
-        MERGE (tc:TimeChunk {id: $timeChunkId})
+        MERGE (tc:TimeChunk {id: row.timeChunkId})
         MERGE (d)-[:HAS_CHUNK]->(tc)
         
         // Create Intention node with source_id for data lineage
         CREATE (int:Intention {
-            description: $intention,
-            source_id: $correlation_id,
+            description: row.intention,
+            source_id: row.correlation_id,
             timestamp: datetime()
         })
         MERGE (tc)-[:INTENDED]->(int)
         
         // Create Actual node with source_id for data lineage
         CREATE (a:Actual {
-            activity: $actual,
-            feeling: $feeling,
-            brainFog: $brainFog,
-            matchesIntent: $matchesIntent,
-            isValuableDetour: $isValuableDetour,
-            inventoryNote: $inventoryNote,
-            source_id: $correlation_id,
+            activity: row.actual,
+            feeling: row.feeling,
+            brainFog: row.brainFog,
+            matchesIntent: row.matchesIntent,
+            isValuableDetour: row.isValuableDetour,
+            inventoryNote: row.inventoryNote,
+            source_id: row.correlation_id,
             timestamp: datetime()
         })
         MERGE (tc)-[:RECORDED]->(a)
         
         // Link Actual to Intention dynamically based on Match or Detour
-        WITH a, u, int, $matchesIntent as isMatch, $isValuableDetour as isDetour, $inventoryNote as note
+        WITH row, a, u, int, row.matchesIntent as isMatch, row.isValuableDetour as isDetour, row.inventoryNote as note
         
         // If it matches, simply create a MATCH relationship
         FOREACH (x IN CASE WHEN isMatch = true THEN [1] ELSE [] END |
@@ -109,13 +116,13 @@ def _create_log_entry(tx, log_data: dict, username: str, correlation_id: str = N
         
         // Create Reflection
         CREATE (r:Reflection {
-            text: $reflection,
+            text: row.reflection,
             timestamp: datetime()
         })
         MERGE (a)-[:HAS_REFLECTION]->(r)
         
         // Create Affected States
-        WITH a, u, int, r, $feeling as feeling, $brainFog as fog, $timeOfDay as tod
+        WITH row, a, u, int, r, row.feeling as feeling, row.brainFog as fog, row.timeOfDay as tod
         CREATE (emState:State {
             type: 'emotional',
             value: feeling,
@@ -137,43 +144,45 @@ def _create_log_entry(tx, log_data: dict, username: str, correlation_id: str = N
         
         // Try to link to existing Goal if intention matches goal pattern
         // (This is a simple pattern match - can be enhanced with AI)
-        WITH a, u, int, r, $intention as intentionText
+        WITH row, a, u, int, r, row.intention as intentionText
         OPTIONAL MATCH (g:Goal)
         WHERE (intentionText IS NOT NULL AND intentionText <> '') AND (
               toLower(g.description) CONTAINS toLower(intentionText) 
            OR toLower(intentionText) CONTAINS toLower(g.description)
         )
-        WITH a, u, int, r, g
+        WITH row, a, u, int, r, g
         FOREACH (x IN CASE WHEN g IS NOT NULL THEN [1] ELSE [] END |
             MERGE (int)-[:TARGETS]->(g)
             MERGE (a)-[:ALIGNED_WITH]->(g)
         )
         
-        RETURN a, int, r
+        RETURN row.idx AS idx, a, int, r
         """
 
-    )
+def _create_log_entries(tx, entries):
+    """
+    Enhanced function that creates nodes and relationships with meaningful connections.
+    Includes source_id (correlation_id) for cross-system data lineage.
 
-    result = tx.run(query,
-                    username=username,
-                    day=log_data.get('day'),
-                    timeChunkId=log_data.get('timeChunk'),
-                    intention=intention_text,
-                    actual=actual_text,
-                    feeling=feeling,
-                    brainFog=int(brain_fog) if brain_fog else 0,
-                    matchesIntent=matches_intent,
-                    isValuableDetour=is_valuable_detour,
-                    inventoryNote=inventory_note,
-                    reflection=log_data.get('reflection', ''),
-                    timeOfDay=time_of_day,
-                    correlation_id=correlation_id or ''
-                   )
+    Args:
+        tx: The write transaction.
+        entries: Iterable of (log_data, username, correlation_id) tuples.
 
-    record = result.single()
-    if record:
-        return record.get('a')
-    return None
+    Returns:
+        The created Actual node (or None) for each entry, in input order.
+    """
+    rows = [dict(_log_entry_row(log_data, username, correlation_id), idx=idx)
+            for idx, (log_data, username, correlation_id) in enumerate(entries)]
+    actuals = [None] * len(rows)
+    for record in tx.run(_LOG_ENTRIES_QUERY, rows=rows):
+        # Several matching Goals can repeat a row; keep the first record per entry
+        if actuals[record['idx']] is None:
+            actuals[record['idx']] = record.get('a')
+    return actuals
+
+def _create_log_entry(tx, log_data: dict, username: str, correlation_id: str = None):
+    """Single-entry form of _create_log_entries; returns the created Actual node or None."""
+    return _create_log_entries(tx, [(log_data, username, correlation_id)])[0]
 
 def create_identity_graph(username, origin_story, ambitions):
     """
@@ -2,18 +2,37 @@ from src.utils.logging_config import setup_logger
 logger = setup_logger(__name__)
 import json
 import os
+import re
 from datetime import datetime, timezone
+from typing import NamedTuple
 from dateutil import parser # pip install python-dateutil
 
-from src.constants import ACTUAL_CATEGORY_MAPPING
+from src.constants import get_category_mapping
+from src.utils.io_pool import io_pool
 from src.utils.path_utils import get_project_root
 
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib encoder
+    orjson = None
+
 # Define your storage paths
 #local storage
 DATA_DIR = os.path.join(get_project_root(), 'data', 'google_calendar')
 os.makedirs(DATA_DIR, exist_ok=True)
 
 
+def _parse_timestamp(value):
+    """
+    Parses a Google Calendar timestamp. GCal sends RFC 3339 (or YYYY-MM-DD for
+    all-day events), which the C-level datetime.fromisoformat handles directly;
+    dateutil is only the fallback for anything non-standard.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return parser.parse(value)
+
 def get_time_chunk(hour):
     if 5 <= hour < 9: return "Early Morning"
     if 9 <= hour < 12: return "Late Morning"
@@ -22,13 +41,33 @@ def get_time_chunk(hour):
     if 17 <= hour < 21: return "Evening"
     return "Night"
 
+# The colour map plus keyword rules flattened in priority order, plus one regex
+# over all keywords so titles that match nothing are rejected in a single C-level
+# scan. Rebuilt only when the loaded mapping object changes.
+_category_index = (None, {}, None, ())
+
+def _compiled_mapping():
+    """Returns (colors, combined_regex or None, ((keyword, pillar, subcategory), ...))."""
+    global _category_index
+    mapping = get_category_mapping()
+    if _category_index[0] is not mapping:
+        rules = tuple(
+            (kw.lower(), pillar, subcat)
+            for pillar, subcategories in mapping["actual_categorization_with_keywords"].items()
+            for subcat, keywords in subcategories.items()
+            for kw in keywords
+        )
+        pattern = re.compile("|".join(re.escape(kw) for kw, _, _ in rules)) if rules else None
+        _category_index = (mapping, mapping["colors"], pattern, rules)
+    return _category_index[1:]
+
 def determine_category(title, color_id):
     """
     Heuristic to guess the life pillar and subcategory.
     Returns a dict with 'pillar' and 'subcategory'.
     """
-    title_lower = title.lower()
-    color_match = ACTUAL_CATEGORY_MAPPING["colors"].get(str(color_id))
+    colors, pattern, rules = _compiled_mapping()
+    color_match = colors.get(str(color_id))
 
     # 1. Explicit Color Checking
     if color_match:
@@ -40,14 +79,15 @@ def determine_category(title, color_id):
             # Direct match to a single pillar
             return {"pillar": color_match, "subcategory": "General"}
 
-    # 2. Keyword Fallback & Tie-Breaker
-    for pillar, subcategories in ACTUAL_CATEGORY_MAPPING["actual_categorization_with_keywords"].items():
-        # If we have a shared color list, only search within those specific pillars to save time
-        if isinstance(color_match, list) and pillar not in color_match:
-            continue
-
-        for subcat, keywords in subcategories.items():
-            if any(kw.lower() in title_lower for kw in keywords):
+    # 2. Keyword Fallback & Tie-Breaker (title only lowered once we get here)
+    title_lower = title.lower()
+    if pattern is not None and pattern.search(title_lower):
+        # Some keyword matched; the first rule in mapping order decides
+        for kw, pillar, subcat in rules:
+            # If we have a shared color list, only search within those specific pillars
+            if isinstance(color_match, list) and pillar not in color_match:
+                continue
+            if kw in title_lower:
                 return {"pillar": pillar, "subcategory": subcat}
 
     return {"pillar": "Uncategorized", "subcategory": "General"}
@@ -64,8 +104,8 @@ def parse_single_event(event):
     if not start_str or not end_str:
         return None
 
-    start_dt = parser.parse(start_str)
-    end_dt = parser.parse(end_str)
+    start_dt = _parse_timestamp(start_str)
+    end_dt = _parse_timestamp(end_str)
     duration = int((end_dt - start_dt).total_seconds() / 60)
 
     title = raw_data.get('summary', 'Untitled')
@@ -77,7 +117,7 @@ def parse_single_event(event):
     updated_str = raw_data.get('updated')
     record_type = "Intention"
     if updated_str:
-        updated_dt = parser.parse(updated_str)
+        updated_dt = _parse_timestamp(updated_str)
 
         # Ensure comparison is possible by making naive datetimes aware (e.g. from 'date' field)
         if start_dt.tzinfo is None: start_dt = start_dt.replace(tzinfo=timezone.utc)
@@ -109,8 +149,8 @@ def event_record_type(event):
         if not start_str or not updated_str:
             return "Intention" # Default safely
 
-        start_dt = parser.parse(start_str)
-        updated_dt = parser.parse(updated_str)
+        start_dt = _parse_timestamp(start_str)
+        updated_dt = _parse_timestamp(updated_str)
 
         # Ensure comparison is possible by making naive datetimes aware (e.g. from 'date' field)
         if start_dt.tzinfo is None: start_dt = start_dt.replace(tzinfo=timezone.utc)
@@ -126,9 +166,53 @@ def event_record_type(event):
         logger.warning(f"Failed to parse event_record_type for event '{event.get('id')}': {e}")
         return "Unknown"
 
+class Intention(NamedTuple):
+    """One parsed calendar event, stored flat (one tuple instead of three dicts)."""
+    source_id: str
+    title: str
+    context_notes: str
+    start_iso: str
+    end_iso: str
+    duration_minutes: int
+    time_chunk: str
+    pillar: str
+    subcategory: str
+    record_type: str  # 'Actual' or 'Intention'
+    google_color_id: str
+    is_processed: bool = False
+
+    def to_dict(self) -> dict:
+        """The nested 'Golden Object' shape used for JSON output."""
+        return {
+            "source_id": self.source_id,
+            "title": self.title,
+            "context_notes": self.context_notes,
+            "timing": {
+                "start_iso": self.start_iso,
+                "end_iso": self.end_iso,
+                "duration_minutes": self.duration_minutes,
+                "time_chunk": self.time_chunk
+            },
+            "meta": {
+                "pillar": self.pillar,
+                "subcategory": self.subcategory,
+                "record_type": self.record_type,
+                "google_color_id": self.google_color_id,
+                "is_processed": self.is_processed
+            }
+        }
+
+def intentions_to_arrays(intentions) -> dict:
+    """Column view of a list of Intentions: field name -> list of values."""
+    columns = zip(*intentions) if intentions else [()] * len(Intention._fields)
+    return {field: list(values) for field, values in zip(Intention._fields, columns)}
+
 def parse_calendar_to_intentions(raw_events):
     """
     Transforms raw Google Calendar noise into clean Agentic Intentions.
+
+    Returns:
+        List of Intention tuples; use Intention.to_dict() for the nested JSON shape.
     """
     formatted_intentions = []
 
@@ -138,9 +222,9 @@ def parse_calendar_to_intentions(raw_events):
             continue
 
         # 2. Extract Timing
-        start_dt = parser.parse(event['start']['dateTime'])
-        end_dt = parser.parse(event['end']['dateTime'])
-        duration_minutes = (end_dt - start_dt).total_seconds() / 60
+        start_dt = _parse_timestamp(event['start']['dateTime'])
+        end_dt = _parse_timestamp(event['end']['dateTime'])
+        duration_minutes = int((end_dt - start_dt).total_seconds() / 60)
 
         # 3. Extract Context (The "Agentic" Meat)
         # Google description often contains Zoom links etc. We want the text.
@@ -159,47 +243,54 @@ def parse_calendar_to_intentions(raw_events):
         record_type = event_record_type(event)
 
         # 5. Build the Golden Object
-        intention = {
-            "source_id": event['id'],
-            "title": raw_title,
-            "context_notes": raw_desc,
-            "timing": {
-                "start_iso": start_dt.isoformat(),
-                "end_iso": end_dt.isoformat(),
-                "duration_minutes": int(duration_minutes),
-                "time_chunk": get_time_chunk(start_dt.hour)
-            },
-            "meta": {
-                "pillar": category_data["pillar"],
-                "subcategory": category_data["subcategory"],
-                "record_type": record_type, # 'Actual' or 'Intention'
-                "google_color_id": color_id,
-                "is_processed": False
-            }
-        }
-
+        intention = Intention(
+            source_id=event['id'],
+            title=raw_title,
+            context_notes=raw_desc,
+            start_iso=start_dt.isoformat(),
+            end_iso=end_dt.isoformat(),
+            duration_minutes=duration_minutes,
+            time_chunk=get_time_chunk(start_dt.hour),
+            pillar=category_data["pillar"],
+            subcategory=category_data["subcategory"],
+            record_type=record_type,
+            google_color_id=color_id
+        )
 
         formatted_intentions.append(intention)
 
     return formatted_intentions
 
-def save_debug_artifacts(raw_data, formatted_data):
-    """Saves files to data/google_calendar for manual inspection."""
-
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+def _dump_json_file(path, data):
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
 
+def _save_debug_artifacts_sync(raw_data, formatted_data, timestamp):
     # 1. Save RAW (The Ground Truth)
     raw_path = os.path.join(DATA_DIR, f"cal_raw_{timestamp}.json")
-    with open(raw_path, 'w') as f:
-        json.dump(raw_data, f, indent=2)
+    _dump_json_file(raw_path, raw_data)
     logger.info(f"✅ Saved RAW data to: {raw_path}")
 
     # 2. Save FORMATTED (The Agentic View)
+    formatted_data = [item.to_dict() if isinstance(item, Intention) else item for item in formatted_data]
     fmt_path = os.path.join(DATA_DIR, f"cal_formatted_{timestamp}.json")
-    with open(fmt_path, 'w') as f:
-        json.dump(formatted_data, f, indent=2)
+    _dump_json_file(fmt_path, formatted_data)
     logger.info(f"✅ Saved FORMATTED data to: {fmt_path}")
 
+def save_debug_artifacts(raw_data, formatted_data):
+    """
+    Saves files to data/google_calendar for manual inspection.
+
+    The encode and write run on the shared I/O pool so callers aren't blocked;
+    the returned Future can be waited on (e.g. in scripts) to surface errors.
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return io_pool.submit(_save_debug_artifacts_sync, raw_data, formatted_data, timestamp)
+
 # --- USAGE EXAMPLE (Put this in your main execution flow) ---
 # events = service.events().list(...).execute()
 # raw_items = events.get('items', [])
@@ -1,5 +1,9 @@
+import functools
+import json
 import logging
-from googleapiclient.discovery import build
+import threading
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build, build_from_document
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -14,15 +18,40 @@ load_env_vars()
 # Using read-write access to enable syncing actual activities back to calendar
 SCOPES = ['https://www.googleapis.com/auth/calendar']
 
-def get_calendar_service():
+# The service built by get_calendar_service(), reused by every later call
+_service = None
+_service_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=1)
+def _calendar_discovery_doc():
+    """The Calendar v3 discovery document bundled with google-api-python-client, parsed once."""
+    doc = discovery_cache.get_static_doc('calendar', 'v3')
+    return json.loads(doc) if doc else None
+
+def build_calendar_service(creds):
+    """
+    Builds a Calendar v3 client from the cached discovery document instead of
+    having build() locate, read and parse it again for every service.
+    """
+    doc = _calendar_discovery_doc()
+    if doc is None:
+        return build('calendar', 'v3', credentials=creds, cache_discovery=False)
+    return build_from_document(doc, credentials=creds)
+
+def get_calendar_service(refresh: bool = False):
     """
     Handles the OAuth 2.0 flow and returns a service object to interact with the API.
+    The service is built once per process; later calls return it directly.
     
     Note: 
     - credentials.json should be from the Google Cloud project (see .auth/ directory)
     - token.json will be created for the authenticated user account during OAuth flow
     - Token is cached so user doesn't need to re-authenticate every time
     
+    Args:
+        refresh: Discard the cached service and build a new one, e.g. after
+            its credentials could not be refreshed.
+
     Returns:
         googleapiclient.discovery.Resource: Calendar API service object
         
@@ -30,12 +59,17 @@ def get_calendar_service():
         FileNotFoundError: If credentials.json is not found
         Exception: If OAuth flow fails
     """
-    try:
-        creds = get_calendar_credentials(scopes=SCOPES)
-        service = build('calendar', 'v3', credentials=creds, cache_discovery=False)
-        logger.info("Calendar service initialized successfully via helper.")
-        return service
-    except Exception as e:
-        logger.error(f"Failed to build calendar service: {e}")
-        raise
-
+    global _service
+    if _service is not None and not refresh:
+        return _service
+    with _service_lock:
+        if _service is not None and not refresh:
+            return _service
+        try:
+            creds = get_calendar_credentials(scopes=SCOPES)
+            _service = build_calendar_service(creds)
+            logger.info("Calendar service initialized successfully via helper.")
+            return _service
+        except Exception as e:
+            logger.error(f"Failed to build calendar service: {e}")
+            raise
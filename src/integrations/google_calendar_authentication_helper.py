@@ -1,4 +1,6 @@
+import json
 import os
+import threading
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 import logging
@@ -8,6 +10,13 @@ from google_auth_oauthlib.flow import InstalledAppFlow
 # This defines what our app is allowed to do. Defaulting to full calendar access for syncing.
 SCOPES = ['https://www.googleapis.com/auth/calendar']
 
+# Credentials are kept in memory per (refresh token, scopes) and reused while
+# still valid; google-auth already reports them invalid a few minutes before
+# expiry, so the refresh happens ahead of time instead of on every fetch.
+_creds_cache = {}
+_creds_lock = threading.Lock()
+_client_info_cache = {}
+
 def get_auth_paths():
     """
     Dynamically finds the project root and returns paths for auth files.
@@ -28,12 +37,26 @@ def get_auth_paths():
         "token": os.path.join(auth_dir, 'token.json')
     }
 
+def _cached_creds(key):
+    with _creds_lock:
+        creds = _creds_cache.get(key)
+    return creds if creds is not None and creds.valid else None
+
+def _store_creds(key, creds):
+    with _creds_lock:
+        _creds_cache[key] = creds
+
 def get_calendar_credentials(scopes=None):
     """Handles the OAuth2 flow and returns valid credentials."""
     paths = get_auth_paths()
     creds = None
     target_scopes = scopes if scopes else SCOPES
 
+    cache_key = (None, tuple(target_scopes))
+    cached = _cached_creds(cache_key)
+    if cached is not None:
+        return cached
+
     # Load existing token if it exists
     if os.path.exists(paths["token"]):
         try:
@@ -54,45 +77,60 @@ def get_calendar_credentials(scopes=None):
                 creds = None
 
         if not creds or not creds.valid:
-            if not os.path.exists(paths["credentials"]):
+            try:
+                flow = InstalledAppFlow.from_client_secrets_file(
+                    paths["credentials"], target_scopes
+                )
+            except FileNotFoundError as e:
                 raise FileNotFoundError(
                     f"Missing credentials file at {paths['credentials']}. "
                     "Please place your Google Cloud credentials.json there."
-                )
-
-            flow = InstalledAppFlow.from_client_secrets_file(
-                paths["credentials"], target_scopes
-            )
-            creds = flow.run_local_server(port=0)
+                ) from e
+            # Prints the consent URL and waits on a loopback port for the redirect,
+            # so it also works over SSH / on machines without a browser.
+            creds = flow.run_local_server(port=0, open_browser=False)
 
         # Save the credentials for the next run
         with open(paths["token"], 'w') as token:
             token.write(creds.to_json())
 
+    _store_creds(cache_key, creds)
     return creds
 
+def _load_client_info(credentials_path: str) -> dict:
+    """Reads the OAuth client id/secret from credentials.json once per process."""
+    client_info = _client_info_cache.get(credentials_path)
+    if client_info is None:
+        with open(credentials_path, 'r') as f:
+            client_config = json.load(f)
+
+        # Handle both 'web' and 'installed' types of credentials.json
+        client_info = client_config.get('web') or client_config.get('installed')
+        if not client_info:
+            raise ValueError("Invalid credentials.json format")
+        _client_info_cache[credentials_path] = client_info
+    return client_info
+
 def get_calendar_credentials_for_user(refresh_token: str, scopes=None):
     """
     Creates valid Google OAuth Credentials using a refresh token from the database.
     Requires the global client_id and client_secret to refresh the token.
     """
-    import json
-    paths = get_auth_paths()
     target_scopes = scopes if scopes else SCOPES
 
+    cache_key = (refresh_token, tuple(target_scopes))
+    cached = _cached_creds(cache_key)
+    if cached is not None:
+        return cached
+
+    paths = get_auth_paths()
     if not os.path.exists(paths["credentials"]):
         raise FileNotFoundError(
             f"Missing credentials file at {paths['credentials']}. "
             "Cannot refresh user token without client secrets."
         )
 
-    with open(paths["credentials"], 'r') as f:
-        client_config = json.load(f)
-
-    # Handle both 'web' and 'installed' types of credentials.json
-    client_info = client_config.get('web') or client_config.get('installed')
-    if not client_info:
-        raise ValueError("Invalid credentials.json format")
+    client_info = _load_client_info(paths["credentials"])
 
     creds = Credentials(
         token=None,
@@ -105,4 +143,5 @@ def get_calendar_credentials_for_user(refresh_token: str, scopes=None):
 
     # Force a refresh to get an access token
     creds.refresh(Request())
+    _store_creds(cache_key, creds)
     return creds
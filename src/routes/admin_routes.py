@@ -122,7 +122,6 @@ def impersonate_user():
         if not user_doc:
             return jsonify({"error": f"User {target_email} not found in database"}), 404
 
-        profile_data = user_doc.get("profile", {})
         jwt_secret = os.environ.get("JWT_SECRET")
 
         if not jwt_secret:
@@ -137,7 +136,6 @@ def impersonate_user():
                 "account_type": "hero",
                 "email": target_email,
                 "exp": expiration,
-                "profile": profile_data,
                 "is_impersonation": True,
                 "impersonated_by": getattr(request, 'user_email', 'unknown_admin')
             },
@@ -32,6 +32,10 @@ _OAUTH_SCOPES: list[str] = [
 
 _NEXUS_DOMAIN: str = "@nexus-ds-ml-consulting.com"
 
+# One shared transport for ID-token verification: Google's signing certs are
+# fetched over a kept-alive HTTPS session instead of a fresh one per login.
+_GOOGLE_REQUEST = google_requests.Request()
+
 
 # ---------------------------------------------------------------------------
 # Shared helpers
@@ -77,7 +81,7 @@ def _verify_google_token(credential: str, client_id: str) -> dict[str, Any]:
     """
     return id_token.verify_oauth2_token(
         credential,
-        google_requests.Request(),
+        _GOOGLE_REQUEST,
         client_id,
     )
 
@@ -196,7 +200,6 @@ def _provision_user_and_issue_jwt(
             "email": email,
             "username": username,
             "exp": expiration,
-            "profile": profile_data,
         },
         jwt_secret,
         algorithm="HS256",
@@ -258,39 +261,11 @@ def login():
         if 'credential' not in data:
             return jsonify({"error": "Google ID token (credential) required"}), 400
 
-        token_credential = data['credential']
-
-        # Read secrets
-        google_client_id = os.environ.get("GOOGLE_CLIENT_USER_LOGIN_ID", "").strip("\"'")
-        jwt_secret = os.environ.get("JWT_SECRET")
-
+        # Verify the Google token once (ValueError -> 401 below)
         jwt_secret, google_client_id = _get_auth_secrets()
         idinfo = _verify_google_token(data['credential'], google_client_id)
         email, profile_data = _extract_profile(idinfo)
 
-        if not google_client_id:
-            logger.error("GOOGLE_CLIENT_USER_LOGIN_ID is not configured in the environment.")
-            return jsonify({"error": "Server configuration error"}), 500
-
-        # Verify Google Token
-        try:
-            idinfo = id_token.verify_oauth2_token(
-                token_credential,
-                google_requests.Request(),
-                google_client_id
-            )
-        except ValueError as e:
-            logger.warning(f"Invalid Google ID token: {e}")
-            return jsonify({"error": "Invalid token"}), 401
-
-        # Extract identity
-        email = idinfo.get('email')
-        profile_data = {
-            "name": idinfo.get('name'),
-            "picture": idinfo.get('picture'),
-            "given_name": idinfo.get('given_name')
-        }
-
         # Provision/update user in Mongo to get latest status
         username = "Hero"
         try:
@@ -312,8 +287,7 @@ def login():
                 "account_type": account_type,
                 "email": email,
                 "username": username,
-                "exp": expiration,
-                "profile": profile_data
+                "exp": expiration
             },
             jwt_secret,
             algorithm="HS256"
@@ -397,7 +371,7 @@ def login_code():
         try:
             idinfo = id_token.verify_oauth2_token(
                 credentials.id_token,
-                google_requests.Request(),
+                _GOOGLE_REQUEST,
                 google_client_id
             )
         except ValueError as e:
@@ -434,8 +408,7 @@ def login_code():
                 "account_type": account_type,
                 "email": email,
                 "username": username,
-                "exp": expiration,
-                "profile": profile_data
+                "exp": expiration
             },
             jwt_secret,
             algorithm="HS256"
@@ -471,44 +444,12 @@ def nexus_login():
         if 'credential' not in data:
             return jsonify({"error": "Google ID token (credential) required"}), 400
 
-        token_credential = data['credential']
-
-        google_client_id = os.environ.get("GOOGLE_CLIENT_USER_LOGIN_ID", "").strip("\"'")
-        jwt_secret = os.environ.get("JWT_SECRET")
-
+        # Verify the Google token once (ValueError -> 401 below), then the org domain
         jwt_secret, google_client_id = _get_auth_secrets()
         idinfo = _verify_google_token(data['credential'], google_client_id)
         email, profile_data = _extract_profile(idinfo)
         _enforce_org_domain(email, _NEXUS_DOMAIN)
 
-        if not google_client_id:
-            logger.error("GOOGLE_CLIENT_USER_LOGIN_ID is not configured in the environment.")
-            return jsonify({"error": "Server configuration error"}), 500
-
-        # Verify Google Token
-        try:
-            idinfo = id_token.verify_oauth2_token(
-                token_credential,
-                google_requests.Request(),
-                google_client_id
-            )
-        except ValueError as e:
-            logger.warning(f"Invalid Google ID token on admin login: {e}")
-            return jsonify({"error": "Invalid token"}), 401
-
-        email = idinfo.get('email', '')
-
-        # STRICT ORG CHECK
-        if not email.endswith('@nexus-ds-ml-consulting.com'):
-            logger.warning(f"SECURITY AUDIT: Unauthorized admin login attempt from {email} via {request.remote_addr}")
-            return jsonify({"error": "Unauthorized: Must be a Nexus-Guild domain account."}), 403
-
-        profile_data = {
-            "name": idinfo.get('name'),
-            "picture": idinfo.get('picture'),
-            "given_name": idinfo.get('given_name')
-        }
-
         # Provision/update user in Mongo
         try:
             storage = SovereignMongoStorage()
@@ -526,8 +467,7 @@ def nexus_login():
                 "role": role,
                 "account_type": account_type,
                 "email": email,
-                "exp": expiration,
-                "profile": profile_data
+                "exp": expiration
             },
             jwt_secret,
             algorithm="HS256"
@@ -611,7 +551,7 @@ def nexus_login_code():
         try:
             idinfo = id_token.verify_oauth2_token(
                 credentials.id_token,
-                google_requests.Request(),
+                _GOOGLE_REQUEST,
                 google_client_id
             )
         except ValueError as e:
@@ -650,8 +590,7 @@ def nexus_login_code():
                 "role": role,
                 "account_type": account_type,
                 "email": email,
-                "exp": expiration,
-                "profile": profile_data
+                "exp": expiration
             },
             jwt_secret,
             algorithm="HS256"
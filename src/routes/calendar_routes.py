@@ -4,18 +4,49 @@ Calendar routes.
 Handles Google Calendar event fetching for both direct API access
 and internal consumption by the journal reflection pipeline.
 """
+import functools
+import hashlib
 import logging
-from datetime import datetime, time
-from flask import Blueprint, request, jsonify
+import os
+import threading
+import time as _time
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+from flask import Blueprint, current_app, request, jsonify
+from google.auth.exceptions import RefreshError
 from pydantic import ValidationError
 
 from src.routes.auth_middleware import require_api_key
-from src.integrations.google_calendar import get_calendar_service
-from src.schemas.api_models import CalendarRequestSchema
+from src.integrations.google_calendar import build_calendar_service, get_calendar_service
+from src.schemas.api_models import CalendarRequestSchema, EventEditSchema
+from src.utils.io_pool import io_pool
+from src.utils.json_provider import dumps as json_dumps, loads as json_loads
 
 calendar_bp = Blueprint('calendar', __name__)
 logger = logging.getLogger("APP_ROUTER")
 
+# Browsers may reuse a day's events for this long before revalidating via ETag
+EVENTS_CACHE_CONTROL = "private, max-age=60"
+
+def _conditional_events_response(payload: dict, events):
+    """
+    jsonify(payload) with an ETag over `events` and EVENTS_CACHE_CONTROL; a
+    matching If-None-Match turns it into a bodiless 304. The body depends on
+    the caller's credentials, hence Vary: Authorization.
+    """
+    # The app's JSON provider sorts keys, so equal event lists hash equally
+    etag = hashlib.blake2b(current_app.json.dumps(events).encode(), digest_size=8).hexdigest()
+
+    resp = jsonify(payload)
+    resp.set_etag(etag)
+    resp.headers['Cache-Control'] = EVENTS_CACHE_CONTROL
+    resp.vary.add('Authorization')
+    return resp.make_conditional(request)
+
+# Day boundaries for calendar lookups are computed in this IANA zone (default UTC)
+CALENDAR_TIMEZONE = os.environ.get("CALENDAR_TIMEZONE", "UTC")
+_CALENDAR_TZ = ZoneInfo(CALENDAR_TIMEZONE)
+
 # Lazy-initialized calendar service singleton
 _calendar_service = None
 
@@ -26,55 +57,350 @@ def get_calendar_service_instance():
         _calendar_service = get_calendar_service()
     return _calendar_service
 
-def fetch_calendar_events_for_date(target_date_str: str, email: str | None = None):
+def _execute_calendar_call(make_request):
+    """
+    Runs make_request(service).execute() on the shared service. If its OAuth token
+    can no longer be refreshed, the service is rebuilt once and the call retried.
+    """
+    global _calendar_service
+    try:
+        return make_request(get_calendar_service_instance()).execute()
+    except RefreshError as e:
+        logger.warning(f"Calendar credentials failed to refresh ({e}); rebuilding service")
+        _calendar_service = get_calendar_service(refresh=True)
+        return make_request(_calendar_service).execute()
+
+# Short-lived cache of Calendar API results keyed by (email, date), so repeated
+# journal submissions and dashboard reloads don't each round-trip to Google.
+# Entries are fresh for CALENDAR_CACHE_TTL; from CALENDAR_REFRESH_AHEAD seconds
+# before that until CALENDAR_STALE_TTL after it, the cached value is still served
+# while a background refresh runs (stale-while-revalidate).
+CALENDAR_CACHE_TTL = 300
+CALENDAR_REFRESH_AHEAD = 30
+CALENDAR_STALE_TTL = 300
+CALENDAR_CACHE_MAXSIZE = 256
+_events_cache = {}
+_events_cache_lock = threading.Lock()
+_refreshing = set()
+# Bumped per email whenever that user's events are edited, so fetches that were
+# already in flight don't put the pre-edit events back into the cache
+_cache_generations = {}
+
+# With REDIS_URL set, fetched days are also shared across Gunicorn workers
+# through Redis for CALENDAR_CACHE_TTL; the in-process cache stays the first tier.
+# An edit clears Redis and the editing worker's local tier only, so other
+# workers can keep serving pre-edit days for up to CALENDAR_CACHE_TTL.
+_SHARED_CACHE_PREFIX = "porter:calendar_events:"
+_shared_redis = None
+_shared_redis_checked = False
+
+def _shared_cache():
+    """Lazily connects to Redis; returns None when REDIS_URL is unset or unusable."""
+    global _shared_redis, _shared_redis_checked
+    if not _shared_redis_checked:
+        _shared_redis_checked = True
+        redis_url = os.environ.get("REDIS_URL")
+        if redis_url:
+            try:
+                import redis
+                _shared_redis = redis.Redis.from_url(redis_url, socket_connect_timeout=1, socket_timeout=1)
+            except Exception as e:
+                logger.warning(f"Shared calendar cache disabled: {e}")
+    return _shared_redis
+
+def _shared_key(key):
+    email, target_date_str = key
+    return f"{_SHARED_CACHE_PREFIX}{email or ''}:{target_date_str}"
+
+def _shared_index_key(email):
+    """Redis set of the user's cached day keys, so their days can be dropped without a SCAN."""
+    return f"{_SHARED_CACHE_PREFIX}days:{email or ''}"
+
+def _load_shared_events(key):
+    """
+    Copies a day from Redis into the local cache; returns (expires_at, events) or None.
+    A read that overlaps an invalidation of the user's events counts as a miss.
+    """
+    client = _shared_cache()
+    if client is None:
+        return None
+    generation = _cache_generation(key[0])
+    try:
+        raw, ttl = client.pipeline().get(_shared_key(key)).ttl(_shared_key(key)).execute()
+    except Exception as e:
+        logger.warning(f"Shared calendar cache read failed: {e}")
+        return None
+    if raw is None or ttl is None or ttl <= 0:
+        return None
+    entry = (_time.monotonic() + ttl, json_loads(raw))
+    with _events_cache_lock:
+        if _cache_generations.get(key[0], 0) != generation:
+            return None
+        _events_cache[key] = entry
+    return entry
+
+def _get_cached_events(key):
+    """Returns (events, needs_refresh) for a usable entry, else None."""
+    now = _time.monotonic()
+    with _events_cache_lock:
+        entry = _events_cache.get(key)
+    if entry is None:
+        entry = _load_shared_events(key)
+    if entry is None:
+        return None
+    expires_at, events = entry
+    if now >= expires_at + CALENDAR_STALE_TTL:
+        return None
+    return events, now >= expires_at - CALENDAR_REFRESH_AHEAD
+
+def _cache_generation(email):
+    with _events_cache_lock:
+        return _cache_generations.get(email, 0)
+
+def _store_cached_events(key, events, generation=None):
+    """
+    Caches a fetched day. Pass the _cache_generation(email) read before the fetch
+    started; the result is dropped if the user's events were invalidated since.
+    """
+    now = _time.monotonic()
+    with _events_cache_lock:
+        if generation is not None and _cache_generations.get(key[0], 0) != generation:
+            return
+        if len(_events_cache) >= CALENDAR_CACHE_MAXSIZE:
+            for stale in [k for k, (expires, _) in _events_cache.items() if expires + CALENDAR_STALE_TTL <= now]:
+                del _events_cache[stale]
+            while len(_events_cache) >= CALENDAR_CACHE_MAXSIZE:
+                del _events_cache[next(iter(_events_cache))]
+        _events_cache[key] = (now + CALENDAR_CACHE_TTL, events)
+
+    client = _shared_cache()
+    if client is not None:
+        index_key = _shared_index_key(key[0])
+        try:
+            pipe = client.pipeline()
+            pipe.setex(_shared_key(key), CALENDAR_CACHE_TTL, json_dumps(events))
+            pipe.sadd(index_key, _shared_key(key))
+            pipe.expire(index_key, CALENDAR_CACHE_TTL)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Shared calendar cache write failed: {e}")
+
+def _invalidate_cached_events(email):
+    """Drops every cached day of one user (email None is the system calendar)."""
+    with _events_cache_lock:
+        _cache_generations[email] = _cache_generations.get(email, 0) + 1
+        for stale in [k for k in _events_cache if k[0] == email]:
+            del _events_cache[stale]
+
+    client = _shared_cache()
+    if client is not None:
+        index_key = _shared_index_key(email)
+        try:
+            stale_keys = client.smembers(index_key)
+            client.delete(index_key, *stale_keys)
+        except Exception as e:
+            logger.warning(f"Shared calendar cache invalidation failed: {e}")
+
+def _refresh_cached_events(key, target_date_str, email):
+    try:
+        generation = _cache_generation(email)
+        events = _request_calendar_events(target_date_str, email)
+        if events is not None:
+            _store_cached_events(key, events, generation)
+    except Exception as e:
+        logger.warning(f"Background calendar refresh failed for {target_date_str}: {e}")
+    finally:
+        with _events_cache_lock:
+            _refreshing.discard(key)
+
+def _schedule_refresh(key, target_date_str, email):
+    with _events_cache_lock:
+        if key in _refreshing:
+            return
+        _refreshing.add(key)
+    io_pool.submit(_refresh_cached_events, key, target_date_str, email)
+
+def _parse_ymd(date_str: str) -> date:
+    """
+    Strictly parses a YYYY-MM-DD string without going through strptime
+    (which compiles a regex and takes a module lock on every call).
+
+    Raises:
+        ValueError: If the string is not exactly YYYY-MM-DD or not a real date.
+    """
+    if (len(date_str) != 10 or date_str[4] != '-' or date_str[7] != '-'
+            or not (date_str[:4].isdigit() and date_str[5:7].isdigit() and date_str[8:].isdigit())):
+        raise ValueError(f"Expected YYYY-MM-DD, got {date_str!r}")
+    return date(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
+
+def _build_calendar_service(email: str | None = None):
+    """
+    Builds a Calendar API client for the user (or the system account).
+
+    Returns:
+        The service, or None if the user has no linked calendar.
+    """
+    from src.database.mongo_storage import SovereignMongoStorage
+    from src.integrations.google_calendar_authentication_helper import get_calendar_credentials_for_user, get_calendar_credentials
+    if email and email != "system_script@localhost":
+        mongo = SovereignMongoStorage()
+        user_doc = mongo.users_col.find_one({"email": email})
+        if not user_doc or "google_refresh_token" not in user_doc:
+            logger.warning(f"No refresh token available for user {email}. Cannot fetch personalized events.")
+            return None
+
+        creds = get_calendar_credentials_for_user(user_doc["google_refresh_token"])
+    else:
+        # Fall back to global credentials for system state
+        creds = get_calendar_credentials()
+
+    return build_calendar_service(creds)
+
+@functools.lru_cache(maxsize=512)
+def _day_bounds(target_date_str: str) -> tuple[str, str]:
+    """
+    Offset-aware RFC 3339 (timeMin, timeMax) for a YYYY-MM-DD day in CALENDAR_TIMEZONE.
+    timeMax is exclusive, so it is the next midnight. Memoized per date: the
+    offset depends on the day (DST), so the strings can't be fixed suffixes.
+    """
+    day_start = datetime.combine(_parse_ymd(target_date_str), time.min, tzinfo=_CALENDAR_TZ)
+    return day_start.isoformat(), (day_start + timedelta(days=1)).isoformat()
+
+def _events_list_request(service, target_date_str: str):
+    """Builds (without executing) the events().list request for one day."""
+    time_min, time_max = _day_bounds(target_date_str)
+
+    return service.events().list(
+        calendarId='primary',
+        timeMin=time_min,
+        timeMax=time_max,
+        timeZone=CALENDAR_TIMEZONE,
+        singleEvents=True,
+        orderBy='startTime'
+    )
+
+def _request_calendar_events(target_date_str: str, email: str | None = None):
+    """
+    Calls the Google Calendar API for a date.
+
+    Returns:
+        List of event dictionaries, or None if the user has no linked calendar.
+    """
+    service = _build_calendar_service(email)
+    if service is None:
+        return None
+    return _events_list_request(service, target_date_str).execute().get('items', [])
+
+def fetch_calendar_events_for_date(target_date_str: str, email: str | None = None, use_cache: bool = True):
     """
     Helper function to fetch calendar events for a date.
     Uses user-specific credentials if an email with a refresh token is provided.
+    Results are cached for CALENDAR_CACHE_TTL seconds and then served stale while
+    they refresh in the background; failures are not cached.
 
     Args:
         target_date_str: Date in YYYY-MM-DD format
         email: User's email to fetch specific calendar. Defaults to None (system).
+        use_cache: Set to False to bypass the cache and refresh it.
 
     Returns:
         List of event dictionaries or empty list if error
     """
+    key = (email, target_date_str)
+    if use_cache:
+        cached = _get_cached_events(key)
+        if cached is not None:
+            events, needs_refresh = cached
+            if needs_refresh:
+                _schedule_refresh(key, target_date_str, email)
+            return events
+
+    generation = _cache_generation(email)
     try:
-        from src.database.mongo_storage import SovereignMongoStorage
-        from src.integrations.google_calendar_authentication_helper import get_calendar_credentials_for_user, get_calendar_credentials
-        from googleapiclient.discovery import build
-
-        if email and email != "system_script@localhost":
-            mongo = SovereignMongoStorage()
-            user_doc = mongo.users_col.find_one({"email": email})
-            if not user_doc or "google_refresh_token" not in user_doc:
-                logger.warning(f"No refresh token available for user {email}. Cannot fetch personalized events.")
-                return []
-
-            creds = get_calendar_credentials_for_user(user_doc["google_refresh_token"])
-        else:
-            # Fall back to global credentials for system state
-            creds = get_calendar_credentials()
+        events = _request_calendar_events(target_date_str, email)
+    except Exception as e:
+        logger.error(f"Error fetching calendar events internally: {e}")
+        return []
 
-        service = build('calendar', 'v3', credentials=creds, cache_discovery=False)
+    if events is None:
+        return []
+    _store_cached_events(key, events, generation)
+    return events
 
-        target_date = datetime.strptime(target_date_str, '%Y-%m-%d').date()
+# Google's batch endpoint accepts at most 50 calls per HTTP request
+CALENDAR_BATCH_LIMIT = 50
 
-        time_min = datetime.combine(target_date, time.min).isoformat() + 'Z'
-        time_max = datetime.combine(target_date, time.max).isoformat() + 'Z'
+def fetch_calendar_events_for_dates(target_date_strs, email: str | None = None):
+    """
+    Fetches calendar events for several dates. Cached dates are answered from the
+    cache; the rest go to Google as one batched HTTP request instead of one
+    round-trip per day.
 
-        events_result = service.events().list(
-            calendarId='primary',
-            timeMin=time_min,
-            timeMax=time_max,
-            singleEvents=True,
-            orderBy='startTime'
-        ).execute()
+    Args:
+        target_date_strs: Iterable of dates in YYYY-MM-DD format
+        email: User's email to fetch specific calendar. Defaults to None (system).
 
-        events = events_result.get('items', [])
-        return events
+    Returns:
+        Dict of date string -> list of event dictionaries (empty list on error)
+    """
+    results = {}
+    missing = []
+    for date_str in dict.fromkeys(target_date_strs):
+        cached = _get_cached_events((email, date_str))
+        if cached is None:
+            missing.append(date_str)
+            continue
+        events, needs_refresh = cached
+        if needs_refresh:
+            _schedule_refresh((email, date_str), date_str, email)
+        results[date_str] = events
+
+    if not missing:
+        return results
+
+    generation = _cache_generation(email)
+    try:
+        service = _build_calendar_service(email)
     except Exception as e:
-        logger.error(f"Error fetching calendar events internally: {e}")
-        return []
+        logger.error(f"Error building calendar service: {e}")
+        service = None
+    if service is None:
+        results.update({date_str: [] for date_str in missing})
+        return results
+
+    def on_response(request_id, response, exception):
+        if exception is not None:
+            logger.error(f"Error fetching calendar events for {request_id}: {exception}")
+            results[request_id] = []
+            return
+        events = response.get('items', [])
+        _store_cached_events((email, request_id), events, generation)
+        results[request_id] = events
+
+    for i in range(0, len(missing), CALENDAR_BATCH_LIMIT):
+        chunk = missing[i:i + CALENDAR_BATCH_LIMIT]
+        batch = service.new_batch_http_request(callback=on_response)
+        for date_str in chunk:
+            batch.add(_events_list_request(service, date_str), request_id=date_str)
+        try:
+            batch.execute()
+        except Exception as e:
+            logger.error(f"Batched calendar fetch failed: {e}")
+        for date_str in chunk:
+            results.setdefault(date_str, [])
+
+    return results
+
+def _format_event(event: dict) -> dict:
+    """Shapes a Calendar API event for the front-end."""
+    return {
+        'title': event.get('summary', 'No Title'),
+        'start': event['start'].get('dateTime', event['start'].get('date')),
+        'end': event['end'].get('dateTime', event['end'].get('date')),
+        'description': event.get('description', ''),
+        'location': event.get('location', ''),
+        'id': event.get('id', '')
+    }
 
 @calendar_bp.route('/get_calendar_events', methods=['GET'])
 @require_api_key
@@ -84,6 +410,10 @@ def get_calendar_events():
 
     Query parameters:
         date: Date in YYYY-MM-DD format (defaults to today if not provided)
+        force: Set to 1 to bypass the calendar cache
+
+    Responses carry an ETag over the events; a matching If-None-Match
+    gets an empty 304 instead of the body.
 
     Returns:
         JSON with events array, each event containing:
@@ -94,19 +424,17 @@ def get_calendar_events():
     """
     try:
         try:
-            req = CalendarRequestSchema(date=request.args.get('date'))
+            req = CalendarRequestSchema(date=request.args.get('date'), force=request.args.get('force', False))
         except ValidationError as e:
             return jsonify({"error": f"Invalid query parameters: {str(e)}"}), 400
 
         date_str = req.date
         if not date_str:
-            date_str = datetime.now().strftime('%Y-%m-%d')
+            date_str = date.today().isoformat()
 
         # Validate date format strictly
         try:
-            if len(date_str) != 10:
-                raise ValueError("Strict length check failed")
-            datetime.strptime(date_str, '%Y-%m-%d')
+            _parse_ymd(date_str)
         except ValueError:
             return jsonify({"error": "Invalid date format. Use strict YYYY-MM-DD."}), 400
 
@@ -114,39 +442,65 @@ def get_calendar_events():
 
         # Fetch events using helper function
         try:
-            events = fetch_calendar_events_for_date(date_str, getattr(request, 'user_email', None))
+            events = fetch_calendar_events_for_date(date_str, getattr(request, 'user_email', None), use_cache=not req.force)
         except FileNotFoundError as e:
             return jsonify({"error": f"Google Calendar credentials not found: {e}"}), 500
         except Exception as e:
             return jsonify({"error": f"Failed to fetch calendar events: {e}"}), 500
 
         # Format events for front-end
-        formatted_events = []
-        for event in events:
-            start = event['start'].get('dateTime', event['start'].get('date'))
-            end = event['end'].get('dateTime', event['end'].get('date'))
-
-            formatted_events.append({
-                'title': event.get('summary', 'No Title'),
-                'start': start,
-                'end': end,
-                'description': event.get('description', ''),
-                'location': event.get('location', ''),
-                'id': event.get('id', '')
-            })
+        formatted_events = [_format_event(event) for event in events]
 
         logger.info(f"Found {len(formatted_events)} events for {date_str}")
 
-        return jsonify({
+        return _conditional_events_response({
             "date": date_str,
             "events": formatted_events,
             "count": len(formatted_events)
-        })
+        }, formatted_events)
 
     except Exception as e:
         logger.error(f"Error fetching calendar events: {e}", exc_info=True)
         return jsonify({"error": f"An unexpected error occurred while fetching calendar events: {str(e)}"}), 500
 
+@calendar_bp.route('/get_calendar_week', methods=['GET'])
+@require_api_key
+def get_calendar_week():
+    """
+    Fetches calendar events for the seven days starting at `start` in one call
+    (a single batched Google request for any days not already cached).
+
+    Query parameters:
+        start: First day in YYYY-MM-DD format (defaults to this week's Monday)
+
+    Returns:
+        JSON with a `days` object mapping each date to its formatted events,
+        with the same ETag/Cache-Control handling as /get_calendar_events.
+    """
+    try:
+        start_str = request.args.get('start')
+        try:
+            if start_str:
+                start = _parse_ymd(start_str)
+            else:
+                today = date.today()
+                start = today - timedelta(days=today.weekday())
+        except ValueError:
+            return jsonify({"error": "Invalid start date. Use strict YYYY-MM-DD."}), 400
+
+        dates = [(start + timedelta(days=i)).isoformat() for i in range(7)]
+        by_date = fetch_calendar_events_for_dates(dates, getattr(request, 'user_email', None))
+        days = {d: [_format_event(event) for event in by_date.get(d, [])] for d in dates}
+
+        return _conditional_events_response({
+            "start": dates[0],
+            "days": days,
+            "count": sum(len(events) for events in days.values())
+        }, days)
+    except Exception as e:
+        logger.error(f"Error fetching calendar week: {e}", exc_info=True)
+        return jsonify({"error": f"An unexpected error occurred while fetching calendar events: {str(e)}"}), 500
+
 @calendar_bp.route('/api/calendar/unverified_audits', methods=['GET'])
 @require_api_key
 def get_unverified_audits():
@@ -278,6 +632,14 @@ def user_sync_calendar():
         logger.error(f"Error syncing user calendar: {e}", exc_info=True)
         return jsonify({"error": str(e)}), 500
 
+def _invalidate_edited_calendar():
+    """
+    push_to_gcal edits through the shared system service, so the caller's days
+    and the system calendar's days are the ones that can have changed.
+    """
+    _invalidate_cached_events(getattr(request, 'user_email', None))
+    _invalidate_cached_events(None)
+
 @calendar_bp.route('/api/calendar/push_to_gcal', methods=['POST', 'OPTIONS'])
 @require_api_key
 def push_to_gcal():
@@ -287,18 +649,17 @@ def push_to_gcal():
     if request.method == 'OPTIONS':
         return '', 204
     try:
-        data = request.get_json()
-        if not data or 'action' not in data or 'gcal_id' not in data:
+        try:
+            edit = EventEditSchema.model_validate(request.get_json())
+        except ValidationError:
             return jsonify({"error": "Missing required fields (action, gcal_id)"}), 400
 
-        action = data['action']
-        gcal_id = data['gcal_id']
-
-        service = get_calendar_service_instance()
+        action = edit.action
+        gcal_id = edit.gcal_id
 
         if action == 'delete':
             try:
-                service.events().delete(calendarId='primary', eventId=gcal_id).execute()
+                _execute_calendar_call(lambda service: service.events().delete(calendarId='primary', eventId=gcal_id))
                 logger.info(f"Successfully deleted GCal event: {gcal_id}")
             except Exception as e:
                 # If it's already deleted on google or not found, just pass
@@ -309,17 +670,18 @@ def push_to_gcal():
             mongo = SovereignMongoStorage()
             mongo.raw_col.delete_one({"gcal_id": gcal_id})
             mongo.formatted_col.delete_one({"gcal_id": gcal_id})
+            _invalidate_edited_calendar()
 
             return jsonify({"status": "success", "message": "Event annihilated from Google Cloud and Mongo."})
 
         elif action == 'update':
             # e.g., Title change or Time shift
-            new_title = data.get('summary')
+            new_title = edit.summary
             try:
-                event = service.events().get(calendarId='primary', eventId=gcal_id).execute()
+                event = _execute_calendar_call(lambda service: service.events().get(calendarId='primary', eventId=gcal_id))
                 if new_title:
                     event['summary'] = new_title
-                updated_event = service.events().update(calendarId='primary', eventId=gcal_id, body=event).execute()
+                updated_event = _execute_calendar_call(lambda service: service.events().update(calendarId='primary', eventId=gcal_id, body=event))
 
                 # Update Mongo Native Collection
                 from src.database.mongo_storage import SovereignMongoStorage
@@ -327,6 +689,7 @@ def push_to_gcal():
                 if new_title:
                     mongo.raw_col.update_one({"gcal_id": gcal_id}, {"$set": {"summary": new_title}})
                     mongo.formatted_col.update_one({"gcal_id": gcal_id}, {"$set": {"summary": new_title}})
+                _invalidate_edited_calendar()
 
                 return jsonify({"status": "success", "message": "Event updated successfully on Google Cloud."})
             except Exception as e:
@@ -7,12 +7,16 @@ import logging
 from flask import Blueprint, request, jsonify
 
 from src.routes.auth_middleware import require_api_key
-from src.agents.first_serving_porter import run_first_serving_porter
 from src.database.mongo_storage import SovereignMongoStorage
 
 chat_bp = Blueprint('chat', __name__)
 logger = logging.getLogger("APP_ROUTER")
 
+def run_first_serving_porter(user_input: str, username: str = "Hero", user_email: str = "hero@example.com") -> dict:
+    # Imported on first chat: the agent pulls in LangChain and the vector DB clients
+    from src.agents.first_serving_porter import run_first_serving_porter as _run_first_serving_porter
+    return _run_first_serving_porter(user_input, username=username, user_email=user_email)
+
 @chat_bp.route('/chat/porter', methods=['POST', 'OPTIONS'])
 @require_api_key
 def chat_porter():
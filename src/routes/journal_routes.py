@@ -4,16 +4,26 @@ Journal and daily log routes.
 Handles saving time-chunk logs, retrieving historical monthly data,
 and triggering the daily AI reflection via LangGraph.
 """
+import functools
+import hashlib
+import json
 import logging
-from datetime import datetime, timedelta, timezone
-from flask import Blueprint, request, jsonify
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from flask import Blueprint, Response, request, jsonify, stream_with_context
 from pydantic import ValidationError
 
 from src.routes.auth_middleware import require_api_key
-from src.database.neo4j_client import log_to_neo4j
+from src.database.neo4j_client import submit_log
 from src.database.mongo_storage import SovereignMongoStorage
-from src.schemas.api_models import JournalLogBase, DailyReflectionRequestSchema
-from src.agents.porter_manager import run_porter_reflection
+from src.schemas.api_models import (
+    JournalLogBase, DailyReflectionRequestSchema, WeeklyExpectationSchema,
+    FreeformJournalSchema, EventEditSchema
+)
 from src.routes.calendar_routes import fetch_calendar_events_for_date
 from src.database.mongo_client.connection import MongoConnectionManager
 from src.config import MongoConfig
@@ -21,10 +31,55 @@ from src.database.mongo_client.uuid_manager import UUIDGenerator
 from src.utils.correlation import generate_correlation_id, generate_freeform_correlation_id
 from src.events.publisher import publish_journal_event
 from src.database.neo4j_client.connection import get_driver
+from src.utils.io_pool import io_pool
+from src.utils.json_provider import dumps as json_dumps
 
 journal_bp = Blueprint('journal', __name__)
 logger = logging.getLogger("APP_ROUTER")
 
+# Calendar context is fetched alongside the reflection instead of before it.
+CALENDAR_CONTEXT_TIMEOUT = 10
+
+_DAY_MAP = {
+    'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
+    'friday': 4, 'saturday': 5, 'sunday': 6
+}
+
+@functools.lru_cache(maxsize=32)
+def _day_name_to_date_on(day: str, today_ordinal: int) -> str:
+    today = date.fromordinal(today_ordinal)
+    day_index = _DAY_MAP.get(day.lower(), 0)
+    return (today + timedelta(days=day_index - today.weekday())).isoformat()
+
+def _day_name_to_date(day: str) -> str:
+    """
+    Maps a weekday name onto its YYYY-MM-DD date in the current week. The planner
+    sends real dates, which pass through unchanged; anything else maps to Monday.
+    """
+    if day.lower() not in _DAY_MAP:
+        try:
+            return date.fromisoformat(day).isoformat()
+        except ValueError:
+            pass
+    return _day_name_to_date_on(day, date.today().toordinal())
+
+# The LangGraph/ADK pipeline is imported on first use (or by the startup warm-up
+# thread), so importing this blueprint doesn't pull in langgraph and google.adk.
+def run_porter_reflection(journal_entry: str, log_data: dict | None = None) -> str:
+    from src.agents.porter_manager import run_porter_reflection as _run_porter_reflection
+    return _run_porter_reflection(journal_entry, log_data)
+
+def stream_porter_reflection(journal_entry: str, log_data: dict | None = None):
+    from src.agents.porter_manager import stream_porter_reflection as _stream_porter_reflection
+    return _stream_porter_reflection(journal_entry, log_data)
+
+def _validation_summary(e: ValidationError) -> str:
+    """Field locations and messages only, so journal text never lands in the logs."""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}"
+        for err in e.errors(include_input=False)
+    )
+
 def _handle_request_data():
     """Helper to handle OPTIONS and extract JSON data."""
     if request.method == 'OPTIONS':
@@ -34,6 +89,29 @@ def _handle_request_data():
         return None, (jsonify({"error": "No JSON data received"}), 400)
     return data, None
 
+def _parse_reflection_request():
+    """
+    Shared request handling for the /process_journal variants.
+
+    Returns:
+        ((journal_entry, log_data), None) on success, or (None, error_response).
+    """
+    data, error_resp = _handle_request_data()
+    if error_resp:
+        return None, error_resp
+
+    if not isinstance(data, dict):
+        return None, (jsonify({"error": "Invalid data format: expected a JSON object"}), 400)
+
+    try:
+        validated_data = DailyReflectionRequestSchema(**data)
+    except ValidationError as e:
+        logger.error(f"Validation Error: {_validation_summary(e)}")
+        return None, (jsonify({"error": f"Invalid data format: {str(e)}"}), 400)
+
+    log_data = validated_data.log_data.model_dump() if hasattr(validated_data.log_data, 'model_dump') else validated_data.log_data.dict()
+    return (validated_data.journal_entry, log_data), None
+
 @journal_bp.route('/api/save_log', methods=['POST', 'OPTIONS'])
 @require_api_key
 def save_log():
@@ -50,7 +128,7 @@ def save_log():
             validated_data = JournalLogBase(**data)
             log_data_dict = validated_data.model_dump() if hasattr(validated_data, 'model_dump') else validated_data.dict()
         except ValidationError as e:
-            logger.error(f"Validation Error in save_log: {e}")
+            logger.error(f"Validation Error in save_log: {_validation_summary(e)}")
             return jsonify({"error": f"Invalid data format: {str(e)}"}), 400
 
         # If flat format doesn't have sync_status, initialize it
@@ -88,9 +166,10 @@ def save_log():
         mongo_doc_id = mongo_storage.save_journal_entry(log_data_dict, user_id=username, correlation_id=correlation_id)
 
         # 2. Save the complete log as a distinct node to Neo4j Identity Graph
+        # (group-committed with any other entries queued at the same time)
         db_confirmation = "Failed"
         try:
-            db_confirmation = log_to_neo4j(log_data_dict, username, correlation_id=correlation_id)
+            db_confirmation = submit_log(log_data_dict, username, correlation_id=correlation_id).result()
             mongo_storage.update_journal_sync_status(mongo_doc_id, day_str, time_chunk, {
                 "neo4j": True,
                 "saga_status.status": "GRAPH_INJECTED",
@@ -194,18 +273,18 @@ def save_weekly_expectation():
         return error_resp
 
     try:
-
-        week_start_date = data.get("week_start_date")
-        expectation_text = data.get("expectation_text")
+        try:
+            weekly = WeeklyExpectationSchema.model_validate(data)
+        except ValidationError:
+            return jsonify({"error": "Missing week_start_date or expectation_text"}), 400
+        week_start_date = weekly.week_start_date
+        expectation_text = weekly.expectation_text
 
         user_email = getattr(request, 'user_email', 'Hero')
         mongo_storage = SovereignMongoStorage()
         user_doc = mongo_storage.get_user_by_email(user_email)
         username = user_doc.get("username", "Hero") if user_doc else "Hero"
 
-        if not week_start_date or not expectation_text:
-            return jsonify({"error": "Missing week_start_date or expectation_text"}), 400
-
         updated_at = datetime.now(timezone.utc).isoformat()
 
         # Generate deterministic correlation ID for cross-system lineage
@@ -309,11 +388,12 @@ def save_freeform_journal():
     if request.method == 'OPTIONS':
         return '', 204
     try:
-        data = request.get_json()
-        date_str = data.get("date")
-        text = data.get("text")
-        if not date_str or text is None:
+        try:
+            freeform = FreeformJournalSchema.model_validate(request.get_json())
+        except ValidationError:
             return jsonify({"error": "Missing date or text"}), 400
+        date_str = freeform.date
+        text = freeform.text
 
         user_email = getattr(request, 'user_email', 'Hero')
         mongo_storage = SovereignMongoStorage()
@@ -450,6 +530,128 @@ def get_yearly_logs_route():
         logger.error(f"Error fetching yearly logs: {e}", exc_info=True)
         return jsonify({"error": str(e)}), 500
 
+def _save_daily_reflection(user_email: str, day, result_text: str):
+    """Saves a daily reflection under the user's username and returns its id."""
+    mongo_storage = SovereignMongoStorage()
+    user_doc = mongo_storage.get_user_by_email(user_email)
+    username = user_doc.get("username", "Hero") if user_doc else "Hero"
+
+    return mongo_storage.save_agent_reflection({
+        "day": day,
+        "user_id": username,
+        "reflection_text": result_text,
+        "metadata": {
+            "source": "daily_recon",
+            "timestamp": datetime.now().isoformat()
+        }
+    })
+
+# Identical submissions (double-clicks, client retries) share one LLM run: concurrent
+# duplicates wait on the in-flight Future, later ones reuse the recent result.
+REFLECTION_CACHE_TTL = 600
+REFLECTION_CACHE_MAXSIZE = 1024
+_reflection_lock = threading.Lock()
+_inflight_reflections: dict[str, Future] = {}
+_recent_reflections: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+
+def _reflection_key(user_email: str, journal_entry: str, log_data: dict) -> str:
+    raw = json.dumps([user_email, journal_entry, log_data], sort_keys=True, default=str)
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+def _run_reflection_once(user_email: str, journal_entry: str, log_data: dict) -> str:
+    """run_porter_reflection, coalescing identical concurrent and recent submissions."""
+    key = _reflection_key(user_email, journal_entry, log_data)
+    with _reflection_lock:
+        cached = _recent_reflections.get(key)
+        if cached and cached[0] > time.monotonic():
+            _recent_reflections.move_to_end(key)
+            return cached[1]
+        future = _inflight_reflections.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = _inflight_reflections[key] = Future()
+
+    if not is_owner:
+        logger.info("Joining in-flight reflection for an identical submission")
+        return future.result()
+
+    try:
+        result_text = run_porter_reflection(journal_entry, log_data)
+    except BaseException as e:
+        with _reflection_lock:
+            _inflight_reflections.pop(key, None)
+        future.set_exception(e)
+        raise
+
+    with _reflection_lock:
+        _inflight_reflections.pop(key, None)
+        # Error strings are returned rather than raised; don't pin them in the cache
+        if not result_text.startswith("ERROR:"):
+            _recent_reflections[key] = (time.monotonic() + REFLECTION_CACHE_TTL, result_text)
+            _recent_reflections.move_to_end(key)
+            while len(_recent_reflections) > REFLECTION_CACHE_MAXSIZE:
+                _recent_reflections.popitem(last=False)
+    future.set_result(result_text)
+    return result_text
+
+def _reflect_and_save(user_email: str, journal_entry: str, log_data: dict):
+    """Runs the reflection (with the day's calendar fetched alongside) and saves it.
+
+    Returns:
+        (result_text, reflection_id)
+    """
+    # Start the calendar fetch for the day so it overlaps with the reflection
+    calendar_future = None
+    day = log_data.get('day')
+    try:
+        if day:
+            # Convert day name to date (approximate - use current week)
+            target_date = _day_name_to_date(day)
+
+            calendar_future = io_pool.submit(fetch_calendar_events_for_date, target_date, user_email)
+    except Exception as cal_err:
+        logger.warning(f"Calendar context failed: {cal_err}")
+
+    # Run LangGraph reflection (shared with identical in-flight/recent submissions)
+    result_text = _run_reflection_once(user_email, journal_entry, log_data)
+
+    if calendar_future is not None:
+        try:
+            events = calendar_future.result(timeout=CALENDAR_CONTEXT_TIMEOUT)
+            if events:
+                logger.info(f"Added {len(events)} calendar events to journal context")
+        except Exception as cal_err:
+            logger.warning(f"Calendar context failed: {cal_err}")
+
+    # Save Reflection to dedicated collection
+    reflection_id = _save_daily_reflection(user_email, day, result_text)
+    return result_text, reflection_id
+
+# Background reflection jobs (POST /process_journal/jobs). Reflections run on
+# their own small pool so they can't starve io_pool; finished jobs are kept
+# until evicted by newer ones. Jobs live in this process, so polling must reach
+# the same Gunicorn worker (the default single-worker setup does).
+REFLECTION_JOB_WORKERS = 4
+REFLECTION_JOBS_MAXSIZE = 256
+_reflection_pool = ThreadPoolExecutor(max_workers=REFLECTION_JOB_WORKERS, thread_name_prefix="reflection")
+_reflection_jobs_lock = threading.Lock()
+_reflection_jobs: "OrderedDict[str, tuple[str, Future]]" = OrderedDict()
+
+def _submit_reflection_job(user_email: str, journal_entry: str, log_data: dict) -> str:
+    job_id = uuid.uuid4().hex
+    future = _reflection_pool.submit(_reflect_and_save, user_email, journal_entry, log_data)
+    with _reflection_jobs_lock:
+        _reflection_jobs[job_id] = (user_email, future)
+        while len(_reflection_jobs) > REFLECTION_JOBS_MAXSIZE:
+            oldest = next((k for k, (_, f) in _reflection_jobs.items() if f.done()), None)
+            if oldest is None:
+                break
+            del _reflection_jobs[oldest]
+    return job_id
+
+def _sse(event: str, payload: dict) -> str:
+    return f"event: {event}\ndata: {json_dumps(payload)}\n\n"
+
 @journal_bp.route('/process_journal', methods=['POST', 'OPTIONS'])
 @require_api_key
 def process_journal():
@@ -457,69 +659,20 @@ def process_journal():
     Generates a daily reflection based on the day's logs.
     Saves the reflection to a dedicated collection.
     """
-    data, error_resp = _handle_request_data()
+    parsed, error_resp = _parse_reflection_request()
     if error_resp:
         return error_resp
 
     try:
-
-        try:
-            validated_data = DailyReflectionRequestSchema(**data)
-            journal_entry = validated_data.journal_entry
-            log_data = validated_data.log_data.model_dump() if hasattr(validated_data.log_data, 'model_dump') else validated_data.log_data.dict()
-            day = log_data.get('day', 'Unknown')
-        except ValidationError as e:
-            logger.error(f"Validation Error: {e}")
-            return jsonify({"error": f"Invalid data format: {str(e)}"}), 400
+        journal_entry, log_data = parsed
+        day = log_data.get('day', 'Unknown')
 
         logger.info(f"Generating daily reflection for {day}...")
 
         try:
-            # Enhance journal entry with calendar context
-            enhanced_journal_entry = journal_entry
-
-            # Try to fetch calendar events for the day
-            try:
-                day = log_data.get('day')
-                if day:
-                    # Convert day name to date (approximate - use current week)
-                    today = datetime.now()
-                    day_map = {
-                        'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
-                        'friday': 4, 'saturday': 5, 'sunday': 6
-                    }
-                    day_index = day_map.get(day.lower(), 0)
-                    current_day_index = today.weekday()
-                    days_diff = day_index - current_day_index
-                    target_date = (today + timedelta(days=days_diff)).strftime('%Y-%m-%d')
-
-                    # Fetch calendar events using helper function
-                    events = fetch_calendar_events_for_date(target_date, getattr(request, 'user_email', None))
-
-                    if events:
-                        event_titles = [e.get('summary', 'Untitled') for e in events]
-                        logger.info(f"Added {len(events)} calendar events to journal context")
-            except Exception as cal_err:
-                logger.warning(f"Calendar context failed: {cal_err}")
-
-            # Run LangGraph reflection
-            result_text = run_porter_reflection(enhanced_journal_entry, log_data)
-
-            # Save Reflection to dedicated collection
-            mongo_storage = SovereignMongoStorage()
-            user_email = getattr(request, 'user_email', 'Hero')
-            user_doc = mongo_storage.get_user_by_email(user_email)
-            username = user_doc.get("username", "Hero") if user_doc else "Hero"
-            
-            reflection_id = mongo_storage.save_agent_reflection({
-                "day": day,
-                "user_id": username,
-                "reflection_text": result_text,
-                "metadata": {
-                    "source": "daily_recon",
-                    "timestamp": datetime.now().isoformat()
-                }
-            })
+            result_text, reflection_id = _reflect_and_save(
+                getattr(request, 'user_email', 'Hero'), journal_entry, log_data
+            )
 
             return jsonify({
                 "result": result_text,
@@ -534,6 +687,82 @@ def process_journal():
         logger.error(f"Error reading request data: {e}", exc_info=True)
         return jsonify({"error": str(e)}), 500
 
+@journal_bp.route('/process_journal/stream', methods=['POST', 'OPTIONS'])
+@require_api_key
+def process_journal_stream():
+    """
+    Streaming variant of /process_journal (Server-Sent Events).
+    Emits a `progress` event as each reflection stage completes, then a
+    `done` event with the result and reflection_id once it is saved.
+    """
+    parsed, error_resp = _parse_reflection_request()
+    if error_resp:
+        return error_resp
+
+    journal_entry, log_data = parsed
+    day = log_data.get('day', 'Unknown')
+    user_email = getattr(request, 'user_email', 'Hero')
+
+    def generate():
+        try:
+            result_text = ""
+            for event, payload in stream_porter_reflection(journal_entry, log_data):
+                if event == "done":
+                    result_text = payload
+                else:
+                    yield _sse("progress", {"stage": payload})
+
+            reflection_id = _save_daily_reflection(user_email, day, result_text)
+            yield _sse("done", {"result": result_text, "reflection_id": reflection_id})
+        except Exception as e:
+            logger.error(f"Backend Error during streamed reflection: {e}", exc_info=True)
+            yield _sse("error", {"error": str(e)})
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@journal_bp.route('/process_journal/jobs', methods=['POST', 'OPTIONS'])
+@require_api_key
+def submit_process_journal_job():
+    """
+    Background variant of /process_journal: queues the reflection and returns
+    202 with a job_id at once. Poll GET /process_journal/jobs/<job_id> for the result.
+    """
+    parsed, error_resp = _parse_reflection_request()
+    if error_resp:
+        return error_resp
+
+    journal_entry, log_data = parsed
+    job_id = _submit_reflection_job(getattr(request, 'user_email', 'Hero'), journal_entry, log_data)
+    logger.info(f"Queued reflection job {job_id} for {log_data.get('day', 'Unknown')}")
+
+    return jsonify({"job_id": job_id, "status": "pending"}), 202, {"Location": f"/process_journal/jobs/{job_id}"}
+
+@journal_bp.route('/process_journal/jobs/<job_id>', methods=['GET'])
+@require_api_key
+def get_process_journal_job(job_id):
+    """
+    Status of a background reflection job: `pending`, `done` (with result and
+    reflection_id) or `error`.
+    """
+    with _reflection_jobs_lock:
+        job = _reflection_jobs.get(job_id)
+    if job is None or job[0] != getattr(request, 'user_email', 'Hero'):
+        return jsonify({"error": "Unknown job"}), 404
+
+    future = job[1]
+    if not future.done():
+        return jsonify({"job_id": job_id, "status": "pending"})
+    try:
+        result_text, reflection_id = future.result()
+    except Exception as e:
+        logger.error(f"Reflection job {job_id} failed: {e}")
+        return jsonify({"job_id": job_id, "status": "error", "error": str(e)})
+    return jsonify({"job_id": job_id, "status": "done", "result": result_text, "reflection_id": reflection_id})
+
 @journal_bp.route('/api/journal/reflection', methods=['GET', 'OPTIONS'])
 @require_api_key
 def get_daily_reflection():
@@ -570,12 +799,13 @@ def edit_journal_event():
     if request.method == 'OPTIONS':
         return '', 204
     try:
-        data = request.get_json()
-        if not data or 'gcal_id' not in data or 'action' not in data:
+        try:
+            edit = EventEditSchema.model_validate(request.get_json())
+        except ValidationError:
             return jsonify({"error": "Missing required fields (gcal_id, action)"}), 400
 
-        action = data['action']
-        gcal_id = data['gcal_id']
+        action = edit.action
+        gcal_id = edit.gcal_id
         mongo = SovereignMongoStorage()
 
         if action == 'delete':
@@ -584,8 +814,8 @@ def edit_journal_event():
             return jsonify({"status": "success", "message": "Event permanently deleted from Mongo."})
 
         elif action == 'reclassify':
-            new_pillar = data.get('new_pillar')
-            event_title = data.get('summary')
+            new_pillar = edit.new_pillar
+            event_title = edit.summary
 
             if not new_pillar or not event_title:
                 return jsonify({"error": "reclassify requires 'new_pillar' and 'summary'."}), 400
@@ -19,6 +19,7 @@ class JournalRequestSchema(BaseModel):
 
 class CalendarRequestSchema(BaseModel):
     date: Optional[str] = None
+    force: bool = False
 
 class DailyReflectionLogData(BaseModel):
     day: str
@@ -26,3 +27,17 @@ class DailyReflectionLogData(BaseModel):
 class DailyReflectionRequestSchema(BaseModel):
     journal_entry: str = Field(..., max_length=15000)
     log_data: DailyReflectionLogData
+
+class WeeklyExpectationSchema(BaseModel):
+    week_start_date: str = Field(..., min_length=1)
+    expectation_text: str = Field(..., min_length=1)
+
+class FreeformJournalSchema(BaseModel):
+    date: str = Field(..., min_length=1)
+    text: str
+
+class EventEditSchema(BaseModel):
+    gcal_id: str
+    action: str
+    new_pillar: Optional[str] = None
+    summary: Optional[str] = None
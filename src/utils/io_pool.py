@@ -0,0 +1,14 @@
+"""
+Shared thread pool for blocking network I/O.
+
+Calendar lookups and other outbound calls spend their time waiting on the
+network, so the pool is sized for I/O concurrency (IO_WORKERS, default 20)
+rather than CPU count. Route handlers submit work here instead of each
+module spinning up its own executor.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+IO_WORKERS = int(os.getenv("IO_WORKERS", "20"))
+
+io_pool = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="io")
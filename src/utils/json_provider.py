@@ -0,0 +1,59 @@
+"""
+orjson-backed JSON provider for Flask.
+
+Swaps stdlib json for orjson on both request parsing (request.get_json) and
+response serialization (jsonify), which is several times faster for the
+reflection/log payloads. Output matches Flask's default provider: keys are
+sorted, and datetimes/dates still go through Flask's default handler (HTTP
+date format) so existing clients see identical bodies.
+
+dumps()/loads() give the same speedup outside a request (SSE frames, cache
+entries written from background threads).
+"""
+import json
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional: app falls back to Flask's stdlib provider
+    orjson = None
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    if orjson else 0
+)
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """DefaultJSONProvider with orjson doing the encoding and decoding."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return self._dump_bytes(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._dump_bytes(obj) + b"\n", mimetype=self.mimetype)
+
+    def _dump_bytes(self, obj) -> bytes:
+        return orjson.dumps(obj, default=self.default, option=_ORJSON_OPTIONS)
+
+
+def install_json_provider(app) -> None:
+    """Uses ORJSONProvider for the app when orjson is installed."""
+    if orjson is not None:
+        app.json = ORJSONProvider(app)
+
+
+def dumps(obj) -> str:
+    """Compact JSON text, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def loads(s):
+    return orjson.loads(s) if orjson is not None else json.loads(s)
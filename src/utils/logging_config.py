@@ -1,10 +1,14 @@
 import logging
+import os
 import sys
 from pathlib import Path
 
 # Resolve project root (three levels up from src/utils/logging_config.py)
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
+# Set LOG_LEVEL=WARNING in production to drop per-request INFO chatter.
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+
 def setup_logger(name: str) -> logging.Logger:
     """
     Creates and returns a configured logger for the given module name.
@@ -14,7 +18,7 @@ def setup_logger(name: str) -> logging.Logger:
 
     # Avoid adding multiple handlers if setup is called multiple times
     if not logger.handlers:
-        logger.setLevel(logging.INFO)
+        logger.setLevel(LOG_LEVEL)
 
         # Formatter: Timestamp - LoggerName - Level - Message
         formatter = logging.Formatter(
@@ -23,14 +27,14 @@ def setup_logger(name: str) -> logging.Logger:
 
         # Console Handler
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
+        console_handler.setLevel(LOG_LEVEL)
         console_handler.setFormatter(formatter)
         logger.addHandler(console_handler)
 
         # File Handler (project root)
         log_file = PROJECT_ROOT / "porter.log"
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setLevel(logging.INFO)
+        file_handler.setLevel(LOG_LEVEL)
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
 
@@ -1,6 +1,17 @@
+import importlib.util
 import os
+import sys
 
+import pytest
 
+# Make the project packages (src, rag_system) importable once per session when
+# pytest isn't run from an environment that already has them on sys.path.
+if importlib.util.find_spec("rag_system") is None:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Pin the HuggingFace cache to a fixed location (the library default) so CI can
+# restore downloaded model weights between runs instead of fetching them again.
+os.environ.setdefault("HF_HOME", os.path.join(os.path.expanduser("~"), ".cache", "huggingface"))
 
 # Mock critical environment variables for test collection so that top-level module imports
 # in app.py and LangChain don't crash when .env is missing (e.g. in GitHub Actions CI/CD).
@@ -8,3 +19,37 @@ os.environ.setdefault("PORTER_API_KEY", "dummy_test_porter_api_key")
 os.environ.setdefault("PORTER_ADMIN_KEY", "default_dev_key")
 os.environ.setdefault("JWT_SECRET", "dummy_test_jwt_secret_key")
 os.environ.setdefault("GROQ_API_KEY", "dummy_test_groq_api_key")
+# Don't import the agent stack in the background on every create_app() in tests
+os.environ.setdefault("PORTER_WARMUP", "0")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _tune_torch_threads():
+    """
+    Runs torch single-threaded: the tests encode a handful of sentences, where
+    thread-pool start-up and synchronisation cost more than the compute.
+    Only applies when collected tests already imported torch.
+    """
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        torch.set_num_threads(1)
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            # Can only be set before any inter-op parallel work has started
+            pass
+    yield
+
+
+def pytest_addoption(parser):
+    parser.addoption("--runslow", action="store_true", default=False,
+                     help="also run tests marked slow (real transformer models)")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="need --runslow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
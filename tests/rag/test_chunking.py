@@ -2,11 +2,13 @@
 Unit tests for chunking strategies.
 """
 
+import hashlib
+import importlib.util
+from unittest.mock import MagicMock, patch
 
-# Add project root to Python path
-
-
+import numpy as np
 import pytest
+from rag_system.pipeline.data_pipeline import chunking
 from rag_system.pipeline.data_pipeline.chunking import (
     FixedSizeChunking,
     FastSemanticChunking,
@@ -14,98 +16,181 @@ from rag_system.pipeline.data_pipeline.chunking import (
     DocumentChunker
 )
 
+
+TEXT_A400 = "A " * 200  # Longer than the 100-char chunk_size used below
+TEXT_A300 = "A " * 150
+TEXT_B300 = "B " * 150
+
+SECTIONS = (
+    {'header': 'Introduction', 'content': TEXT_A300},
+    {'header': 'Methodology', 'content': TEXT_B300},
+)
+
+FAST_TEXT = """
+    This is the first sentence. This is the second sentence.
+    This is the third sentence. This is the fourth sentence.
+    This is the fifth sentence. This is the sixth sentence.
+    """
+
+# Embeddings of every sentence the MiniLM tests chunk, keyed by _sentence_key
+SENTENCE_CACHE: dict[str, np.ndarray] = {}
+
+def _sentence_key(sentence):
+    return hashlib.blake2b(" ".join(sentence.split()).encode()).hexdigest()
+
+# Loading a transformer dominates these tests, so each model is loaded once per session.
+@pytest.fixture(scope="session")
+def fast_semantic_chunker():
+    """MiniLM chunker whose encode() serves the test sentences from SENTENCE_CACHE."""
+    chunker = FastSemanticChunking(
+        model_name="all-MiniLM-L6-v2",
+        chunk_size=500,
+        similarity_threshold=0.3
+    )
+    encode = chunker.model.encode
+    sentences = chunker._split_sentences(FAST_TEXT)
+    for sentence, embedding in zip(sentences, encode(sentences, show_progress_bar=False)):
+        SENTENCE_CACHE[_sentence_key(sentence)] = embedding
+
+    def cached_encode(sents, **kwargs):
+        keys = [_sentence_key(s) for s in sents]
+        if all(key in SENTENCE_CACHE for key in keys):
+            return np.stack([SENTENCE_CACHE[key] for key in keys])
+        return encode(sents, **kwargs)
+
+    chunker.model.encode = cached_encode
+    return chunker
+
+SCIENCE_TEXT = """
+    Reinforcement learning is a type of machine learning. 
+    The agent learns through interaction with the environment.
+    Q-learning is a model-free algorithm. 
+    Policy gradients optimize the policy directly.
+    """
+
+def _fake_encode(sentences):
+    """Deterministic stand-in for the SciBERT forward pass."""
+    return np.random.RandomState(0).rand(len(sentences), 32).astype("float32")
+
+@pytest.fixture(scope="session")
+def sci_semantic_chunker():
+    """SciBERT chunker with the encoder stubbed; the similarity logic still runs for real."""
+    with patch.object(ScienceDetailSemanticChunking, "_load_model"):
+        chunker = ScienceDetailSemanticChunking(
+            model_name="allenai/scibert_scivocab_uncased",
+            chunk_size=500,
+            similarity_threshold=0.3
+        )
+    chunker._encode_sentences = _fake_encode
+    return chunker
+
+@pytest.fixture(scope="session")
+def fixed_chunker():
+    return FixedSizeChunking(chunk_size=100, overlap=20)
+
+@pytest.fixture(scope="session")
+def make_doc_chunker():
+    """Returns a DocumentChunker over FixedSizeChunking, cached per (chunk_size, overlap)."""
+    cache = {}
+
+    def _make(chunk_size=1000, overlap=200):
+        key = (chunk_size, overlap)
+        if key not in cache:
+            cache[key] = DocumentChunker(FixedSizeChunking(chunk_size, overlap))
+        return cache[key]
+    return _make
+
+@pytest.fixture
+def chunker(request):
+    """The session-cached chunker named by the test's parameter."""
+    return request.getfixturevalue(request.param)
+
 def test_fixed_size_chunking_initialization():
     """Test FixedSizeChunking initialization."""
     chunker = FixedSizeChunking(chunk_size=1000, overlap=200)
     assert chunker.chunk_size == 1000
     assert chunker.overlap == 200
 
-def test_fixed_size_chunking_basic():
-    """Test basic fixed-size chunking."""
-    chunker = FixedSizeChunking(chunk_size=100, overlap=20)
-
-    text = "A " * 200  # Create text longer than chunk_size
+@pytest.mark.parametrize("chunker, text, expected_key", [
+    ("fixed_chunker", TEXT_A400, 'chunk_index'),
+    pytest.param("fast_semantic_chunker", FAST_TEXT, 'num_sentences', marks=pytest.mark.slow),
+    ("sci_semantic_chunker", SCIENCE_TEXT, 'num_sentences'),
+], ids=["fixed", "fast_sem", "sci_sem"], indirect=["chunker"])
+def test_chunking_basic(chunker, text, expected_key):
+    """Test basic chunking for each strategy."""
     chunks = chunker.chunk(text)
 
     assert len(chunks) > 0
-    assert all('text' in chunk for chunk in chunks)
-    assert all('chunk_index' in chunk for chunk in chunks)
+    for chunk in chunks:
+        assert 'text' in chunk and expected_key in chunk
 
 def test_fixed_size_chunking_with_metadata():
     """Test fixed-size chunking with metadata."""
     chunker = FixedSizeChunking(chunk_size=100, overlap=20)
 
-    text = "A " * 200
     metadata = {'title': 'Test Paper', 'section_header': 'Introduction'}
 
-    chunks = chunker.chunk(text, metadata=metadata)
+    chunks = chunker.chunk(TEXT_A400, metadata=metadata)
 
     assert len(chunks) > 0
-    assert all('metadata' in chunk for chunk in chunks)
-    assert all(chunk['metadata']['title'] == 'Test Paper' for chunk in chunks)
+    for chunk in chunks:
+        assert 'text' in chunk and 'metadata' in chunk
+        assert chunk['metadata']['title'] == 'Test Paper'
 
-def test_fast_semantic_chunking_initialization():
+def _assert_semantic_init(chunker, model_name):
+    assert chunker.model_name == model_name
+    assert chunker.chunk_size == 1000
+    assert chunker.similarity_threshold == 0.5
+
+@patch("rag_system.pipeline.data_pipeline.chunking.SentenceTransformer", autospec=True)
+def test_fast_semantic_chunking_initialization(mock_st):
     """Test FastSemanticChunking initialization."""
     chunker = FastSemanticChunking(
         model_name="all-MiniLM-L6-v2",
         chunk_size=1000,
         similarity_threshold=0.5
     )
-    assert chunker.model_name == "all-MiniLM-L6-v2"
-    assert chunker.chunk_size == 1000
-    assert chunker.similarity_threshold == 0.5
+    _assert_semantic_init(chunker, "all-MiniLM-L6-v2")
+    mock_st.assert_called_once_with("all-MiniLM-L6-v2")
 
-def test_fast_semantic_chunking_basic():
-    """Test basic fast semantic chunking."""
-    chunker = FastSemanticChunking(
-        model_name="all-MiniLM-L6-v2",
-        chunk_size=500,
-        similarity_threshold=0.3
-    )
+def test_fast_semantic_chunking_encodes_in_one_batch(monkeypatch):
+    """All sentences go to the model in a single encode() call, so SentenceTransformer
+    can length-sort and batch them itself instead of running one forward pass each."""
+    model = MagicMock()
+    model.encode.side_effect = lambda sents, **kwargs: np.ones((len(sents), 4), dtype="float32")
+    monkeypatch.setattr(chunking, "SentenceTransformer", lambda model_name: model)
+    chunker = FastSemanticChunking(chunk_size=500, similarity_threshold=0.3)
 
-    text = """
-    This is the first sentence. This is the second sentence.
-    This is the third sentence. This is the fourth sentence.
-    This is the fifth sentence. This is the sixth sentence.
-    """
+    chunker.chunk(FAST_TEXT)
 
-    chunks = chunker.chunk(text)
+    model.encode.assert_called_once()
+    assert model.encode.call_args.args[0] == chunker._split_sentences(FAST_TEXT)
 
-    assert len(chunks) > 0
-    assert all('text' in chunk for chunk in chunks)
-    assert all('num_sentences' in chunk for chunk in chunks)
-
-def test_science_detail_semantic_chunking_initialization():
+@patch.object(ScienceDetailSemanticChunking, "_load_model", autospec=True)
+def test_science_detail_semantic_chunking_initialization(mock_load):
     """Test ScienceDetailSemanticChunking initialization."""
     chunker = ScienceDetailSemanticChunking(
         model_name="allenai/scibert_scivocab_uncased",
         chunk_size=1000,
         similarity_threshold=0.5
     )
-    assert chunker.model_name == "allenai/scibert_scivocab_uncased"
-    assert chunker.chunk_size == 1000
-    assert chunker.similarity_threshold == 0.5
+    _assert_semantic_init(chunker, "allenai/scibert_scivocab_uncased")
+    mock_load.assert_called_once_with(chunker)
 
-def test_science_detail_semantic_chunking_basic():
-    """Test basic science detail semantic chunking."""
+@pytest.mark.slow
+def test_science_detail_semantic_chunking_real_model():
+    """Same as the basic test, but with the real SciBERT model."""
     chunker = ScienceDetailSemanticChunking(
         model_name="allenai/scibert_scivocab_uncased",
         chunk_size=500,
         similarity_threshold=0.3
     )
 
-    text = """
-    Reinforcement learning is a type of machine learning. 
-    The agent learns through interaction with the environment.
-    Q-learning is a model-free algorithm. 
-    Policy gradients optimize the policy directly.
-    """
-
-    chunks = chunker.chunk(text)
+    chunks = chunker.chunk(SCIENCE_TEXT)
 
     assert len(chunks) > 0
-    assert all('text' in chunk for chunk in chunks)
-    assert all('num_sentences' in chunk for chunk in chunks)
+    for chunk in chunks:
+        assert 'text' in chunk and 'num_sentences' in chunk
 
 def test_document_chunker_initialization():
     """Test DocumentChunker initialization."""
@@ -113,20 +198,22 @@ def test_document_chunker_initialization():
     chunker = DocumentChunker(strategy)
     assert chunker.strategy == strategy
 
-def test_document_chunker_with_sections():
-    """Test DocumentChunker with section structure."""
-    strategy = FixedSizeChunking(chunk_size=100, overlap=20)
-    chunker = DocumentChunker(strategy)
+def test_document_chunker_factory_reuses_instances(make_doc_chunker):
+    """The factory fixture hands back the same chunker for the same settings."""
+    chunker = make_doc_chunker(100, 20)
+    assert make_doc_chunker(100, 20) is chunker
+    assert make_doc_chunker() is not chunker
+    assert chunker.strategy.chunk_size == 100
+    assert chunker.strategy.overlap == 20
 
-    sections = [
-        {'header': 'Introduction', 'content': 'A ' * 150},
-        {'header': 'Methodology', 'content': 'B ' * 150}
-    ]
+def test_document_chunker_with_sections(make_doc_chunker):
+    """Test DocumentChunker with section structure."""
+    chunker = make_doc_chunker(chunk_size=100, overlap=20)
 
     chunks = chunker.chunk_document(
         text="",
         title="Test Paper",
-        sections=sections
+        sections=SECTIONS  # Only read by chunk_document, so the shared tuple is passed as-is
     )
 
     assert len(chunks) > 0
@@ -134,5 +221,8 @@ def test_document_chunker_with_sections():
     assert any('Introduction' in chunk.get('text', '') for chunk in chunks)
 
 if __name__ == "__main__":
-    # Run tests when executed directly
-    pytest.main([__file__, "-v"])
+    # Run tests when executed directly, spread across cores if pytest-xdist is installed
+    args = [__file__, "-v"]
+    if importlib.util.find_spec("xdist"):
+        args += ["-n", "auto"]
+    pytest.main(args)
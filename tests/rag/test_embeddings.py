@@ -7,7 +7,8 @@ Unit tests for embedding system.
 
 
 import numpy as np
-from rag_system.rag_core.embeddings import SciBERTEmbedder
+from unittest.mock import patch
+from rag_system.rag_core.embeddings import SciBERTEmbedder, get_embedder
 
 def test_scibert_embedder_initialization():
     """Test SciBERTEmbedder initialization."""
@@ -65,3 +66,16 @@ def test_get_embedding_dim():
     # SciBERT should have 768 dimensions
     assert dim == 768
 
+
+def test_get_embedder_returns_shared_instance():
+    """Test that get_embedder reuses one embedder per model/device pair."""
+    with patch('rag_system.rag_core.embeddings.SciBERTEmbedder') as mock_cls:
+        get_embedder.cache_clear()
+        try:
+            first = get_embedder("test-model", "cpu")
+            second = get_embedder("test-model", "cpu")
+        finally:
+            get_embedder.cache_clear()
+
+    assert first is second
+    mock_cls.assert_called_once_with("test-model", "cpu")
@@ -10,6 +10,7 @@ import pytest
 from fastapi.testclient import TestClient
 from rag_system.rag_service import app
 import os
+from unittest.mock import MagicMock, patch
 
 @pytest.fixture
 def client():
@@ -31,6 +32,22 @@ def test_health_endpoint(client):
     data = response.json()
     assert "status" in data
 
+def test_health_endpoint_caches_payload(client):
+    """Test that repeat health probes within the TTL reuse the cached payload."""
+    from rag_system.rag_service import _health_cache
+
+    vector_store = MagicMock()
+    vector_store.get_collection_size.return_value = 7
+    with patch.dict(_health_cache, {'ts': 0.0, 'payload': None}), \
+            patch('rag_system.rag_service.get_vector_store', return_value=vector_store):
+        first = client.get("/health")
+        second = client.get("/health")
+
+    assert first.json()["vector_store_size"] == 7
+    assert second.json() == first.json()
+    assert second.headers["Cache-Control"] == "max-age=1"
+    vector_store.get_collection_size.assert_called_once()
+
 def test_query_endpoint_missing_key(client):
     """Test query endpoint with missing query."""
     response = client.post("/query", json={})
@@ -79,3 +96,88 @@ def test_query_request_model():
     request = QueryRequest(query="Test query")
     assert request.top_k == 5
 
+
+def test_query_endpoint_rejects_blank_and_oversized_queries(client):
+    """Test that empty/whitespace-only and oversized queries are rejected before the pipeline runs."""
+    from rag_system.rag_service import MAX_QUERY_LENGTH
+
+    response = client.post("/query", json={"query": "   "})
+    assert response.status_code == 422
+
+    response = client.post("/query", json={"query": "x" * (MAX_QUERY_LENGTH + 1)})
+    assert response.status_code == 422
+
+def test_query_endpoint_trivial_query(client):
+    """Test that trivial queries are answered without invoking the query engine."""
+    with patch('rag_system.rag_service.get_query_engine') as mock_get_engine:
+        response = client.post("/query", json={"query": "  test  "})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["query"] == "test"
+    assert data["sources"] == []
+    assert data["retrieved_chunks_count"] == 0
+    mock_get_engine.assert_not_called()
+
+def test_query_endpoint_omits_chunks_by_default(client):
+    """Test that retrieved chunks are only serialized when include_chunks is set."""
+    engine = MagicMock()
+    engine.answer_question.return_value = {
+        'answer': 'RL is learning from rewards.',
+        'sources': [],
+        'retrieved_chunks': [{'text': 'chunk', 'metadata': {}, 'distance': 0.1, 'id': 'chunk_0'}],
+        'n_chunks': 1
+    }
+    vector_store = MagicMock()
+    vector_store.get_collection_size.return_value = 1
+    with patch('rag_system.rag_service.get_query_engine', return_value=engine), \
+            patch('rag_system.rag_service.get_vector_store', return_value=vector_store):
+
+        response = client.post("/query", json={"query": "What is RL?"})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["retrieved_chunks_count"] == 1
+        assert "retrieved_chunks" not in data
+
+        response = client.post("/query", json={"query": "What is RL?", "include_chunks": True})
+        assert response.status_code == 200
+        assert len(response.json()["retrieved_chunks"]) == 1
+
+def test_get_query_engine_reuses_shared_instance():
+    """Test that the query engine is built once and shared across requests."""
+    from rag_system.rag_service import app, get_query_engine
+
+    with patch.object(app.state, 'query_engine', None, create=True), \
+            patch.object(app.state, 'vector_store', MagicMock(), create=True), \
+            patch('rag_system.rag_service.get_embedder'), \
+            patch('rag_system.rag_service.RAGQueryEngine') as mock_engine_cls:
+        first = get_query_engine()
+        second = get_query_engine()
+
+    assert first is second
+    mock_engine_cls.assert_called_once()
+
+def test_query_endpoint_caches_retrieval(client):
+    """Test that repeat queries reuse cached retrieval results until the cache is cleared."""
+    from rag_system.rag_service import _cached_retrieve
+
+    engine = MagicMock()
+    engine.retrieve.return_value = [{'text': 'chunk', 'metadata': {}, 'distance': 0.1, 'id': 'chunk_0'}]
+    engine.answer_question.return_value = {'answer': 'answer', 'sources': [], 'retrieved_chunks': [], 'n_chunks': 1}
+    vector_store = MagicMock()
+    vector_store.get_collection_size.return_value = 1
+
+    _cached_retrieve.cache_clear()
+    with patch('rag_system.rag_service.get_query_engine', return_value=engine), \
+            patch('rag_system.rag_service.get_vector_store', return_value=vector_store):
+        client.post("/query", json={"query": "What is PPO?"})
+        client.post("/query", json={"query": "What is PPO?"})
+        assert engine.retrieve.call_count == 1
+        assert engine.answer_question.call_count == 2
+
+        response = client.post("/cache/clear")
+        assert response.status_code == 200
+        assert response.json()["entries_cleared"] == 1
+
+        client.post("/query", json={"query": "What is PPO?"})
+        assert engine.retrieve.call_count == 2
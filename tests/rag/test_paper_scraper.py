@@ -0,0 +1,139 @@
+"""
+Unit tests for the arxiv paper scraper's lookups and conditional re-downloads.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import arxiv
+from rag_system.pipeline.data_pipeline.paper_scraper import PaperScraper
+
+ARXIV_ID = "1707.06347v2"
+
+
+def _scraper_with_stored_pdf(tmp_path):
+    """A scraper whose metadata already holds ARXIV_ID, with its PDF on disk."""
+    papers_dir = tmp_path / "papers"
+    papers_dir.mkdir()
+    pdf_path = papers_dir / f"{ARXIV_ID}.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4 original")
+    metadata_file = tmp_path / "papers_metadata.json"
+    metadata_file.write_text(json.dumps([{
+        'arxiv_id': ARXIV_ID,
+        'title': 'Proximal Policy Optimization Algorithms',
+        'pdf_path': str(pdf_path),
+        'etag': '"abc123"',
+        'last_modified': 'Mon, 28 Aug 2017 00:00:00 GMT',
+    }]))
+    return PaperScraper(papers_dir=str(papers_dir), metadata_file=str(metadata_file)), pdf_path
+
+
+def _session_returning(response):
+    request = MagicMock()
+    request.__aenter__.return_value = response
+    session = MagicMock()
+    session.get.return_value = request
+    return session
+
+
+def _not_modified_session():
+    return _session_returning(MagicMock(status=304, headers={}))
+
+
+def _updated_pdf_response(body_chunks, fail_after_body=False):
+    """A 200 response with a new ETag whose body stream can break part-way."""
+    async def iter_chunked(size):
+        for chunk in body_chunks:
+            yield chunk
+        if fail_after_body:
+            raise aiohttp.ClientError("Connection reset by peer")
+
+    response = MagicMock(status=200, headers={'ETag': '"new456"'})
+    response.content.iter_chunked = iter_chunked
+    return response
+
+
+def test_refresh_sends_validators_and_keeps_unchanged_pdf(tmp_path):
+    """A refresh re-requests known papers conditionally; a 304 adds no duplicate record."""
+    scraper, pdf_path = _scraper_with_stored_pdf(tmp_path)
+    session = _not_modified_session()
+    paper = MagicMock(title='Proximal Policy Optimization Algorithms')
+    paper.get_short_id.return_value = ARXIV_ID
+
+    async def fake_fetch_and_download(ids):
+        assert "1707.06347" in ids  # Known IDs are no longer filtered out on refresh
+        return [(paper, ARXIV_ID, await scraper._download_pdf_async(session, paper, ARXIV_ID))]
+
+    scraper._fetch_and_download_async = fake_fetch_and_download
+
+    downloaded = scraper.get_foundational_rl_papers(refresh=True)
+
+    headers = session.get.call_args.kwargs['headers']
+    assert headers['If-None-Match'] == '"abc123"'
+    assert headers['If-Modified-Since'] == 'Mon, 28 Aug 2017 00:00:00 GMT'
+    assert downloaded == []
+    assert len(scraper.metadata) == 1
+    assert pdf_path.read_bytes() == b"%PDF-1.4 original"
+
+
+def test_known_papers_are_skipped_without_refresh(tmp_path):
+    """Without refresh, papers already on disk are not requested again."""
+    scraper, _ = _scraper_with_stored_pdf(tmp_path)
+    requested = []
+
+    async def fake_fetch_and_download(ids):
+        requested.extend(ids)
+        return []
+
+    scraper._fetch_and_download_async = fake_fetch_and_download
+
+    scraper.get_foundational_rl_papers()
+
+    assert "1707.06347" not in requested
+
+
+def test_refresh_that_fails_mid_stream_keeps_the_original_pdf(tmp_path):
+    """A broken download must not truncate the stored PDF or record the new validators."""
+    scraper, pdf_path = _scraper_with_stored_pdf(tmp_path)
+    session = _session_returning(_updated_pdf_response([b"%PDF-1.5 partial"], fail_after_body=True))
+    paper = MagicMock(title='Proximal Policy Optimization Algorithms')
+
+    result = asyncio.run(scraper._download_pdf_async(session, paper, ARXIV_ID))
+
+    assert result is None
+    assert pdf_path.read_bytes() == b"%PDF-1.4 original"
+    assert not pdf_path.with_suffix('.pdf.part').exists()
+    assert ARXIV_ID not in scraper._pdf_validators
+
+
+def test_completed_refresh_replaces_the_pdf_and_records_validators(tmp_path):
+    scraper, pdf_path = _scraper_with_stored_pdf(tmp_path)
+    session = _session_returning(_updated_pdf_response([b"%PDF-1.5 ", b"updated"]))
+    paper = MagicMock(title='Proximal Policy Optimization Algorithms')
+
+    result = asyncio.run(scraper._download_pdf_async(session, paper, ARXIV_ID))
+
+    assert result == pdf_path
+    assert pdf_path.read_bytes() == b"%PDF-1.5 updated"
+    assert not pdf_path.with_suffix('.pdf.part').exists()
+    assert scraper._pdf_validators[ARXIV_ID] == {'etag': '"new456"'}
+
+
+def test_rate_limited_lookup_retries_once_per_attempt(tmp_path):
+    """Only _fetch_papers_with_retry retries; the arxiv client itself never does."""
+    scraper, _ = _scraper_with_stored_pdf(tmp_path)
+    paper = MagicMock()
+    scraper.arxiv_client = MagicMock()
+    scraper.arxiv_client.results.side_effect = [
+        arxiv.HTTPError("https://export.arxiv.org/api/query", 0, 429),
+        iter([paper]),
+    ]
+
+    with patch("asyncio.sleep", new_callable=AsyncMock) as sleep:
+        results = asyncio.run(scraper._fetch_papers_with_retry(["1707.06347"]))
+
+    assert results == [paper]
+    assert scraper.arxiv_client.results.call_count == 2
+    assert any(1 <= call.args[0] <= 2 for call in sleep.await_args_list)  # First backoff step
@@ -6,9 +6,23 @@ Unit tests for PDF extraction module.
 # Add project root to Python path
 
 
+from unittest.mock import MagicMock, patch
+
 import pytest
+from rag_system.pipeline.data_pipeline import pdf_extractor
 from rag_system.pipeline.data_pipeline.pdf_extractor import PDFExtractor
 
+def _fake_pdf(tmp_path, text):
+    """A PDF path on disk plus a stand-in PyMuPDF document with one page of text."""
+    pdf_path = tmp_path / "paper.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+    page = MagicMock()
+    page.get_text.return_value = text
+    doc = MagicMock(metadata={})
+    doc.__len__.return_value = 1
+    doc.__getitem__.return_value = page
+    return pdf_path, doc
+
 def test_pdf_extractor_initialization():
     """Test PDFExtractor initialization."""
     extractor = PDFExtractor()
@@ -78,3 +92,45 @@ def test_extract_batch():
     assert len(results) == 2
     assert all('error' in r for r in results)
 
+def test_extracted_text_is_written_in_background(tmp_path):
+    """close() waits for the background write, which lands atomically via a .tmp file."""
+    extractor = PDFExtractor(output_dir=str(tmp_path / "out"))
+    pdf_path, doc = _fake_pdf(tmp_path, "Hello world.")
+
+    with patch.object(extractor, '_open_pdf', return_value=(doc, None)):
+        extractor.extract_text(str(pdf_path))
+    failures = extractor.close()
+
+    assert failures == {}
+    assert (tmp_path / "out" / "paper.txt").read_text() == "Hello world.\n\n"
+    assert not (tmp_path / "out" / "paper.txt.tmp").exists()
+
+def test_extract_batch_reports_failed_writes(tmp_path):
+    """A text file that can't be written turns the batch result into an error."""
+    extractor = PDFExtractor(output_dir=str(tmp_path / "out"))
+    pdf_path, doc = _fake_pdf(tmp_path, "Hello world.")
+
+    with patch.object(extractor, '_open_pdf', return_value=(doc, None)), \
+            patch.object(pdf_extractor.os, 'replace', side_effect=OSError("No space left on device")):
+        results = extractor.extract_batch([str(pdf_path)], num_workers=1)
+
+    assert 'No space left on device' in results[0]['error']
+    assert not (tmp_path / "out" / "paper.txt").exists()
+    assert not (tmp_path / "out" / "paper.txt.tmp").exists()
+
+def test_open_pdf_reads_from_memory_map(tmp_path):
+    """The document is opened from the mapped file, not re-read by path."""
+    extractor = PDFExtractor(output_dir=str(tmp_path / "out"))
+    pdf_path = tmp_path / "paper.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4 mapped")
+
+    with patch.object(pdf_extractor.fitz, 'open') as fitz_open:
+        doc, mapped = extractor._open_pdf(pdf_path)
+
+    assert mapped is not None
+    stream = fitz_open.call_args.kwargs['stream']
+    assert isinstance(stream, memoryview)
+    assert bytes(stream) == b"%PDF-1.4 mapped"
+    underlying = mapped.obj
+    extractor._release_map(mapped)
+    assert underlying.closed
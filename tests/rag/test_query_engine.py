@@ -9,10 +9,17 @@ Unit tests for RAG query engine.
 import pytest
 import os
 from unittest.mock import Mock, patch
-from rag_system.rag_core.query_engine import RAGQueryEngine
+from rag_system.rag_core.query_engine import RAGQueryEngine, get_llm
 from rag_system.rag_core.vector_store import VectorStore
 from rag_system.rag_core.embeddings import SciBERTEmbedder
 
+@pytest.fixture(autouse=True)
+def clear_llm_cache():
+    """Keep patched ChatGroq instances from leaking between tests via get_llm."""
+    get_llm.cache_clear()
+    yield
+    get_llm.cache_clear()
+
 @pytest.fixture
 def mock_vector_store():
     """Create a mock vector store."""
@@ -122,3 +129,11 @@ def test_extract_sources(mock_vector_store, mock_embedder):
         assert len(sources) > 0
         assert sources[0]['paper_title'] == 'Paper 1'
 
+def test_engines_share_llm_client(mock_vector_store, mock_embedder):
+    """Test that engines for the same model reuse one ChatGroq client."""
+    with patch('rag_system.rag_core.query_engine.ChatGroq') as mock_chat:
+        first = RAGQueryEngine(vector_store=mock_vector_store, embedder=mock_embedder)
+        second = RAGQueryEngine(vector_store=mock_vector_store, embedder=mock_embedder)
+
+        assert first.llm is second.llm
+        mock_chat.assert_called_once()
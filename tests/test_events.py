@@ -5,13 +5,8 @@ Validates Redis publish behavior including serialization,
 graceful degradation when Redis is unavailable, and stream formatting.
 """
 import json
-import os
-import sys
 from unittest.mock import patch, MagicMock
 
-
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
 from src.events.publisher import (
     publish_journal_event,
     ensure_consumer_group,
@@ -4,14 +4,9 @@ Tests for the centralized LLM Resilience Factory.
 Validates that get_resilient_llm() returns a properly configured
 three-tier fallback chain with circuit breaking.
 """
-import os
-import sys
 from unittest.mock import patch, MagicMock
 
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-
 class TestGetResilientLLM:
     """Tests for the get_resilient_llm factory."""
 
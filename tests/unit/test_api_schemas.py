@@ -1,6 +1,6 @@
 import pytest
 from pydantic import ValidationError
-from src.schemas.api_models import JournalRequestSchema, CalendarRequestSchema
+from src.schemas.api_models import JournalRequestSchema, CalendarRequestSchema, WeeklyExpectationSchema, EventEditSchema
 
 def test_valid_journal_request():
     payload = {
@@ -34,3 +34,11 @@ def test_valid_calendar_request():
 def test_empty_calendar_request():
     req = CalendarRequestSchema()
     assert req.date is None
+
+def test_weekly_expectation_rejects_empty_text():
+    with pytest.raises(ValidationError):
+        WeeklyExpectationSchema(week_start_date="2026-07-13", expectation_text="")
+
+def test_event_edit_optional_fields_default_to_none():
+    edit = EventEditSchema.model_validate({"gcal_id": "abc", "action": "delete"})
+    assert edit.new_pillar is None and edit.summary is None
@@ -0,0 +1,126 @@
+import pytest
+
+from src.integrations import calendar_parser
+
+# Pillar, subcategory and keyword order all matter: the first match in mapping order wins.
+MAPPING = {
+    "colors": {
+        "6": ("Professional", "Prof-extended"),  # exact subcategory
+        "10": "Health",                          # single pillar
+        "8": ["Personal", "Health"],             # shared colour: keywords limited to these pillars
+        "1": "Uncategorized",                    # falls through to keywords
+    },
+    "actual_categorization_with_keywords": {
+        "Professional": {"Meetings": ["standup", "sync"], "Deep Work": ["coding"]},
+        "Health": {"Exercise": ["gym", "run"], "Recovery": ["sync", "nap"]},
+        "Personal": {"Social": ["dinner", "run"]},
+    },
+}
+
+
+@pytest.fixture(autouse=True)
+def category_mapping(monkeypatch):
+    monkeypatch.setattr(calendar_parser, "get_category_mapping", lambda: MAPPING)
+
+
+@pytest.mark.parametrize("title, color_id, expected", [
+    # Colour hits win over keywords
+    ("Coding session", "6", ("Professional", "Prof-extended")),
+    ("Coding session", "10", ("Health", "General")),
+    # A shared colour only considers its own pillars, in mapping order
+    ("Team sync", "8", ("Health", "Recovery")),
+    ("Morning run", "8", ("Health", "Exercise")),
+    ("Coding session", "8", ("Uncategorized", "General")),
+    # "Uncategorized" and unknown colours fall back to keywords
+    ("Coding session", "1", ("Professional", "Deep Work")),
+    # Overlapping keywords: earlier pillar, then earlier subcategory, wins
+    ("Team sync", "99", ("Professional", "Meetings")),
+    ("Morning run", "99", ("Health", "Exercise")),
+    ("coding before standup", "99", ("Professional", "Meetings")),
+    # Matching is case-insensitive on the title
+    ("GYM", "99", ("Health", "Exercise")),
+    # No colour and no keyword match
+    ("Lunch", "99", ("Uncategorized", "General")),
+    ("", "Default", ("Uncategorized", "General")),
+])
+def test_determine_category(title, color_id, expected):
+    result = calendar_parser.determine_category(title, color_id)
+    assert (result["pillar"], result["subcategory"]) == expected
+
+
+def test_determine_category_picks_up_a_reloaded_mapping(monkeypatch):
+    """The compiled keyword index is rebuilt when a new mapping object is loaded."""
+    assert calendar_parser.determine_category("Nap", "99")["pillar"] == "Health"
+
+    reloaded = {
+        "colors": {},
+        "actual_categorization_with_keywords": {"Personal": {"Rest": ["nap"]}},
+    }
+    monkeypatch.setattr(calendar_parser, "get_category_mapping", lambda: reloaded)
+
+    assert calendar_parser.determine_category("Nap", "99") == {"pillar": "Personal", "subcategory": "Rest"}
+
+
+RAW_EVENTS = [
+    {
+        "id": "evt1",
+        "summary": "Team sync",
+        "description": "Zoom link",
+        "colorId": "99",
+        "start": {"dateTime": "2026-07-14T09:00:00+00:00"},
+        "end": {"dateTime": "2026-07-14T09:30:00+00:00"},
+        "updated": "2026-07-13T12:00:00+00:00",
+    },
+    {
+        "id": "evt2",
+        "summary": "Gym",
+        "colorId": "10",
+        "start": {"dateTime": "2026-07-14T18:00:00+00:00"},
+        "end": {"dateTime": "2026-07-14T19:15:00+00:00"},
+        "updated": "2026-07-14T19:20:00+00:00",
+    },
+    # All-day events are skipped
+    {"id": "evt3", "summary": "Holiday", "start": {"date": "2026-07-14"}, "end": {"date": "2026-07-15"}},
+]
+
+
+def test_intention_to_dict_keeps_the_golden_object_layout():
+    """Intention.to_dict() reproduces the nested dict parse_calendar_to_intentions used to return."""
+    intentions = calendar_parser.parse_calendar_to_intentions(RAW_EVENTS)
+
+    assert len(intentions) == 2
+    assert intentions[0].to_dict() == {
+        "source_id": "evt1",
+        "title": "Team sync",
+        "context_notes": "Zoom link",
+        "timing": {
+            "start_iso": "2026-07-14T09:00:00+00:00",
+            "end_iso": "2026-07-14T09:30:00+00:00",
+            "duration_minutes": 30,
+            "time_chunk": "Late Morning"
+        },
+        "meta": {
+            "pillar": "Professional",
+            "subcategory": "Meetings",
+            "record_type": "Intention",
+            "google_color_id": "99",
+            "is_processed": False
+        }
+    }
+
+
+def test_intentions_to_arrays():
+    intentions = calendar_parser.parse_calendar_to_intentions(RAW_EVENTS)
+
+    columns = calendar_parser.intentions_to_arrays(intentions)
+
+    assert list(columns) == list(calendar_parser.Intention._fields)
+    assert columns["source_id"] == ["evt1", "evt2"]
+    assert columns["duration_minutes"] == [30, 75]
+    assert columns["pillar"] == ["Professional", "Health"]
+    assert columns["record_type"] == ["Intention", "Actual"]
+    assert columns["is_processed"] == [False, False]
+
+
+def test_intentions_to_arrays_empty():
+    assert calendar_parser.intentions_to_arrays([]) == {field: [] for field in calendar_parser.Intention._fields}
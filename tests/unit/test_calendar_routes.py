@@ -0,0 +1,185 @@
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.routes import calendar_routes
+
+
+def setup_function():
+    calendar_routes._events_cache.clear()
+    calendar_routes._refreshing.clear()
+    calendar_routes._cache_generations.clear()
+    calendar_routes._shared_redis = None
+    calendar_routes._shared_redis_checked = True
+
+
+@patch('src.routes.calendar_routes._request_calendar_events')
+def test_fetch_calendar_events_is_cached_per_date(mock_request):
+    """Repeated lookups for the same user and date hit Google only once."""
+    mock_request.return_value = [{"summary": "Standup"}]
+
+    first = calendar_routes.fetch_calendar_events_for_date("2026-07-14", "a@test.com")
+    second = calendar_routes.fetch_calendar_events_for_date("2026-07-14", "a@test.com")
+
+    assert first == second == [{"summary": "Standup"}]
+    assert mock_request.call_count == 1
+
+    calendar_routes.fetch_calendar_events_for_date("2026-07-14", "a@test.com", use_cache=False)
+    assert mock_request.call_count == 2
+
+
+@patch('src.routes.calendar_routes._request_calendar_events')
+def test_fetch_calendar_events_does_not_cache_failures(mock_request):
+    mock_request.side_effect = [RuntimeError("boom"), [{"summary": "Gym"}]]
+
+    assert calendar_routes.fetch_calendar_events_for_date("2026-07-15") == []
+    assert calendar_routes.fetch_calendar_events_for_date("2026-07-15") == [{"summary": "Gym"}]
+
+
+@patch('src.routes.calendar_routes.io_pool')
+@patch('src.routes.calendar_routes._request_calendar_events')
+def test_expired_entry_is_served_stale_and_refreshed_in_background(mock_request, mock_pool):
+    key = ("a@test.com", "2026-07-16")
+    calendar_routes._events_cache[key] = (calendar_routes._time.monotonic() - 1, [{"summary": "Old"}])
+
+    events = calendar_routes.fetch_calendar_events_for_date("2026-07-16", "a@test.com")
+
+    assert events == [{"summary": "Old"}]
+    mock_request.assert_not_called()
+    mock_pool.submit.assert_called_once()
+
+
+@patch('src.routes.calendar_routes._request_calendar_events')
+def test_local_miss_is_served_from_shared_cache(mock_request):
+    """Another worker's fetch in Redis is reused instead of calling Google."""
+    redis_client = MagicMock()
+    redis_client.pipeline.return_value.get.return_value.ttl.return_value.execute.return_value = [
+        b'[{"summary": "Shared"}]', 120]
+    calendar_routes._shared_redis = redis_client
+
+    events = calendar_routes.fetch_calendar_events_for_date("2026-07-17", "a@test.com")
+
+    assert events == [{"summary": "Shared"}]
+    mock_request.assert_not_called()
+    assert ("a@test.com", "2026-07-17") in calendar_routes._events_cache
+
+
+@patch('src.routes.calendar_routes._request_calendar_events')
+def test_fetched_events_are_written_to_shared_cache(mock_request):
+    mock_request.return_value = [{"summary": "Gym"}]
+    redis_client = MagicMock()
+    redis_client.pipeline.return_value.get.return_value.ttl.return_value.execute.return_value = [None, -2]
+    calendar_routes._shared_redis = redis_client
+
+    calendar_routes.fetch_calendar_events_for_date("2026-07-18", "a@test.com")
+
+    pipe = redis_client.pipeline.return_value
+    pipe.setex.assert_called_once_with(
+        "porter:calendar_events:a@test.com:2026-07-18", calendar_routes.CALENDAR_CACHE_TTL, '[{"summary":"Gym"}]')
+    pipe.sadd.assert_called_once_with(
+        "porter:calendar_events:days:a@test.com", "porter:calendar_events:a@test.com:2026-07-18")
+
+
+def test_invalidation_drops_only_that_users_days():
+    """An edit clears the editor's cached days (locally and in Redis) and nobody else's."""
+    redis_client = MagicMock()
+    redis_client.smembers.return_value = {b"porter:calendar_events:a@test.com:2026-07-18"}
+    calendar_routes._store_cached_events(("a@test.com", "2026-07-18"), [{"summary": "Gym"}])
+    calendar_routes._store_cached_events(("b@test.com", "2026-07-18"), [{"summary": "Run"}])
+    calendar_routes._shared_redis = redis_client
+
+    calendar_routes._invalidate_cached_events("a@test.com")
+
+    assert list(calendar_routes._events_cache) == [("b@test.com", "2026-07-18")]
+    redis_client.smembers.assert_called_once_with("porter:calendar_events:days:a@test.com")
+    redis_client.delete.assert_called_once_with(
+        "porter:calendar_events:days:a@test.com", b"porter:calendar_events:a@test.com:2026-07-18")
+    redis_client.scan_iter.assert_not_called()
+
+
+@patch('src.routes.calendar_routes._request_calendar_events')
+def test_refresh_started_before_an_edit_is_discarded(mock_request):
+    """A background refresh that overlaps an invalidation must not restore pre-edit events."""
+    key = ("a@test.com", "2026-07-19")
+
+    def fetch_then_edit(target_date_str, email):
+        calendar_routes._invalidate_cached_events(email)
+        return [{"summary": "Before edit"}]
+
+    mock_request.side_effect = fetch_then_edit
+    calendar_routes._refreshing.add(key)
+
+    calendar_routes._refresh_cached_events(key, "2026-07-19", "a@test.com")
+
+    assert key not in calendar_routes._events_cache
+    assert key not in calendar_routes._refreshing
+
+
+def test_shared_read_overlapping_an_edit_is_not_cached():
+    """Pre-edit events read from Redis just before an invalidation stay out of the local tier."""
+    key = ("a@test.com", "2026-07-20")
+    redis_client = MagicMock()
+
+    def read_then_edit():
+        calendar_routes._invalidate_cached_events("a@test.com")
+        return [b'[{"summary": "Before edit"}]', 120]
+
+    redis_client.pipeline.return_value.get.return_value.ttl.return_value.execute.side_effect = read_then_edit
+    calendar_routes._shared_redis = redis_client
+
+    assert calendar_routes._load_shared_events(key) is None
+    assert key not in calendar_routes._events_cache
+
+
+@patch('src.routes.calendar_routes._build_calendar_service')
+def test_fetch_for_dates_batches_only_uncached_days(mock_build):
+    """Cached days are served locally; the rest share a single batch request."""
+    calendar_routes._store_cached_events((None, "2026-07-13"), [{"summary": "Cached"}])
+
+    batch = MagicMock()
+    added = []
+    batch.add.side_effect = lambda req, request_id: added.append(request_id)
+    service = mock_build.return_value
+    service.new_batch_http_request.side_effect = lambda callback: (
+        setattr(batch.execute, "side_effect",
+                lambda: [callback(rid, {"items": [{"summary": rid}]}, None) for rid in added]) or batch
+    )
+
+    result = calendar_routes.fetch_calendar_events_for_dates(["2026-07-13", "2026-07-14", "2026-07-15"])
+
+    assert service.new_batch_http_request.call_count == 1
+    assert added == ["2026-07-14", "2026-07-15"]
+    assert result == {
+        "2026-07-13": [{"summary": "Cached"}],
+        "2026-07-14": [{"summary": "2026-07-14"}],
+        "2026-07-15": [{"summary": "2026-07-15"}],
+    }
+
+
+def test_parse_ymd_is_strict():
+    assert calendar_routes._parse_ymd("2024-02-29").isoformat() == "2024-02-29"
+    for bad in ["2026-02-30", "2026-7-14", "2026/07/14", "2026-W28-2", "+026-07-14"]:
+        with pytest.raises(ValueError):
+            calendar_routes._parse_ymd(bad)
+
+
+@patch('src.routes.calendar_routes.fetch_calendar_events_for_date')
+def test_get_calendar_events_revalidates_with_etag(mock_fetch, monkeypatch):
+    """A repeat request carrying the ETag gets an empty 304."""
+    monkeypatch.setenv("PORTER_ADMIN_KEY", "test-api-key")
+    from src.app import create_app
+
+    mock_fetch.return_value = [{"summary": "Standup", "start": {"dateTime": "2026-07-14T09:00:00Z"},
+                                "end": {"dateTime": "2026-07-14T09:15:00Z"}}]
+    client = create_app().test_client()
+    headers = {"Authorization": "Bearer test-api-key"}
+
+    first = client.get('/get_calendar_events?date=2026-07-14', headers=headers)
+    assert first.status_code == 200
+    assert first.headers['Cache-Control'] == "private, max-age=60"
+    assert "Authorization" in first.headers['Vary']
+    etag = first.headers['ETag']
+
+    second = client.get('/get_calendar_events?date=2026-07-14',
+                        headers={**headers, "If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.data == b""
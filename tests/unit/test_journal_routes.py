@@ -39,8 +39,8 @@ def test_save_log_uses_username(mock_env_get, mock_jwt_decode, mock_mongo_class,
     mock_mongo_instance.save_journal_entry.return_value = "dummy_mongo_id"
 
     # Also mock Neo4j logging to prevent errors since it's instantiated inside
-    with patch('src.routes.journal_routes.log_to_neo4j') as mock_neo4j:
-        mock_neo4j.return_value = True
+    with patch('src.routes.journal_routes.submit_log') as mock_neo4j:
+        mock_neo4j.return_value.result.return_value = "Successfully logged entry"
 
         payload = {
             "day": "2026-07-14",
@@ -107,3 +107,93 @@ def test_process_journal_uses_username(mock_env_get, mock_jwt_decode, mock_mongo
         args, kwargs = mock_mongo_instance.save_agent_reflection.call_args
         saved_data = args[0]
         assert saved_data.get("user_id") == "testuser"
+
+@patch('src.routes.journal_routes.SovereignMongoStorage')
+@patch('src.routes.auth_middleware.jwt.decode')
+@patch('src.routes.auth_middleware.os.environ.get')
+def test_process_journal_stream_emits_progress_then_done(mock_env_get, mock_jwt_decode, mock_mongo_class, client):
+    """
+    Test that POST /process_journal/stream sends one progress event per stage and a final done event.
+    """
+    mock_env_get.side_effect = lambda key, default="": "dummy_secret" if key == "JWT_SECRET" else default
+    mock_jwt_decode.return_value = {"email": "test@test.com", "role": "user", "account_type": "hero"}
+
+    mock_mongo_instance = MagicMock()
+    mock_mongo_class.return_value = mock_mongo_instance
+    mock_mongo_instance.get_user_by_email.return_value = {"username": "testuser", "email": "test@test.com"}
+    mock_mongo_instance.save_agent_reflection.return_value = "dummy_reflection_id"
+
+    stages = [("node", "setup_node"), ("node", "categorizer_node"), ("done", "Mocked reflection text")]
+    with patch('src.routes.journal_routes.stream_porter_reflection', return_value=iter(stages)):
+        response = client.post(
+            '/process_journal/stream',
+            data=json.dumps({"journal_entry": "This is a summary", "log_data": {"day": "monday"}}),
+            headers={"Content-Type": "application/json", "Authorization": "Bearer dummy_token"}
+        )
+        body = response.get_data(as_text=True)
+
+    assert response.status_code == 200
+    assert response.mimetype == 'text/event-stream'
+    assert body.count("event: progress") == 2
+    assert 'event: done\ndata: {"result":"Mocked reflection text","reflection_id":"dummy_reflection_id"}' in body
+    assert mock_mongo_instance.save_agent_reflection.call_args[0][0]["user_id"] == "testuser"
+
+def test_identical_reflections_share_one_run():
+    """
+    Test that a repeated identical submission reuses the first reflection instead of re-running the LLM.
+    """
+    from src.routes import journal_routes
+    journal_routes._recent_reflections.clear()
+
+    with patch('src.routes.journal_routes.run_porter_reflection', return_value="Shared reflection") as mock_run:
+        first = journal_routes._run_reflection_once("a@test.com", "Same entry", {"day": "monday"})
+        second = journal_routes._run_reflection_once("a@test.com", "Same entry", {"day": "monday"})
+        other = journal_routes._run_reflection_once("b@test.com", "Same entry", {"day": "monday"})
+
+    assert first == second == other == "Shared reflection"
+    assert mock_run.call_count == 2
+
+@patch('src.routes.journal_routes.SovereignMongoStorage')
+@patch('src.routes.auth_middleware.jwt.decode')
+@patch('src.routes.auth_middleware.os.environ.get')
+def test_process_journal_job_returns_202_then_result(mock_env_get, mock_jwt_decode, mock_mongo_class, client):
+    """
+    Test that POST /process_journal/jobs answers 202 immediately and the job can be polled for the saved reflection.
+    """
+    from src.routes import journal_routes
+    journal_routes._recent_reflections.clear()
+
+    mock_env_get.side_effect = lambda key, default="": "dummy_secret" if key == "JWT_SECRET" else default
+    mock_jwt_decode.return_value = {"email": "test@test.com", "role": "user", "account_type": "hero"}
+
+    mock_mongo_instance = MagicMock()
+    mock_mongo_class.return_value = mock_mongo_instance
+    mock_mongo_instance.get_user_by_email.return_value = {"username": "testuser", "email": "test@test.com"}
+    mock_mongo_instance.save_agent_reflection.return_value = "dummy_reflection_id"
+    headers = {"Content-Type": "application/json", "Authorization": "Bearer dummy_token"}
+
+    with patch('src.routes.journal_routes.run_porter_reflection', return_value="Job reflection"):
+        response = client.post(
+            '/process_journal/jobs',
+            data=json.dumps({"journal_entry": "Queued summary", "log_data": {"day": "2026-07-14"}}),
+            headers=headers
+        )
+        assert response.status_code == 202
+        job_id = response.get_json()["job_id"]
+        journal_routes._reflection_jobs[job_id][1].result(timeout=5)
+
+    status = client.get(f'/process_journal/jobs/{job_id}', headers=headers).get_json()
+    assert status == {"job_id": job_id, "status": "done", "result": "Job reflection", "reflection_id": "dummy_reflection_id"}
+
+    mock_jwt_decode.return_value = {"email": "other@test.com", "role": "user", "account_type": "hero"}
+    assert client.get(f'/process_journal/jobs/{job_id}', headers=headers).status_code == 404
+
+def test_day_name_to_date_passes_dates_through():
+    """The planner sends YYYY-MM-DD days; only weekday names are resolved against the current week."""
+    from datetime import date
+    from src.routes import journal_routes
+
+    assert journal_routes._day_name_to_date("2026-07-14") == "2026-07-14"
+    monday = date.fromisoformat(journal_routes._day_name_to_date("Monday"))
+    assert monday.weekday() == 0
+    assert journal_routes._day_name_to_date("someday") == monday.isoformat()
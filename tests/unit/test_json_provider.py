@@ -0,0 +1,50 @@
+import pytest
+from datetime import datetime
+from flask import Flask, jsonify, request
+
+pytest.importorskip("orjson")
+
+from src.utils.json_provider import ORJSONProvider, dumps, install_json_provider, loads
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    install_json_provider(app)
+
+    @app.route('/echo', methods=['POST'])
+    def echo():
+        return jsonify(request.get_json())
+
+    @app.route('/when')
+    def when():
+        return jsonify({"b": 1, "a": datetime(2026, 7, 14, 9, 30)})
+
+    return app
+
+
+def test_provider_installed(app):
+    assert isinstance(app.json, ORJSONProvider)
+
+
+def test_round_trip_matches_default_provider(app):
+    client = app.test_client()
+    payload = {"journal_entry": "Café session", "log_data": {"day": "monday", "brainFog": 3}}
+
+    response = client.post('/echo', json=payload)
+
+    assert response.status_code == 200
+    assert response.mimetype == 'application/json'
+    assert response.get_json() == payload
+
+
+def test_keys_sorted_and_datetimes_use_http_date(app):
+    body = app.test_client().get('/when').get_data(as_text=True)
+    assert body == '{"a":"Tue, 14 Jul 2026 09:30:00 GMT","b":1}\n'
+
+
+def test_module_dumps_is_compact_and_round_trips():
+    payload = {"result": "Café", "reflection_id": None}
+    text = dumps(payload)
+    assert text == '{"result":"Café","reflection_id":null}'
+    assert loads(text) == payload
@@ -0,0 +1,19 @@
+from unittest.mock import MagicMock, patch
+
+from src.database.mongo_storage import SovereignMongoStorage
+
+
+@patch('src.database.mongo_storage.MongoConnectionManager.get_client')
+def test_storage_instances_share_client_and_create_indexes_once(mock_get_client):
+    """Per-request SovereignMongoStorage instances reuse one MongoClient and skip repeat index builds."""
+    client = MagicMock()
+    mock_get_client.return_value = client
+    SovereignMongoStorage._indexes_ready = False
+
+    first = SovereignMongoStorage()
+    index_calls = client.__getitem__.return_value.__getitem__.return_value.create_index.call_count
+    second = SovereignMongoStorage()
+
+    assert first.client is second.client is client
+    assert index_calls > 0
+    assert client.__getitem__.return_value.__getitem__.return_value.create_index.call_count == index_calls
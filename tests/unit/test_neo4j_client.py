@@ -25,3 +25,25 @@ def test_write_operations_exist():
         assert callable(create_goal)
     except ImportError as e:
         pytest.fail(f"Failed to import write operations: {str(e)}")
+
+def test_submit_log_group_commits_queued_entries():
+    """Entries queued together share one execute_write call and one UNWIND query."""
+    from unittest.mock import MagicMock, patch
+    from src.database.neo4j_client import batch_writer
+
+    session = MagicMock()
+    session.execute_write.side_effect = lambda fn, items: fn(MagicMock(), items)
+    driver = MagicMock()
+    driver.session.return_value.__enter__.return_value = session
+
+    with patch.object(batch_writer, 'get_driver', return_value=driver), \
+         patch.object(batch_writer, '_create_log_entries', side_effect=lambda tx, entries: [{'activity': d['actual']} for d, _, _ in entries]):
+        items = [({'actual': f'a{i}'}, 'hero', None, batch_writer.Future()) for i in range(3)]
+        batch_writer._flush(items)
+
+    assert session.execute_write.call_count == 1
+    assert [item[3].result() for item in items] == [
+        "Successfully logged entry for 'a0'",
+        "Successfully logged entry for 'a1'",
+        "Successfully logged entry for 'a2'",
+    ]